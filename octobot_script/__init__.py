@@ -37,22 +37,61 @@ def _use_module_local_tentacles():
 # run this before any other code as only octobot_script module-local tentacles should be used
 _use_module_local_tentacles()
 
-try:
-    # import tentacles from octobot_script/imports directory after "_use_local_tentacles()" call
-    from tentacles.Meta.Keywords import *
-    # populate tentacles config helpers
-    import octobot_tentacles_manager.loaders as loaders
-    import octobot_script.internal.octobot_mocks as octobot_mocks
-    loaders.reload_tentacle_by_tentacle_class(
-        tentacles_path=octobot_mocks.get_imported_tentacles_path()
-    )
-    # do not expose those when importing this file
-    loaders = octobot_mocks = None
-
-except ImportError:
-    # tentacles not available during first install
-    pass
-
 from octobot_script.constants import *
-from octobot_script.api import *
-from octobot_script.model import *
+
+
+# tentacles keywords, api and model are only imported when first used: importing them takes seconds
+_LAZY_STATE = {"loaded": False, "loading": False}
+
+
+def load_tentacles():
+    """
+    Import tentacles keywords, api and model and expose them from this module. Does nothing when already loaded.
+    """
+    if _LAZY_STATE["loaded"] or _LAZY_STATE["loading"]:
+        return
+    _LAZY_STATE["loading"] = True
+    try:
+        try:
+            # import tentacles from octobot_script/imports directory after "_use_local_tentacles()" call
+            _expose_public_names("tentacles.Meta.Keywords")
+            # populate tentacles config helpers
+            import octobot_tentacles_manager.loaders as loaders
+            import octobot_script.internal.octobot_mocks as octobot_mocks
+            loaders.reload_tentacle_by_tentacle_class(
+                tentacles_path=octobot_mocks.get_imported_tentacles_path()
+            )
+        except ImportError:
+            # tentacles not available during first install
+            pass
+        _expose_public_names("octobot_script.api")
+        _expose_public_names("octobot_script.model")
+        _LAZY_STATE["loaded"] = True
+    finally:
+        _LAZY_STATE["loading"] = False
+
+
+def _expose_public_names(module_name):
+    # same as "from module_name import *"
+    import importlib
+    module = importlib.import_module(module_name)
+    public_names = getattr(module, "__all__", None) or [name for name in vars(module) if not name.startswith("_")]
+    globals().update({name: getattr(module, name) for name in public_names})
+
+
+def __getattr__(name):
+    # PEP 562: only called for attributes that are not yet defined
+    if name.startswith("__") and name != "__all__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    load_tentacles()
+    if name == "__all__":
+        return [global_name for global_name in globals() if not global_name.startswith("_")]
+    try:
+        return globals()[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__():
+    load_tentacles()
+    return sorted(globals())
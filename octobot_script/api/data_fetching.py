@@ -14,13 +14,19 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
 import datetime
+import functools
 
 import octobot_backtesting.api as backtesting_api
 import octobot_commons.symbols as commons_symbols
 import octobot_commons.enums as commons_enums
 import octobot_trading.enums as trading_enums
+import octobot_script.constants as constants
 import octobot_script.internal.octobot_mocks as octobot_mocks
+import octobot_script.internal.columnar_cache as columnar_cache
+import octobot_script.internal.data_files as data_files
+import octobot_script.internal.download_scheduler as download_scheduler
 
 
 def _validate_tentacles_source(tentacles_config, profile_id):
@@ -60,13 +66,14 @@ async def historical_data(
     end_timestamp=None,
     tentacles_config=None,
     profile_id=None,
+    incremental=True,
 ):
     _validate_tentacles_source(tentacles_config, profile_id)
-    symbols = [symbol]
-    time_frames = [commons_enums.TimeFrames(timeframe)]
+    symbols = _as_list(symbol)
+    time_frames = [commons_enums.TimeFrames(time_frame) for time_frame in _as_list(timeframe)]
     start_timestamp_ms = _ensure_ms_timestamp(start_timestamp)
     end_timestamp_ms = _resolve_end_timestamp_ms(end_timestamp)
-    existing_file = await backtesting_api.find_matching_data_file(
+    existing_file = await data_files.find_matching_data_file(
         exchange_name=exchange,
         symbols=symbols,
         time_frames=time_frames,
@@ -75,8 +82,62 @@ async def historical_data(
     )
     if existing_file:
         return existing_file
-    data_collector_instance = (
-        backtesting_api.exchange_historical_data_collector_factory(
+    covering_file = await data_files.find_covering_data_file(
+        exchange, symbols, time_frames, start_timestamp_ms, end_timestamp_ms
+    )
+    if covering_file:
+        # candles out of the requested time window are skipped by backtesting runs
+        return covering_file
+    extendable_file = (
+        await data_files.find_extendable_data_file(
+            exchange, symbols, time_frames, start_timestamp_ms, end_timestamp_ms
+        )
+        if incremental
+        else None
+    )
+    if extendable_file:
+        # only collect candles that are missing from the most recent similar data file
+        tail_file = await _collect_exchange_data(
+            exchange,
+            exchange_type,
+            symbols,
+            time_frames,
+            await data_files.get_data_file_end_timestamp_ms(extendable_file),
+            end_timestamp_ms,
+            tentacles_config,
+            profile_id,
+        )
+        return await data_files.extend_data_file(
+            extendable_file, tail_file, end_timestamp_ms
+        )
+    collected_file = await _collect_exchange_data(
+        exchange,
+        exchange_type,
+        symbols,
+        time_frames,
+        start_timestamp_ms,
+        end_timestamp_ms,
+        tentacles_config,
+        profile_id,
+    )
+    await data_files.register_data_file(collected_file)
+    return collected_file
+
+
+async def _collect_exchange_data(
+    exchange,
+    exchange_type,
+    symbols,
+    time_frames,
+    start_timestamp_ms,
+    end_timestamp_ms,
+    tentacles_config,
+    profile_id,
+):
+    return await download_scheduler.get_scheduler().run(
+        exchange,
+        functools.partial(
+            backtesting_api.exchange_historical_data_collector_factory,
             exchange,
             trading_enums.ExchangeTypes(exchange_type),
             octobot_mocks.get_tentacles_config(
@@ -86,10 +147,7 @@ async def historical_data(
             time_frames=time_frames,
             start_timestamp=start_timestamp_ms,
             end_timestamp=end_timestamp_ms,
-        )
-    )
-    return await backtesting_api.initialize_and_run_data_collector(
-        data_collector_instance
+        ),
     )
 
 
@@ -105,7 +163,7 @@ async def social_historical_data(
     _validate_tentacles_source(tentacles_config, profile_id)
     start_timestamp_ms = _ensure_ms_timestamp(start_timestamp)
     end_timestamp_ms = _resolve_end_timestamp_ms(end_timestamp)
-    existing_file = await backtesting_api.find_matching_data_file(
+    existing_file = await data_files.find_matching_data_file(
         services=services,
         symbols=symbols or [],
         start_timestamp=start_timestamp_ms,
@@ -113,22 +171,25 @@ async def social_historical_data(
     )
     if existing_file:
         return existing_file
-    data_collector_instance = backtesting_api.social_historical_data_collector_factory(
-        services=services,
-        tentacles_setup_config=octobot_mocks.get_tentacles_config(
-            tentacles_config, profile_id, activate_strategy_tentacles=False
+    collected_file = await download_scheduler.get_scheduler().run(
+        ",".join(services),
+        functools.partial(
+            backtesting_api.social_historical_data_collector_factory,
+            services=services,
+            tentacles_setup_config=octobot_mocks.get_tentacles_config(
+                tentacles_config, profile_id, activate_strategy_tentacles=False
+            ),
+            sources=sources,
+            symbols=[commons_symbols.parse_symbol(symbol) for symbol in symbols]
+            if symbols
+            else None,
+            start_timestamp=start_timestamp_ms,
+            end_timestamp=end_timestamp_ms,
+            config=octobot_mocks.get_config(),
         ),
-        sources=sources,
-        symbols=[commons_symbols.parse_symbol(symbol) for symbol in symbols]
-        if symbols
-        else None,
-        start_timestamp=start_timestamp_ms,
-        end_timestamp=end_timestamp_ms,
-        config=octobot_mocks.get_config(),
-    )
-    return await backtesting_api.initialize_and_run_data_collector(
-        data_collector_instance
     )
+    await data_files.register_data_file(collected_file)
+    return collected_file
 
 
 async def get_data(
@@ -145,58 +206,142 @@ async def get_data(
     social_symbols: list[str] | None = None,
     tentacles_config=None,
     profile_id=None,
+    columnar_cache_files=False,
+    max_concurrent_collections=constants.DEFAULT_MAX_CONCURRENT_COLLECTIONS,
 ):
     _validate_tentacles_source(tentacles_config, profile_id)
-    data_files = (
-        [data_file]
-        if data_file
-        else [
-            await historical_data(
-                symbol,
-                timeframe=time_frame,
-                exchange=exchange,
-                exchange_type=exchange_type,
-                start_timestamp=start_timestamp,
-                end_timestamp=end_timestamp,
-                tentacles_config=tentacles_config,
-                profile_id=profile_id,
-            )
-        ]
+    symbols = _as_list(symbol)
+    if (
+        social_data_files is None
+        and social_services is None
+        and (
+            profile_id is not None
+            or social_sources is not None
+            or tentacles_config is not None
+        )
+    ):
+        social_services = octobot_mocks.get_activated_social_services(
+            tentacles_config, profile_id, requested_sources=social_sources
+        )
+    # each symbol is collected into its own data file, concurrently with social data
+    exchange_collections = [
+        historical_data(
+            collected_symbol,
+            timeframe=time_frame,
+            exchange=exchange,
+            exchange_type=exchange_type,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            tentacles_config=tentacles_config,
+            profile_id=profile_id,
+        )
+        for collected_symbol in ([] if data_file else symbols)
+    ]
+    social_collections = [
+        social_historical_data(
+            [service],
+            sources=social_sources,
+            symbols=social_symbols,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            tentacles_config=tentacles_config,
+            profile_id=profile_id,
+        )
+        for service in social_services or []
+    ]
+    collected_files = await _gather_with_limit(
+        exchange_collections + social_collections, max_concurrent_collections
+    )
+    exchange_data_files = (
+        [data_file] if data_file else collected_files[:len(exchange_collections)]
     )
+    backtest_data_files = list(exchange_data_files)
+    if columnar_cache_files:
+        # candles of exchange data files will be memory-mapped from these files by backtesting runs
+        for exchange_data_file in exchange_data_files:
+            await columnar_cache.write_columns(exchange_data_file)
 
     if social_data_files is not None:
-        data_files.extend(social_data_files)
-    elif (
-        profile_id is not None
-        or social_sources is not None
-        or tentacles_config is not None
-    ):
-        social_services = (
-            social_services
-            if social_services is not None
-            else octobot_mocks.get_activated_social_services(
-                tentacles_config, profile_id, requested_sources=social_sources
-            )
-        )
-    if social_services:
-        for service in social_services:
-            data_files.append(
-                await social_historical_data(
-                    [service],
-                    sources=social_sources,
-                    symbols=social_symbols,
-                    start_timestamp=start_timestamp,
-                    end_timestamp=end_timestamp,
-                    tentacles_config=tentacles_config,
-                    profile_id=profile_id,
-                )
-            )
+        backtest_data_files.extend(social_data_files)
+    backtest_data_files.extend(collected_files[len(exchange_collections):])
 
+    config = octobot_mocks.get_config()
+    if data_file is None:
+        _set_requested_time_window(
+            config, exchange_data_files, start_timestamp, end_timestamp
+        )
     return await backtesting_api.create_and_init_backtest_data(
-        data_files,
-        octobot_mocks.get_config(),
+        backtest_data_files,
+        config,
         octobot_mocks.get_tentacles_config(
             tentacles_config, profile_id, activate_strategy_tentacles=False
         ),
         use_accurate_price_time_frame=True,
     )
+
+
+def configure_downloads(
+    collections_per_second=constants.DEFAULT_DOWNLOADS_PER_SECOND,
+    burst=constants.DEFAULT_DOWNLOADS_BURST,
+    budgets: dict | None = None,
+    max_retries=constants.DEFAULT_DOWNLOAD_MAX_RETRIES,
+    backoff_seconds=constants.DEFAULT_DOWNLOAD_BACKOFF_SECONDS,
+    progress_callback=None,
+):
+    """
+    Set the collections budget of each exchange and social service. It limits how many data collections
+    are started, requests made during each collection are throttled by its exchange connector or service feed.
+    :param collections_per_second: default number of collections to start per second on each exchange or service
+    :param burst: number of collections that can be started at once
+    :param budgets: collections_per_second by exchange or service name
+    :param max_retries: number of retries of a collection failing because of a rate limit
+    :param backoff_seconds: delay before the first retry, doubled at each retry
+    :param progress_callback: called with (exchange or service, current step, total steps, step percent)
+    during collections instead of logging progress
+    """
+    download_scheduler.set_scheduler(
+        download_scheduler.DownloadScheduler(
+            collections_per_second=collections_per_second,
+            burst=burst,
+            budgets=budgets,
+            max_retries=max_retries,
+            backoff_seconds=backoff_seconds,
+            progress_callback=progress_callback,
+        )
+    )
+
+
+def _set_requested_time_window(config, exchange_data_files, start_timestamp, end_timestamp):
+    for exchange_data_file in exchange_data_files:
+        time_window = data_files.get_time_window(
+            exchange_data_file,
+            _ensure_ms_timestamp(start_timestamp),
+            _resolve_end_timestamp_ms(end_timestamp),
+        )
+        if time_window is not None:
+            data_files.set_backtesting_time_window(config, *time_window)
+            return
+
+
+async def _gather_with_limit(coroutines, limit):
+    """
+    Run coroutines concurrently, at most limit at a time.
+    :return: the coroutines results, in the same order as coroutines
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _limited(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    tasks = [asyncio.create_task(_limited(coroutine)) for coroutine in coroutines]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def _as_list(value):
+    return list(value) if isinstance(value, (list, tuple)) else [value]
@@ -16,19 +16,49 @@
 
 import octobot_script.internal.logging_util as logging_util
 import octobot_script.internal.runners as runners
+import octobot_script.internal.pool_runners as pool_runners
 
 
 async def run(backtesting_data, strategy_config,
               enable_logs=False, enable_storage=True,
               strategy_func=None, initialize_func=None,
-              tentacles_config=None, profile_id=None):
+              tentacles_config=None, profile_id=None, signals=None, metrics_only=False,
+              stop_condition=None, max_drawdown=None):
+    """
+    :param metrics_only: when True, return a BacktestMetrics holding only the run scalar metrics instead of a
+    BacktestResult, to run large sweeps without keeping backtesting instances in memory.
+    Storage is disabled in this mode as such results can't be plotted.
+    :param stop_condition: optional (async) function of ctx, periodically called with the strategy:
+    the backtest is stopped and its result is marked as pruned as soon as it returns True.
+    :param max_drawdown: optional portfolio drawdown (in percent from its highest value) from which
+    the backtest is stopped and its result is marked as pruned.
+    """
     if tentacles_config is not None and profile_id is not None:
         raise ValueError("Only one of tentacles_config or profile_id can be provided.")
+    if strategy_func is not None and signals is not None:
+        raise ValueError("Only one of strategy_func or signals can be provided.")
     if enable_logs:
         logging_util.load_logging_config()
     return await runners.run(
         backtesting_data, strategy_config,
-        enable_logs=enable_logs, enable_storage=enable_storage,
+        enable_logs=enable_logs, enable_storage=enable_storage and not metrics_only,
         strategy_func=strategy_func, initialize_func=initialize_func,
         tentacles_config=tentacles_config, profile_id=profile_id,
+        signals=signals, metrics_only=metrics_only,
+        stop_condition=stop_condition, max_drawdown=max_drawdown,
     )
+
+
+async def run_many(backtesting_data, strategy_configs,
+                   strategy_func=None, initialize_func=None, workers=None,
+                   tentacles_config=None, profile_id=None, metrics_only=False,
+                   stop_condition=None, max_drawdown=None):
+    if tentacles_config is not None and profile_id is not None:
+        raise ValueError("Only one of tentacles_config or profile_id can be provided.")
+    async for backtest_result in pool_runners.run_many(
+        backtesting_data, strategy_configs,
+        strategy_func=strategy_func, initialize_func=initialize_func, workers=workers,
+        tentacles_config=tentacles_config, profile_id=profile_id, metrics_only=metrics_only,
+        stop_condition=stop_condition, max_drawdown=max_drawdown,
+    ):
+        yield backtest_result
@@ -0,0 +1,57 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+import functools
+
+import octobot_script.internal.optimizer as optimizer
+import octobot_script.internal.pool_runners as pool_runners
+
+
+async def optimize(backtesting_data, search_space, objective,
+                   strategy_func=None, initialize_func=None, strategy_config=None,
+                   method=optimizer.GRID, budget=None, workers=None, maximize=True, seed=None, cache=None,
+                   tentacles_config=None, profile_id=None, stop_condition=None, max_drawdown=None):
+    """
+    Search the best strategy config on backtesting_data by running backtests on a pool of worker processes.
+    :param search_space: dict of values by strategy config key: a list of values to pick from,
+    a (low, high) tuple for a range or a fixed value.
+    :param objective: BacktestMetrics attribute name (ex: "profitability") or function of BacktestMetrics to maximize
+    (minimized when maximize is False). Pruned runs are never selected.
+    :param method: "grid" (default, every combination), "random" or "tpe" (sequential model-based search),
+    budget is the maximum number of runs and is required with "random" and "tpe".
+    :param cache: dict to reuse results of configs already run by previous optimize calls on the same data files
+    with the same strategy_func, initialize_func, stop_condition, max_drawdown and profile_id.
+    :return: an OptimizationResult
+    """
+    if tentacles_config is not None and profile_id is not None:
+        raise ValueError("Only one of tentacles_config or profile_id can be provided.")
+    pool = pool_runners.WorkersPool(
+        backtesting_data,
+        strategy_func=strategy_func, initialize_func=initialize_func, workers=workers,
+        tentacles_config=tentacles_config, profile_id=profile_id,
+        stop_condition=stop_condition, max_drawdown=max_drawdown,
+    )
+    try:
+        return await optimizer.optimize(
+            functools.partial(pool.submit, metrics_only=True), search_space, objective,
+            method=method, budget=budget, workers=pool.workers, maximize=maximize,
+            strategy_config=strategy_config, seed=seed, cache=cache,
+            run_key=optimizer.get_run_key(
+                backtesting_data.data_files, strategy_func=strategy_func, initialize_func=initialize_func,
+                stop_condition=stop_condition, max_drawdown=max_drawdown, profile_id=profile_id,
+            ),
+        )
+    finally:
+        pool.shutdown()
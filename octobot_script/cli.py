@@ -17,29 +17,33 @@
 
 import click
 import asyncio
-import aiohttp
+import os
 import sys
 
 import octobot_script
-import octobot_script.internal.octobot_mocks as octobot_mocks
-import octobot_script.internal.logging_util as octobot_script_logging
-import octobot_tentacles_manager.api as api
+import octobot_script.constants as constants
 
 
-async def install_all_tentacles(quite_mode) -> bool:
+async def install_all_tentacles(quite_mode, tentacles_archives=None, from_cache=False) -> bool:
+    # lazy imports: only load the OctoBot stack when required by the command
+    import octobot_script.internal.octobot_mocks as octobot_mocks
+    import octobot_script.internal.logging_util as octobot_script_logging
+    import octobot_script.internal.tentacles_installer as tentacles_installer
+
     octobot_script_logging.enable_base_logger()
-    error_count = 0
     install_path = octobot_mocks.get_module_appdir_path()
-    tentacles_path = octobot_mocks.get_tentacles_path()
-    tentacles_urls = octobot_mocks.get_public_tentacles_urls()
-    async with aiohttp.ClientSession() as aiohttp_session:
-        for tentacles_url in tentacles_urls:
-            error_count += await api.install_all_tentacles(tentacles_url,
-                                                           tentacle_path=tentacles_path,
-                                                           bot_path=install_path,
-                                                           aiohttp_session=aiohttp_session,
-                                                           quite_mode=quite_mode,
-                                                           bot_install_dir=install_path)
+    try:
+        error_count = await tentacles_installer.install_archives(
+            tentacles_archives or octobot_mocks.get_public_tentacles_urls(),
+            octobot_mocks.get_tentacles_path(),
+            install_path,
+            quite_mode=quite_mode,
+            cache_path=os.path.join(install_path, constants.TENTACLES_CACHE_PATH),
+            from_cache=from_cache
+        )
+    finally:
+        # even partial installations can update tentacles configurations
+        octobot_mocks.clear_cache()
     return error_count == 0
 
 
@@ -53,11 +57,49 @@ def main():
 
 @main.command("install_tentacles")
 @click.option('--quite', flag_value=True, help='Only display errors in logs.')
-def sync_install_tentacles(quite):
+@click.option('--local-archive', multiple=True,
+              help='Local (or file://) tentacles archive to install instead of downloading the public ones. '
+                   'Can be repeated.')
+@click.option('--from-cache', flag_value=True,
+              help='Use the previously downloaded tentacles archives when their content hash matches '
+                   'instead of downloading them again.')
+def sync_install_tentacles(quite, local_archive, from_cache):
     """
     (Re)-install the available OctoBot tentacles.
     """
-    sys.exit(0 if asyncio.run(install_all_tentacles(quite)) else -1)
+    sys.exit(0 if asyncio.run(install_all_tentacles(
+        quite, tentacles_archives=list(local_archive), from_cache=from_cache
+    )) else -1)
+
+
+@main.command("bench_startup")
+@click.option('--top', default=15, show_default=True, help='Number of slowest packages to display.')
+@click.option('--data-file', default=None,
+              help='Local data file to also measure the first get_data and run calls on.')
+@click.option('--symbol', default="BTC/USDT", show_default=True, help='Symbol of the data file.')
+@click.option('--time-frame', default="1d", show_default=True, help='Time frame of the data file.')
+def bench_startup(top, data_file, symbol, time_frame):
+    """
+    Measure the OctoBot-Script startup time.
+    """
+    import octobot_script.internal.startup_profiler as startup_profiler
+
+    click.echo(
+        f"import octobot_script: "
+        f"{startup_profiler.get_total_import_time(startup_profiler.profile_imports(), 'octobot_script'):.3f}s"
+    )
+    # octobot_script content is lazily imported
+    import_times = startup_profiler.profile_imports(
+        f"{startup_profiler.IMPORT_STATEMENT}; octobot_script.load_tentacles()"
+    )
+    total_import_time = sum(self_time for _, self_time, _ in import_times)
+    click.echo(f"import octobot_script content: {total_import_time:.3f}s")
+    click.echo("slowest packages to import:")
+    for package, import_time in list(startup_profiler.get_import_time_by_package(import_times).items())[:top]:
+        click.echo(f"  {package:<40} {import_time:.3f}s ({import_time / total_import_time:.0%})")
+    if data_file is not None:
+        for step, elapsed_time in startup_profiler.measure_first_calls(symbol, time_frame, data_file).items():
+            click.echo(f"{step}: {elapsed_time:.3f}s after startup")
 
 
 if __name__ == "__main__":
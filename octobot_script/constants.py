@@ -17,3 +17,23 @@
 
 ADDITIONAL_IMPORT_PATH = "imports"
 CONFIG_PATH = "config"
+
+CONFIG_BACKTESTING_START_TIMESTAMP = "start-timestamp"
+CONFIG_BACKTESTING_END_TIMESTAMP = "end-timestamp"
+
+DEFAULT_MAX_CONCURRENT_COLLECTIONS = 5
+DEFAULT_DOWNLOADS_PER_SECOND = 1
+DEFAULT_DOWNLOADS_BURST = 5
+DEFAULT_DOWNLOAD_MAX_RETRIES = 3
+DEFAULT_DOWNLOAD_BACKOFF_SECONDS = 5
+DEFAULT_DOWNLOAD_PROGRESS_INTERVAL = 10
+
+DEFAULT_TENTACLES_DOWNLOAD_CONNECTIONS = 4
+TENTACLES_CACHE_PATH = "tentacles_cache"
+DEFAULT_TENTACLES_CACHE_MAX_SIZE = 512 * 1024 * 1024
+
+DEFAULT_STOP_CONDITION_CHECK_INTERVAL = 10
+
+DEFAULT_TPE_STARTUP_TRIALS = 10
+DEFAULT_TPE_GAMMA = 0.25
+DEFAULT_TPE_CANDIDATES = 24
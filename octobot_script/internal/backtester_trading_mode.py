@@ -18,16 +18,43 @@
 import octobot_trading.api  # pylint: disable=unused-import
 import octobot_trading.modes as modes
 import octobot_trading.enums as trading_enums
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+
+
+# (script, strategy config) of each running backtest, by bot id
+_SCRIPT_BY_BOT_ID = {}
+
+
+def register_script(bot_id, script_func, strategy_config):
+    _SCRIPT_BY_BOT_ID[bot_id] = (script_func, strategy_config)
+
+
+def unregister_script(bot_id):
+    _SCRIPT_BY_BOT_ID.pop(bot_id, None)
 
 
 class BacktesterTradingMode(modes.AbstractScriptedTradingMode):
 
     def __init__(self, config, exchange_manager):
         super().__init__(config, exchange_manager)
+        self._strategy_config = {}
         self._import_scripts()
 
     def _import_scripts(self):
-        pass
+        # scripts are bound to their backtest: concurrent runs each use their own script and config
+        script_func, strategy_config = _SCRIPT_BY_BOT_ID.get(self.exchange_manager.bot_id, (None, {}))
+        self._live_script = script_func
+        self._strategy_config = strategy_config
+
+    async def reload_config(self, *args, **kwargs):
+        await super().reload_config(*args, **kwargs)
+        updated_config = {
+            commons_constants.CONFIG_ACTIVATION_TOPICS.replace(" ", "_"):
+                commons_enums.ActivationTopics.FULL_CANDLES.value
+        }
+        updated_config.update(self._strategy_config)
+        self.trading_config.update(updated_config)
 
     @classmethod
     def get_supported_exchange_types(cls) -> list:
@@ -0,0 +1,154 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import copy
+import weakref
+
+import octobot_script.internal.columnar_cache as columnar_cache
+
+
+CANDLES_ARRAYS = (
+    "close_candles",
+    "open_candles",
+    "high_candles",
+    "low_candles",
+    "time_candles",
+    "volume_candles",
+)
+# pinned candles managers loading tasks by shared BacktestData, released with it
+_PINNED_CANDLES_MANAGERS = weakref.WeakKeyDictionary()
+
+
+class RunBacktestData:
+    """
+    Per-run view of a BacktestData.
+    Preloaded candles are loaded once by the shared BacktestData and pinned as read-only arrays.
+    Each run gets its own candles managers on top of those arrays and its own copy of the data files
+    importers, sharing their databases and cached data but not their chronological read indexes:
+    runs on the same BacktestData can therefore run concurrently, and every run after the first one
+    skips candles loading.
+    When the data file has columnar cache files, candles are memory-mapped from them instead of being
+    read from the data file database.
+    """
+
+    def __init__(self, backtesting_data):
+        self.backtesting_data = backtesting_data
+        self._importers_by_data_file = None
+
+    def __getattr__(self, name):
+        if name == "backtesting_data":
+            # not yet initialized (ex: during copy)
+            raise AttributeError(name)
+        return getattr(self.backtesting_data, name)
+
+    @property
+    def importers_by_data_file(self):
+        if self._importers_by_data_file is None:
+            self._importers_by_data_file = {
+                data_file: get_run_importer(importer)
+                for data_file, importer in self.backtesting_data.importers_by_data_file.items()
+            }
+        return self._importers_by_data_file
+
+    def reset_cached_indexes(self):
+        # only reset this run indexes: other runs might be reading the same data files
+        for importer in self.importers_by_data_file.values():
+            importer.reset_cache()
+
+    async def get_preloaded_candles_manager(self, exchange, symbol, time_frame, start_timestamp, end_timestamp):
+        candles_managers = _PINNED_CANDLES_MANAGERS.setdefault(self.backtesting_data, {})
+        key = (exchange, symbol, time_frame, start_timestamp, end_timestamp)
+        if key not in candles_managers or _has_failed(candles_managers[key]):
+            # concurrent runs wait for the same candles to be loaded instead of loading them again
+            candles_managers[key] = asyncio.ensure_future(self._load_pinned_candles_manager(*key))
+        # a cancelled run should not cancel the loading other runs are waiting for
+        pinned_candles_manager = await asyncio.shield(candles_managers[key])
+        if pinned_candles_manager is None:
+            return None
+        return get_run_candles_manager(pinned_candles_manager)
+
+    async def _load_pinned_candles_manager(self, exchange, symbol, time_frame, start_timestamp, end_timestamp):
+        pinned_candles_manager = await self._get_columnar_candles_manager(
+            exchange, symbol, time_frame, start_timestamp, end_timestamp
+        )
+        if pinned_candles_manager is None:
+            pinned_candles_manager = await self.backtesting_data.get_preloaded_candles_manager(
+                exchange, symbol, time_frame, start_timestamp, end_timestamp
+            )
+        if pinned_candles_manager is not None:
+            pin_candles_manager(pinned_candles_manager)
+        return pinned_candles_manager
+
+    async def _get_columnar_candles_manager(self, exchange, symbol, time_frame, start_timestamp, end_timestamp):
+        for data_file in self.backtesting_data.data_files:
+            # only the data file holding this exchange, symbol and time frame has columns for it
+            columns = columnar_cache.load_columns(
+                data_file, exchange, symbol, time_frame, start_timestamp, end_timestamp
+            )
+            if columns is not None:
+                return await create_candles_manager(columns)
+        return None
+
+
+async def create_candles_manager(columns):
+    import octobot_trading.exchange_data as trading_exchange_data
+    candles_manager = trading_exchange_data.PreloadedCandlesManager()
+    await candles_manager.initialize()
+    for candles_array in CANDLES_ARRAYS:
+        # ex: "close_candles" is loaded from the "close" column
+        setattr(candles_manager, candles_array, columns[candles_array.split("_")[0]])
+    candles_manager.candles_initialized = True
+    return candles_manager
+
+
+def pin_candles_manager(candles_manager):
+    for candles_array in CANDLES_ARRAYS:
+        getattr(candles_manager, candles_array).flags.writeable = False
+
+
+def _has_failed(task):
+    return task.done() and (task.cancelled() or task.exception() is not None)
+
+
+def get_run_importer(importer):
+    """
+    :return: a copy of importer sharing its database and cached data with its own chronological read indexes
+    """
+    run_importer = copy.copy(importer)
+    run_importer.chronological_cache = copy.copy(importer.chronological_cache)
+    run_importer.chronological_cache.timestamped_sorted_data = _copy_cached_indexes(
+        importer.chronological_cache.timestamped_sorted_data, importer.chronological_cache.CHRONO_INDEX_KEY
+    )
+    return run_importer
+
+
+def _copy_cached_indexes(cached_data, chrono_index_key):
+    # cached values lists are shared: they are only read once cached
+    if chrono_index_key in cached_data:
+        return {**cached_data, chrono_index_key: 0}
+    return {
+        key: _copy_cached_indexes(value, chrono_index_key) if isinstance(value, dict) else value
+        for key, value in cached_data.items()
+    }
+
+
+def get_run_candles_manager(pinned_candles_manager):
+    # shallow copy: candles arrays are shared, indexes are reset for this run
+    run_candles_manager = copy.copy(pinned_candles_manager)
+    for candles_array in CANDLES_ARRAYS:
+        setattr(run_candles_manager, f"{candles_array}_index", 0)
+    return run_candles_manager
@@ -0,0 +1,211 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+import math
+import os
+
+import numpy as np
+
+import octobot_script.internal.chart_series as chart_series
+
+
+# chart elements with more points are sent with levels of detail
+DEFAULT_MAX_POINTS = 5000
+# maximum points of a visible range request
+MAX_REQUESTED_POINTS = 20000
+# each level has LEVEL_FACTOR times less points than the previous one
+LEVEL_FACTOR = 8
+CANDLE_KEYS = ("x", "open", "high", "low", "close")
+LINE_KEYS = ("x", "y")
+# per point attributes that can't be downsampled
+POINT_ATTRIBUTES = ("text", "color", "size", "symbol")
+LEVELS_KEY_SEPARATOR = ":"
+TEMP_FILE_SUFFIX = ".part"
+
+
+def aggregate_ohlc(level, factor) -> dict:
+    """
+    :return: the given candles level ({"x", "open", "high", "low", "close"[, "volume"]} arrays) where each
+    factor candles are aggregated into one
+    """
+    starts = np.arange(0, len(level["x"]), factor)
+    ends = np.append(starts[1:], len(level["x"])) - 1
+    aggregated = {
+        "x": level["x"][starts],
+        "open": level["open"][starts],
+        "high": np.fmax.reduceat(level["high"], starts),
+        "low": np.fmin.reduceat(level["low"], starts),
+        "close": level["close"][ends],
+    }
+    if "volume" in level:
+        aggregated["volume"] = np.add.reduceat(np.nan_to_num(level["volume"]), starts)
+    return aggregated
+
+
+def lttb(x, y, threshold) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling
+    :return: the indexes of the at most threshold points of (x, y) keeping the shape of the line
+    """
+    size = len(x)
+    threshold = max(threshold, 3)
+    if threshold >= size:
+        return np.arange(size)
+    xs = x.tolist()
+    ys = y.tolist()
+    # bucket averages are computed from cumulated sums
+    x_sums = np.concatenate(([0], np.cumsum(x))).tolist()
+    y_sums = np.concatenate(([0], np.cumsum(y))).tolist()
+    bucket_size = (size - 2) / (threshold - 2)
+    indexes = [0]
+    selected = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, size)
+        count = next_end - end
+        average_x = (x_sums[next_end] - x_sums[end]) / count
+        average_y = (y_sums[next_end] - y_sums[end]) / count
+        selected_x = xs[selected]
+        selected_y = ys[selected]
+        max_area = -1
+        for index in range(start, end):
+            area = abs(
+                (selected_x - average_x) * (ys[index] - selected_y)
+                - (selected_x - xs[index]) * (average_y - selected_y)
+            )
+            if area > max_area:
+                max_area = area
+                best = index
+        indexes.append(best)
+        selected = best
+    indexes.append(size - 1)
+    return np.array(indexes)
+
+
+def get_levels(element, max_points=DEFAULT_MAX_POINTS, level_factor=LEVEL_FACTOR):
+    """
+    :return: the {factor: {key: array}} levels of detail of the given chart element, from full resolution
+    (factor 1) to the first level holding at most max_points points. Candles are aggregated and lines are
+    downsampled using LTTB. None when the element is small enough or can't be downsampled
+    """
+    x_values = element.get("x")
+    if (
+        not chart_series.is_numeric_series(x_values)
+        or len(x_values) <= max_points
+        or "markers" in (element.get("mode") or "")
+        or any(isinstance(element.get(key), list) for key in POINT_ATTRIBUTES)
+    ):
+        return None
+    keys = CANDLE_KEYS if all(element.get(key) is not None for key in CANDLE_KEYS[1:]) else LINE_KEYS
+    if isinstance(element.get("volume"), list) and keys is CANDLE_KEYS:
+        keys = CANDLE_KEYS + ("volume", )
+    level = {}
+    for key in keys:
+        values = element.get(key)
+        if not chart_series.is_numeric_series(values) or len(values) != len(x_values):
+            return None
+        level[key] = np.asarray(values, dtype=np.float64)
+    if not np.all(np.diff(level["x"]) >= 0):
+        # unsorted or missing times
+        return None
+    factor = 1
+    levels = {factor: level}
+    while len(level["x"]) > max_points:
+        factor *= level_factor
+        if keys is LINE_KEYS:
+            finite_level = {key: values[np.isfinite(level["y"])] for key, values in level.items()}
+            indexes = lttb(
+                finite_level["x"], finite_level["y"], math.ceil(len(level["x"]) / level_factor)
+            )
+            level = {key: values[indexes] for key, values in finite_level.items()}
+        else:
+            level = aggregate_ohlc(level, level_factor)
+        levels[factor] = level
+    return levels
+
+
+def set_levels_of_detail(full_data, max_points=DEFAULT_MAX_POINTS, level_factor=LEVEL_FACTOR) -> dict:
+    """
+    Replaces the series of every chart element of the given display translator json representation having
+    more than max_points points by their coarsest level of detail and adds a "lod" description of the
+    element levels. full_data is updated in place.
+    :return: the {element id: levels} levels of detail of the updated elements
+    """
+    levels_by_element = {}
+    for element in chart_series.iter_chart_elements(full_data):
+        levels = get_levels(element, max_points=max_points, level_factor=level_factor)
+        if levels is None:
+            continue
+        element_id = str(len(levels_by_element))
+        levels_by_element[element_id] = levels
+        factors = sorted(levels)
+        for key, values in levels[factors[-1]].items():
+            element[key] = [None if math.isnan(value) else value for value in values.tolist()]
+        element["lod"] = {
+            "id": element_id,
+            "levels": factors,
+            "length": len(levels[1]["x"]),
+            "max_points": max_points,
+        }
+    return levels_by_element
+
+
+def write_levels(file_path, levels_by_element) -> str:
+    """
+    Writes the given levels of detail as a numpy .npz file. The file is replaced at once: hardlinks to its
+    previous version keep their content.
+    :return: the written file path
+    """
+    temp_file_path = f"{file_path}{TEMP_FILE_SUFFIX}"
+    with open(temp_file_path, "wb") as levels_file:
+        np.savez(levels_file, **{
+            LEVELS_KEY_SEPARATOR.join((element_id, str(factor), key)): values
+            for element_id, levels in levels_by_element.items()
+            for factor, level in levels.items()
+            for key, values in level.items()
+        })
+    os.replace(temp_file_path, file_path)
+    return file_path
+
+
+def get_visible_range(file_path, element_id, start, end, max_points=DEFAULT_MAX_POINTS):
+    """
+    :return: the (factor, {key: array}) points of the most detailed level of the given element holding at
+    most max_points points between start and end (with the surrounding points), None when the element has
+    no levels of detail
+    """
+    with np.load(file_path) as levels_file:
+        keys_by_factor = {}
+        for name in levels_file.files:
+            name_element_id, factor, key = name.split(LEVELS_KEY_SEPARATOR)
+            if name_element_id == element_id:
+                keys_by_factor.setdefault(int(factor), []).append(key)
+        if not keys_by_factor:
+            return None
+        selected = None
+        # from the coarsest level to the most detailed one
+        for factor in sorted(keys_by_factor, reverse=True):
+            x_values = levels_file[LEVELS_KEY_SEPARATOR.join((element_id, str(factor), "x"))]
+            from_index = max(int(np.searchsorted(x_values, start, side="left")) - 1, 0)
+            to_index = min(int(np.searchsorted(x_values, end, side="right")) + 1, len(x_values))
+            if selected is not None and to_index - from_index > max_points:
+                break
+            selected = factor, from_index, to_index
+        factor, from_index, to_index = selected
+        return factor, {
+            key: levels_file[LEVELS_KEY_SEPARATOR.join((element_id, str(factor), key))][from_index:to_index]
+            for key in keys_by_factor[factor]
+        }
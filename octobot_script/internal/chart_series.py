@@ -0,0 +1,119 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+import base64
+
+import numpy as np
+
+
+BASE64 = "base64"
+SERIES_DTYPE = "float64"
+CHART_ELEMENT_TYPE = "chart"
+# ChartElement numeric series, see resources/report/src/types.ts
+SERIES_KEYS = ("x", "y", "open", "high", "low", "close", "volume")
+
+
+def encode_series(values):
+    """
+    :return: a {"encoding": "base64", "dtype": "float64", "length": len, "data": base64 data} dict holding
+    values as little endian float64 (None values are NaN) or None when values is not a list of numbers
+    """
+    if not is_numeric_series(values):
+        return None
+    return encode_array(values)
+
+
+def is_numeric_series(values) -> bool:
+    """
+    :return: True when values is a list of numbers and None values
+    """
+    return isinstance(values, list) and all(
+        value is None or (isinstance(value, (int, float)) and not isinstance(value, bool))
+        for value in values
+    )
+
+
+def encode_array(values):
+    """
+    :return: the encode_series representation of the given numbers (array or list)
+    """
+    array = np.asarray(values, dtype="<f8")
+    return {
+        "encoding": BASE64,
+        "dtype": SERIES_DTYPE,
+        "length": len(array),
+        "data": base64.b64encode(array.tobytes()).decode(),
+    }
+
+
+def decode_series(encoded_series) -> np.ndarray:
+    """
+    :return: the float64 array of a series encoded with encode_series
+    """
+    if encoded_series.get("encoding") != BASE64 or encoded_series.get("dtype") != SERIES_DTYPE:
+        raise ValueError(f"Unsupported series encoding: {encoded_series.get('encoding')} "
+                         f"{encoded_series.get('dtype')}")
+    return np.frombuffer(base64.b64decode(encoded_series["data"]), dtype="<f8")
+
+
+def is_encoded_series(value) -> bool:
+    return isinstance(value, dict) and value.get("encoding") == BASE64
+
+
+def encode_chart_series(full_data) -> dict:
+    """
+    Replaces numeric series of every chart element of the given display translator json representation
+    by their encode_series representation. full_data is updated in place.
+    :return: full_data
+    """
+    for element in iter_chart_elements(full_data):
+        for key in SERIES_KEYS:
+            encoded_series = encode_series(element.get(key))
+            if encoded_series is not None:
+                element[key] = encoded_series
+    return full_data
+
+
+def decode_chart_series(full_data) -> dict:
+    """
+    Reverts encode_chart_series: encoded series are replaced by lists of numbers (NaN values are None).
+    full_data is updated in place.
+    :return: full_data
+    """
+    for element in iter_chart_elements(full_data):
+        for key in SERIES_KEYS:
+            if is_encoded_series(element.get(key)):
+                element[key] = [
+                    None if np.isnan(value) else value
+                    for value in decode_series(element[key]).tolist()
+                ]
+    return full_data
+
+
+def iter_chart_elements(node):
+    """
+    yields the chart elements of the given display translator json representation
+    """
+    if not isinstance(node, dict):
+        return
+    data = node.get("data")
+    if not isinstance(data, dict):
+        return
+    if node.get("type") == CHART_ELEMENT_TYPE:
+        for element in data.get("elements") or []:
+            if isinstance(element, dict):
+                yield element
+    for sub_element in data.get("sub_elements") or []:
+        yield from iter_chart_elements(sub_element)
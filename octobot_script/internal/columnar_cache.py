@@ -0,0 +1,148 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+
+import numpy as np
+
+import octobot_backtesting.api as backtesting_api
+import octobot_backtesting.constants as backtesting_constants
+import octobot_backtesting.enums as backtesting_enums
+import octobot_commons.enums as commons_enums
+import octobot_commons.logging as logging
+
+
+COLUMNS_DIR_SUFFIX = ".columns"
+MANIFEST_FILE = "manifest.json"
+COLUMNS = (
+    ("time", commons_enums.PriceIndexes.IND_PRICE_TIME.value),
+    ("open", commons_enums.PriceIndexes.IND_PRICE_OPEN.value),
+    ("high", commons_enums.PriceIndexes.IND_PRICE_HIGH.value),
+    ("low", commons_enums.PriceIndexes.IND_PRICE_LOW.value),
+    ("close", commons_enums.PriceIndexes.IND_PRICE_CLOSE.value),
+    ("volume", commons_enums.PriceIndexes.IND_PRICE_VOL.value),
+)
+LOGGER = logging.get_logger("ColumnarCache")
+
+
+def get_data_file_path(data_file):
+    # same resolution as backtesting importers
+    if os.path.isfile(data_file):
+        return data_file
+    return os.path.join(backtesting_constants.BACKTESTING_FILE_PATH, data_file)
+
+
+def get_columns_dir(data_file):
+    return get_data_file_path(data_file) + COLUMNS_DIR_SUFFIX
+
+
+def has_columns(data_file) -> bool:
+    return _load_manifest(data_file) is not None
+
+
+async def write_columns(data_file) -> bool:
+    """
+    Write the OHLCV candles of the given exchange data file as one .npy file per column,
+    symbol and time frame. Does nothing when up-to-date columns already exist.
+    :return: True when columns are available
+    """
+    if has_columns(data_file):
+        return True
+    data_file_path = get_data_file_path(data_file)
+    try:
+        description = await backtesting_api.get_file_description(data_file_path, data_path="")
+    except Exception as err:
+        LOGGER.debug(f"Can't read {data_file} description: {err}")
+        description = None
+    if not description or not description.get(backtesting_enums.DataFormatKeys.EXCHANGE.value):
+        # not an exchange data file
+        return False
+    exchange = description[backtesting_enums.DataFormatKeys.EXCHANGE.value]
+    columns_dir = get_columns_dir(data_file)
+    series = {}
+    for symbol in description[backtesting_enums.DataFormatKeys.SYMBOLS.value]:
+        for time_frame in description[backtesting_enums.DataFormatKeys.TIME_FRAMES.value]:
+            time_frame = commons_enums.TimeFrames(time_frame)
+            candles = np.array(
+                await backtesting_api.get_all_ohlcvs(data_file_path, exchange, symbol, time_frame),
+                dtype=np.float64
+            ).reshape(-1, len(COLUMNS))
+            series_dir = str(len(series))
+            os.makedirs(os.path.join(columns_dir, series_dir), exist_ok=True)
+            for column, index in COLUMNS:
+                np.save(os.path.join(columns_dir, series_dir, f"{column}.npy"), candles[:, index])
+            series[_get_series_key(exchange, symbol, time_frame)] = series_dir
+    # manifest is written last: columns are only used once they are complete
+    temp_manifest_path = os.path.join(columns_dir, f"{MANIFEST_FILE}.part")
+    with open(temp_manifest_path, "w") as manifest_file:
+        json.dump({"source": _get_source_signature(data_file_path), "series": series}, manifest_file)
+    os.replace(temp_manifest_path, os.path.join(columns_dir, MANIFEST_FILE))
+    return True
+
+
+def load_columns(data_file, exchange, symbol, time_frame, start_timestamp, end_timestamp):
+    """
+    :return: a dict of memory-mapped read-only arrays by column name, restricted to the candles the
+    backtesting would read from the data file between start_timestamp and end_timestamp.
+    None when no up-to-date columns are available.
+    """
+    manifest = _load_manifest(data_file)
+    if manifest is None:
+        return None
+    time_frame = commons_enums.TimeFrames(time_frame)
+    series_dir = manifest["series"].get(_get_series_key(exchange, symbol, time_frame))
+    if series_dir is None:
+        return None
+    series_path = os.path.join(get_columns_dir(data_file), series_dir)
+    columns = {
+        column: np.load(os.path.join(series_path, f"{column}.npy"), mmap_mode="r")
+        for column, _ in COLUMNS
+    }
+    # candles are stored in database by close time and filtered on their open time by end_timestamp
+    times = columns["time"]
+    time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * 60
+    first_index = np.searchsorted(times, start_timestamp - time_frame_seconds, side="left")
+    last_index = np.searchsorted(times, end_timestamp, side="right")
+    return {
+        column: values[first_index:last_index]
+        for column, values in columns.items()
+    }
+
+
+def _load_manifest(data_file):
+    manifest_path = os.path.join(get_columns_dir(data_file), MANIFEST_FILE)
+    try:
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("source") != _get_source_signature(get_data_file_path(data_file)):
+        # data file changed since columns were written
+        return None
+    return manifest
+
+
+def _get_source_signature(data_file_path):
+    try:
+        stat = os.stat(data_file_path)
+    except OSError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _get_series_key(exchange, symbol, time_frame):
+    return f"{exchange}|{symbol}|{time_frame.value}"
@@ -0,0 +1,222 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import os
+import shutil
+import sqlite3
+import time
+
+import octobot_backtesting.api as backtesting_api
+import octobot_backtesting.constants as backtesting_constants
+import octobot_backtesting.enums as backtesting_enums
+
+import octobot_script.constants as constants
+import octobot_script.internal.columnar_cache as columnar_cache
+import octobot_script.internal.data_files_index as data_files_index
+
+
+# data files index by data path
+_INDEXES = {}
+
+
+def get_index(data_path=backtesting_constants.BACKTESTING_FILE_PATH) -> data_files_index.DataFilesIndex:
+    try:
+        return _INDEXES[data_path]
+    except KeyError:
+        _INDEXES[data_path] = data_files_index.DataFilesIndex(data_path)
+        return _INDEXES[data_path]
+
+
+async def register_data_file(data_file, data_path=backtesting_constants.BACKTESTING_FILE_PATH):
+    await get_index(data_path).register(data_file)
+
+
+async def find_matching_data_file(exchange_name=None, symbols=None, time_frames=None, services=None,
+                                  start_timestamp=None, end_timestamp=None,
+                                  data_path=backtesting_constants.BACKTESTING_FILE_PATH):
+    """
+    Looks data files up from the data folder index instead of reading every data file description.
+    :return: the most recent exchange_name data file (social data file of services when exchange_name is None)
+    with exactly symbols and time_frames (or services) from start_timestamp to end_timestamp (in milliseconds),
+    or None
+    """
+    index = get_index(data_path)
+    await index.sync()
+    descriptions = await index.select(
+        exchange_name,
+        "start_timestamp = ? AND end_timestamp = ?",
+        (_to_description_timestamp(start_timestamp), _to_description_timestamp(end_timestamp)),
+        "file_name DESC",
+    )
+    time_frames = {time_frame.value for time_frame in time_frames or []}
+    for data_file, description in descriptions.items():
+        if set(description[backtesting_enums.DataFormatKeys.SYMBOLS.value]) == set(symbols or []) \
+                and set(description[backtesting_enums.DataFormatKeys.TIME_FRAMES.value]) == time_frames \
+                and set(description[data_files_index.SERVICES]) == set(services or []):
+            return data_file
+    return None
+
+
+async def find_covering_data_file(exchange_name, symbols, time_frames, start_timestamp_ms, end_timestamp_ms,
+                                  data_path=backtesting_constants.BACKTESTING_FILE_PATH):
+    """
+    :return: the smallest data file containing exactly symbols and time_frames candles of exchange_name
+    from start_timestamp_ms to end_timestamp_ms, or None. Files with other symbols or time frames are
+    ignored: backtesting runs on every symbol and time frame of its data file.
+    """
+    start_timestamp = _to_description_timestamp(start_timestamp_ms)
+    end_timestamp = _to_description_timestamp(end_timestamp_ms)
+    time_frames = {time_frame.value for time_frame in time_frames}
+    index = get_index(data_path)
+    await index.sync()
+    # a 0 start timestamp means that the data file starts from the first available candle
+    descriptions = await index.select(
+        exchange_name,
+        "(start_timestamp = 0 OR (start_timestamp > 0 AND start_timestamp <= ?)) AND end_timestamp >= ?",
+        (start_timestamp, end_timestamp),
+        "end_timestamp - start_timestamp, file_name",
+    )
+    for data_file, description in descriptions.items():
+        if set(description[backtesting_enums.DataFormatKeys.SYMBOLS.value]) == set(symbols) \
+                and set(description[backtesting_enums.DataFormatKeys.TIME_FRAMES.value]) == time_frames:
+            return data_file
+    return None
+
+
+def get_time_window(data_file, start_timestamp_ms, end_timestamp_ms,
+                    data_path=backtesting_constants.BACKTESTING_FILE_PATH):
+    """
+    :return: the (start, end) timestamps in seconds to run backtesting on when data_file is a known data file
+    containing more candles than the requested ones, None otherwise. start is None when candles should be
+    read from the beginning of data_file.
+    """
+    description = get_index(data_path).get(data_file)
+    if description is None:
+        return None
+    start_timestamp = _to_description_timestamp(start_timestamp_ms)
+    end_timestamp = _to_description_timestamp(end_timestamp_ms)
+    if start_timestamp <= description[backtesting_enums.DataFormatKeys.START_TIMESTAMP.value] \
+            and end_timestamp >= description[backtesting_enums.DataFormatKeys.END_TIMESTAMP.value]:
+        return None
+    return start_timestamp or None, end_timestamp
+
+
+def set_backtesting_time_window(config, start_timestamp, end_timestamp):
+    backtesting_config = config.setdefault(backtesting_constants.CONFIG_BACKTESTING, {})
+    backtesting_config[constants.CONFIG_BACKTESTING_START_TIMESTAMP] = start_timestamp
+    backtesting_config[constants.CONFIG_BACKTESTING_END_TIMESTAMP] = end_timestamp
+
+
+def get_backtesting_time_window(config):
+    """
+    :return: the (start, end) timestamps in seconds to run backtesting on, (None, None) to use every candle
+    """
+    backtesting_config = config.get(backtesting_constants.CONFIG_BACKTESTING, {})
+    return (
+        backtesting_config.get(constants.CONFIG_BACKTESTING_START_TIMESTAMP),
+        backtesting_config.get(constants.CONFIG_BACKTESTING_END_TIMESTAMP),
+    )
+
+
+async def find_extendable_data_file(exchange_name, symbols, time_frames, start_timestamp_ms, end_timestamp_ms,
+                                    data_path=backtesting_constants.BACKTESTING_FILE_PATH):
+    """
+    :return: the data file with the same exchange, symbols, time frames and start that ends the closest
+    to (and before) end_timestamp_ms, or None
+    """
+    start_timestamp = _to_description_timestamp(start_timestamp_ms)
+    end_timestamp = _to_description_timestamp(end_timestamp_ms)
+    time_frames = {time_frame.value for time_frame in time_frames}
+    index = get_index(data_path)
+    await index.sync()
+    descriptions = await index.select(
+        exchange_name,
+        "start_timestamp = ? AND end_timestamp > start_timestamp AND end_timestamp < ?",
+        (start_timestamp, end_timestamp),
+        "end_timestamp DESC",
+    )
+    for data_file, description in descriptions.items():
+        if set(description[backtesting_enums.DataFormatKeys.SYMBOLS.value]) == set(symbols) \
+                and set(description[backtesting_enums.DataFormatKeys.TIME_FRAMES.value]) == time_frames:
+            return data_file
+    return None
+
+
+async def get_data_file_end_timestamp_ms(data_file, data_path=backtesting_constants.BACKTESTING_FILE_PATH) -> int:
+    description = await backtesting_api.get_file_description(data_file, data_path=data_path)
+    return description[backtesting_enums.DataFormatKeys.END_TIMESTAMP.value] * 1000
+
+
+async def extend_data_file(data_file, tail_data_file, end_timestamp_ms,
+                           data_path=backtesting_constants.BACKTESTING_FILE_PATH) -> str:
+    """
+    Create a new data file made of data_file candles followed by the tail_data_file candles
+    that are more recent than data_file ones. Once the new data file is indexed, it supersedes
+    data_file: data_file (with its columnar cache) and tail_data_file are deleted.
+    :return: the new data file name
+    """
+    collector_name = data_file.split(backtesting_constants.BACKTESTING_DATA_FILE_SEPARATOR)[0]
+    extended_data_file = f"{collector_name}{backtesting_constants.BACKTESTING_DATA_FILE_SEPARATOR}" \
+                         f"{time.time()}{backtesting_constants.BACKTESTING_DATA_FILE_EXT}"
+    await asyncio.to_thread(
+        _merge_data_files,
+        os.path.join(data_path, data_file),
+        os.path.join(data_path, tail_data_file),
+        os.path.join(data_path, extended_data_file),
+        _to_description_timestamp(end_timestamp_ms),
+    )
+    os.remove(os.path.join(data_path, tail_data_file))
+    await register_data_file(extended_data_file, data_path=data_path)
+    _remove_data_file(data_file, data_path)
+    return extended_data_file
+
+
+def _remove_data_file(data_file, data_path):
+    data_file_path = os.path.join(data_path, data_file)
+    os.remove(data_file_path)
+    shutil.rmtree(data_file_path + columnar_cache.COLUMNS_DIR_SUFFIX, ignore_errors=True)
+    get_index(data_path).unregister(data_file)
+
+
+def _merge_data_files(data_file_path, tail_data_file_path, extended_data_file_path, end_timestamp):
+    temp_file_path = extended_data_file_path + backtesting_constants.BACKTESTING_DATA_FILE_TEMP_EXT
+    shutil.copyfile(data_file_path, temp_file_path)
+    connection = sqlite3.connect(temp_file_path)
+    try:
+        connection.execute("ATTACH DATABASE ? AS tail", (tail_data_file_path, ))
+        connection.execute(
+            f"INSERT INTO {backtesting_enums.ExchangeDataTables.OHLCV.value} "
+            f"SELECT tail_ohlcv.* FROM tail.{backtesting_enums.ExchangeDataTables.OHLCV.value} AS tail_ohlcv "
+            f"WHERE tail_ohlcv.timestamp > ("
+            f"SELECT COALESCE(MAX(ohlcv.timestamp), -1) FROM {backtesting_enums.ExchangeDataTables.OHLCV.value} "
+            f"AS ohlcv WHERE ohlcv.exchange_name = tail_ohlcv.exchange_name "
+            f"AND ohlcv.symbol = tail_ohlcv.symbol AND ohlcv.time_frame = tail_ohlcv.time_frame)"
+        )
+        connection.execute(
+            f"UPDATE {backtesting_enums.DataTables.DESCRIPTION.value} SET timestamp = ?, end_timestamp = ?",
+            (time.time(), end_timestamp)
+        )
+        connection.commit()
+        connection.execute("DETACH DATABASE tail")
+    finally:
+        connection.close()
+    os.replace(temp_file_path, extended_data_file_path)
+
+
+def _to_description_timestamp(timestamp_ms):
+    # data files descriptions timestamps are in seconds, 0 when unset
+    return int(timestamp_ms / 1000) if timestamp_ms else 0
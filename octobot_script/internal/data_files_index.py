@@ -0,0 +1,231 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+
+import octobot_backtesting.api as backtesting_api
+import octobot_backtesting.enums as backtesting_enums
+import octobot_commons.logging as logging
+
+
+INDEX_FILE_SUFFIX = ".index.sqlite"
+INDEX_VERSION = "1"
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+SERVICES = "services"
+SIZE = "size"
+LOGGER = logging.get_logger("DataFilesIndex")
+
+
+class DataFilesIndex:
+    """
+    Persistent index of the data files of a data folder, stored in a SQLite database next to this folder.
+    The data folder is only listed again when its content changed and indexed data files are
+    validated against their size and modification time when they are looked up.
+    Checksums are only computed when requested (see get_checksum): indexing never reads whole data files.
+    """
+    def __init__(self, data_path):
+        self.data_path = data_path
+        self.index_path = f"{os.path.normpath(data_path)}{INDEX_FILE_SUFFIX}"
+        self._connection = None
+
+    async def sync(self):
+        """
+        Index added data files and forget deleted ones when the data folder content changed.
+        """
+        folder_signature = self._get_folder_signature()
+        if folder_signature is None or folder_signature == self._get_meta("folder_signature"):
+            return
+        indexed_files = {row[0] for row in self._get_connection().execute("SELECT file_name FROM data_files")}
+        available_files = set(backtesting_api.get_all_available_data_files(self.data_path))
+        self._get_connection().executemany(
+            "DELETE FROM data_files WHERE file_name = ?",
+            [(data_file, ) for data_file in indexed_files - available_files]
+        )
+        for data_file in sorted(available_files - indexed_files):
+            await self._index(data_file)
+        self._set_meta("folder_signature", folder_signature)
+        self._get_connection().commit()
+
+    async def register(self, data_file):
+        """
+        Index data_file, to be called when data_file has just been created.
+        """
+        if not os.path.isfile(os.path.join(self.data_path, data_file)):
+            return
+        await self._index(data_file)
+        self._get_connection().commit()
+
+    def unregister(self, data_file):
+        """
+        Forget data_file, to be called when data_file has just been deleted.
+        """
+        self._get_connection().execute("DELETE FROM data_files WHERE file_name = ?", (data_file, ))
+        self._get_connection().commit()
+
+    def get(self, data_file):
+        """
+        :return: the description of data_file when it is an up-to-date indexed exchange data file, None otherwise
+        """
+        if not os.path.isfile(os.path.join(self.data_path, data_file)):
+            return None
+        row = self._get_connection().execute(
+            "SELECT * FROM data_files WHERE file_name = ?", (data_file, )
+        ).fetchone()
+        if row is None or not self._is_up_to_date(row) or row["exchange"] is None:
+            return None
+        return self._get_description(row)
+
+    async def select(self, exchange_name, where_clause, parameters, order_by_clause):
+        """
+        :return: the up-to-date descriptions of exchange_name data files (of social data files when exchange_name
+        is None), by file name, matching where_clause and ordered by order_by_clause
+        """
+        descriptions = {}
+        if not os.path.isdir(self.data_path):
+            return descriptions
+        exchange_clause, exchange_parameters = (
+            ("exchange IS NULL", ()) if exchange_name is None else ("exchange = ?", (exchange_name, ))
+        )
+        for row in self._get_connection().execute(
+            f"SELECT * FROM data_files WHERE {exchange_clause} AND {where_clause} ORDER BY {order_by_clause}",
+            (*exchange_parameters, *parameters)
+        ).fetchall():
+            if self._is_up_to_date(row):
+                descriptions[row["file_name"]] = self._get_description(row)
+            else:
+                # data file changed since it was indexed: it is looked up again next time
+                await self.register(row["file_name"])
+        return descriptions
+
+    async def get_checksum(self, data_file):
+        """
+        :return: the sha256 checksum of data_file when it is an up-to-date indexed data file, None otherwise.
+        It is computed on the first call and stored until data_file changes.
+        """
+        row = self._get_connection().execute(
+            "SELECT * FROM data_files WHERE file_name = ?", (data_file, )
+        ).fetchone()
+        if row is None or not self._is_up_to_date(row):
+            return None
+        if row["checksum"] is None:
+            checksum = await asyncio.to_thread(_get_checksum, os.path.join(self.data_path, data_file))
+            self._get_connection().execute(
+                "UPDATE data_files SET checksum = ? WHERE file_name = ? AND size = ? AND mtime_ns = ?",
+                (checksum, data_file, row["size"], row["mtime_ns"])
+            )
+            self._get_connection().commit()
+            return checksum
+        return row["checksum"]
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    async def _index(self, data_file):
+        file_path = os.path.join(self.data_path, data_file)
+        try:
+            stat = os.stat(file_path)
+            description = await backtesting_api.get_file_description(data_file, data_path=self.data_path)
+        except Exception as err:
+            LOGGER.debug(f"Ignored unreadable data file {data_file}: {err}")
+            self._get_connection().execute("DELETE FROM data_files WHERE file_name = ?", (data_file, ))
+            return
+        description = description or {}
+        self._get_connection().execute(
+            "INSERT OR REPLACE INTO data_files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                data_file,
+                stat.st_size,
+                stat.st_mtime_ns,
+                # computed on demand
+                None,
+                description.get(backtesting_enums.DataFormatKeys.EXCHANGE.value) or None,
+                json.dumps(description.get(backtesting_enums.DataFormatKeys.SYMBOLS.value) or []),
+                json.dumps(description.get(backtesting_enums.DataFormatKeys.TIME_FRAMES.value) or []),
+                json.dumps(description.get(SERVICES) or []),
+                description.get(backtesting_enums.DataFormatKeys.START_TIMESTAMP.value, 0),
+                description.get(backtesting_enums.DataFormatKeys.END_TIMESTAMP.value, 0),
+            )
+        )
+
+    def _is_up_to_date(self, row):
+        try:
+            stat = os.stat(os.path.join(self.data_path, row["file_name"]))
+        except FileNotFoundError:
+            return False
+        return stat.st_size == row["size"] and stat.st_mtime_ns == row["mtime_ns"]
+
+    def _get_description(self, row):
+        return {
+            backtesting_enums.DataFormatKeys.EXCHANGE.value: row["exchange"],
+            backtesting_enums.DataFormatKeys.SYMBOLS.value: json.loads(row["symbols"]),
+            backtesting_enums.DataFormatKeys.TIME_FRAMES.value: json.loads(row["time_frames"]),
+            SERVICES: json.loads(row["services"]),
+            backtesting_enums.DataFormatKeys.START_TIMESTAMP.value: row["start_timestamp"],
+            backtesting_enums.DataFormatKeys.END_TIMESTAMP.value: row["end_timestamp"],
+            SIZE: row["size"],
+        }
+
+    def _get_folder_signature(self):
+        try:
+            # adding or removing a data file updates its folder modification time
+            return str(os.stat(self.data_path).st_mtime_ns)
+        except FileNotFoundError:
+            return None
+
+    def _get_meta(self, key):
+        row = self._get_connection().execute("SELECT value FROM meta WHERE key = ?", (key, )).fetchone()
+        return None if row is None else row[0]
+
+    def _set_meta(self, key, value):
+        self._get_connection().execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    def _get_connection(self):
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.index_path)
+            self._connection.row_factory = sqlite3.Row
+            self._create_tables()
+        return self._connection
+
+    def _create_tables(self):
+        self._connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        if self._get_meta("version") != INDEX_VERSION:
+            # unknown index format: rebuild it from data files
+            self._connection.execute("DROP TABLE IF EXISTS data_files")
+            self._connection.execute("DELETE FROM meta")
+            self._set_meta("version", INDEX_VERSION)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS data_files ("
+            "file_name TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, checksum TEXT, exchange TEXT, "
+            "symbols TEXT, time_frames TEXT, services TEXT, start_timestamp INTEGER, end_timestamp INTEGER)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS data_files_coverage ON data_files (exchange, start_timestamp, end_timestamp)"
+        )
+        self._connection.commit()
+
+
+def _get_checksum(file_path):
+    checksum = hashlib.sha256()
+    with open(file_path, "rb") as data_file:
+        for chunk in iter(lambda: data_file.read(CHECKSUM_CHUNK_SIZE), b""):
+            checksum.update(chunk)
+    return checksum.hexdigest()
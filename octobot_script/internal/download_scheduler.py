@@ -0,0 +1,179 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import time
+
+import octobot_backtesting.api as backtesting_api
+import octobot_commons.logging as logging
+import octobot_services.errors as services_errors
+import octobot_trading.errors as trading_errors
+
+import octobot_script.constants as constants
+
+
+RATE_LIMIT_ERRORS = (trading_errors.RateLimitExceeded, services_errors.RateLimitError)
+# raised by exchange connectors, identified by name not to import them here
+RATE_LIMIT_ERROR_NAMES = {"RateLimitExceeded", "DDoSProtection"}
+MIN_RATE_RATIO = 0.05
+SLOW_DOWN_FACTOR = 0.5
+SPEED_UP_FACTOR = 1.25
+# only exchange data collectors are able to report their progress
+PROGRESS_METHODS = ("get_current_step_index", "get_total_steps", "get_current_step_percent")
+LOGGER = logging.get_logger("DownloadScheduler")
+
+
+class TokenBucket:
+    """
+    Token bucket allowing rate acquisitions per second with bursts of up to capacity acquisitions.
+    Its rate is adapted to rate limit errors: divided on each error and progressively restored on successes.
+    """
+    def __init__(self, rate, capacity, clock=time.monotonic, sleep=asyncio.sleep):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+
+    async def acquire(self):
+        self._refill()
+        # reserve a token right away: negative tokens are acquisitions waiting for their turn
+        self.tokens -= 1
+        if self.tokens < 0:
+            await self._sleep(-self.tokens / self.rate)
+
+    def slow_down(self):
+        self.rate = max(self.rate * SLOW_DOWN_FACTOR, self.max_rate * MIN_RATE_RATIO)
+        # do not allow a burst right after being rate limited
+        self.tokens = min(self.tokens, 0)
+
+    def speed_up(self):
+        self.rate = min(self.rate * SPEED_UP_FACTOR, self.max_rate)
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class DownloadScheduler:
+    """
+    Schedules data collectors of each exchange or service according to its collections budget:
+    each token allows to start one collection. Requests made during a collection are throttled by the
+    exchange connector or service feed itself, this budget only limits how many collections (and
+    therefore how many of those request streams) run on the same exchange or service.
+    Collectors failing on rate limit errors are retried after an exponential backoff and slow down the
+    next collections of their exchange or service.
+    """
+    def __init__(self,
+                 collections_per_second=constants.DEFAULT_DOWNLOADS_PER_SECOND,
+                 burst=constants.DEFAULT_DOWNLOADS_BURST,
+                 budgets=None,
+                 max_retries=constants.DEFAULT_DOWNLOAD_MAX_RETRIES,
+                 backoff_seconds=constants.DEFAULT_DOWNLOAD_BACKOFF_SECONDS,
+                 progress_callback=None,
+                 progress_interval=constants.DEFAULT_DOWNLOAD_PROGRESS_INTERVAL,
+                 clock=time.monotonic,
+                 sleep=asyncio.sleep):
+        self.collections_per_second = collections_per_second
+        self.burst = burst
+        # collections per second by exchange or service name
+        self.budgets = budgets or {}
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.progress_callback = progress_callback
+        self.progress_interval = progress_interval
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets = {}
+
+    def get_bucket(self, key) -> TokenBucket:
+        try:
+            return self._buckets[key]
+        except KeyError:
+            self._buckets[key] = TokenBucket(
+                self.budgets.get(key, self.collections_per_second), self.burst, clock=self._clock, sleep=self._sleep
+            )
+            return self._buckets[key]
+
+    async def run(self, key, collector_factory):
+        """
+        Create a data collector using collector_factory and run it once allowed by key budget.
+        :return: the collected data file name
+        """
+        bucket = self.get_bucket(key)
+        for attempt in range(self.max_retries + 1):
+            await bucket.acquire()
+            collector = collector_factory()
+            try:
+                data_file = await self._run_collector(key, collector)
+                bucket.speed_up()
+                return data_file
+            except Exception as err:
+                if not is_rate_limit_error(err) or attempt == self.max_retries:
+                    raise
+                bucket.slow_down()
+                delay = self.backoff_seconds * 2 ** attempt
+                LOGGER.warning(f"{key} rate limit reached, retrying in {delay} seconds ({err})")
+                await self._sleep(delay)
+
+    async def _run_collector(self, key, collector):
+        collection = asyncio.ensure_future(backtesting_api.initialize_and_run_data_collector(collector))
+        try:
+            while not collection.done():
+                await asyncio.wait((collection, ), timeout=self.progress_interval)
+                if not collection.done() and has_progress(collector):
+                    self._report_progress(key, collector)
+            return collection.result()
+        finally:
+            if not collection.done():
+                collection.cancel()
+
+    def _report_progress(self, key, collector):
+        current_step, total_steps, step_percent = backtesting_api.get_data_collector_progress(collector)
+        if self.progress_callback is None:
+            LOGGER.info(f"{key} data collection: step {current_step}/{total_steps} ({step_percent}%)")
+        else:
+            self.progress_callback(key, current_step, total_steps, step_percent)
+
+
+def has_progress(collector) -> bool:
+    return all(hasattr(collector, method) for method in PROGRESS_METHODS)
+
+
+def is_rate_limit_error(error) -> bool:
+    return isinstance(error, RATE_LIMIT_ERRORS) or any(
+        error_class.__name__ in RATE_LIMIT_ERROR_NAMES
+        for error_class in type(error).__mro__
+    )
+
+
+# scheduler shared by every data collection
+_SCHEDULER = {}
+
+
+def get_scheduler() -> DownloadScheduler:
+    try:
+        return _SCHEDULER["scheduler"]
+    except KeyError:
+        _SCHEDULER["scheduler"] = DownloadScheduler()
+        return _SCHEDULER["scheduler"]
+
+
+def set_scheduler(scheduler):
+    _SCHEDULER["scheduler"] = scheduler
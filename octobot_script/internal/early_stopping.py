@@ -0,0 +1,81 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import inspect
+
+import octobot_backtesting.api as backtesting_api
+import octobot_trading.api as trading_api
+
+import octobot_script.constants as constants
+
+
+class EarlyStopping:
+    """
+    Stops a backtest before the end of its data when it is not worth completing:
+    - when its portfolio value drawdown from its highest value reaches max_drawdown (in percent)
+    - when stop_condition(ctx) (sync or async) returns True. It is called every check_interval strategy calls.
+    Checks happen each time the backtest strategy is called.
+    Stopped backtests end after their current iteration, as when reaching the end of their data:
+    pruned_timestamp is then their last backtesting timestamp.
+    """
+
+    def __init__(self, stop_condition=None, max_drawdown=None,
+                 check_interval=constants.DEFAULT_STOP_CONDITION_CHECK_INTERVAL):
+        self.stop_condition = stop_condition
+        self.max_drawdown = max_drawdown
+        self.check_interval = check_interval
+        self.pruned = False
+        self.pruned_timestamp = None
+        self._calls = 0
+        self._highest_portfolio_value = None
+
+    async def check(self, ctx) -> bool:
+        """
+        :return: True when the backtest has been stopped
+        """
+        if self.pruned:
+            return True
+        self._calls += 1
+        if self._has_reached_max_drawdown(ctx) or await self._is_stop_condition_met(ctx):
+            self.pruned = True
+            self._stop(ctx.exchange_manager.exchange.backtesting)
+        return self.pruned
+
+    def _stop(self, backtesting):
+        # backtesting can't be stopped from its API while iterating: its time channel would be deleted during
+        # the current iteration. Finish backtesting at the current time instead to let the time updater
+        # complete this iteration, record the simulation duration and stop itself.
+        self.pruned_timestamp = backtesting_api.get_backtesting_current_time(backtesting)
+        backtesting.time_manager.finishing_timestamp = self.pruned_timestamp
+
+    def _has_reached_max_drawdown(self, ctx) -> bool:
+        if self.max_drawdown is None:
+            return False
+        portfolio_value = float(trading_api.get_current_portfolio_value(ctx.exchange_manager))
+        if self._highest_portfolio_value is None or portfolio_value > self._highest_portfolio_value:
+            self._highest_portfolio_value = portfolio_value
+        if not self._highest_portfolio_value:
+            return False
+        drawdown = (self._highest_portfolio_value - portfolio_value) / self._highest_portfolio_value * 100
+        return drawdown >= self.max_drawdown
+
+    async def _is_stop_condition_met(self, ctx) -> bool:
+        if self.stop_condition is None or self._calls % self.check_interval:
+            return False
+        result = self.stop_condition(ctx)
+        if inspect.isawaitable(result):
+            result = await result
+        return bool(result)
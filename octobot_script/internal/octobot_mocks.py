@@ -15,6 +15,7 @@
 #  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
 
 import os
+import copy
 import json
 import appdirs
 
@@ -34,12 +35,28 @@ import octobot_services.api as services_api
 LOGGER = commons_logging.get_logger("OctoBot-Script Tentacles")
 
 
+# parsed configurations by cache key, see _get_cached
+_CACHE = {}
+
+
 def get_tentacles_config(forced_tentacles_by_topic=None, profile_id=None, activate_strategy_tentacles=False):
+    """
+    :return: a copy of the tentacles setup config, only read again from disk when its file changed
+    """
     _validate_tentacles_config_source(forced_tentacles_by_topic, profile_id)
-    # use tentacles config from user appdirs as it is kept up to date at each tentacle packages install
-    tentacles_setup_config = octobot_tentacles_manager_api.get_tentacles_setup_config(
-        _get_tentacles_config_path(profile_id)
+    config_path = _get_tentacles_config_path(profile_id)
+    return _copy_tentacles_setup_config(
+        _get_cached(
+            config_path,
+            (json.dumps(forced_tentacles_by_topic, sort_keys=True), activate_strategy_tentacles),
+            lambda: _load_tentacles_config(config_path, forced_tentacles_by_topic, activate_strategy_tentacles),
+        )
     )
+
+
+def _load_tentacles_config(config_path, forced_tentacles_by_topic, activate_strategy_tentacles):
+    # use tentacles config from user appdirs as it is kept up to date at each tentacle packages install
+    tentacles_setup_config = octobot_tentacles_manager_api.get_tentacles_setup_config(config_path)
     if not tentacles_setup_config.is_successfully_loaded:
         # reference config not available (tentacles not yet installed via CLI),
         # populate from currently imported tentacles
@@ -57,7 +74,15 @@ def get_tentacles_config(forced_tentacles_by_topic=None, profile_id=None, activa
 
 
 def get_config():
-    with open(get_module_config_path("config_mock.json")) as f:
+    """
+    :return: a copy of the config mock, only read again from disk when its file changed
+    """
+    config_path = get_module_config_path("config_mock.json")
+    return copy.deepcopy(_get_cached(config_path, None, lambda: _load_json(config_path)))
+
+
+def _load_json(file_path):
+    with open(file_path) as f:
         return json.load(f)
 
 
@@ -104,39 +129,74 @@ def force_tentacles_config_activation(
 
 
 def get_activated_social_services(forced_tentacles_by_topic=None, profile_id=None, requested_sources=None):
-    social_services = []
+    """
+    :return: the names of the activated backtestable social services, only computed again
+    when the tentacles config or the installed tentacles changed
+    """
+    requested_sources = sorted({str(source).lower() for source in requested_sources}) if requested_sources else []
+    return list(
+        _get_cached(
+            _get_tentacles_config_path(profile_id),
+            (
+                "social_services",
+                json.dumps(forced_tentacles_by_topic, sort_keys=True),
+                tuple(requested_sources),
+                _get_modification_time(get_imported_tentacles_path()),
+            ),
+            lambda: _get_activated_social_services(forced_tentacles_by_topic, profile_id, set(requested_sources)),
+        )
+    )
+
+
+def _get_activated_social_services(forced_tentacles_by_topic, profile_id, requested_sources):
     services_config = get_tentacles_config(forced_tentacles_by_topic, profile_id).tentacles_activation.get(
         octobot_tentacles_manager_constants.TENTACLES_SERVICES_PATH, {}
     )
-    requested_sources = {str(source).lower() for source in requested_sources} if requested_sources else set()
+    return sorted(
+        feed_name
+        for feed_name, supported_sources in _get_backtestable_feeds_sources().items()
+        if services_config.get(feed_name, False)
+        and (not requested_sources or requested_sources.intersection(supported_sources))
+    )
+
+
+def _get_backtestable_feeds_sources():
+    """
+    :return: the historical sources of each installed backtestable service feed, by feed name.
+    Service feeds are only inspected again when tentacles are installed again.
+    """
+    tentacles_path = get_imported_tentacles_path()
+    return _get_cached(tentacles_path, "backtestable_feeds_sources", _inspect_backtestable_feeds_sources)
+
+
+def _inspect_backtestable_feeds_sources():
     backtestable_feed_by_name = {
         feed_class.get_name(): feed_class
         for feed_class in services_api.get_available_backtestable_feeds()
     }
+    feeds_sources = {}
     for feed_class in class_inspector.get_all_classes_from_parent(services_feeds.AbstractServiceFeed):
         if class_inspector.is_abstract_using_inspection_and_class_naming(feed_class):
             continue
         feed_name = feed_class.get_name()
-        if not services_config.get(feed_name, False):
-            continue
         backtestable_feed = backtestable_feed_by_name.get(feed_name)
         if backtestable_feed is None:
             continue
-        if requested_sources:
-            supported_sources = {str(source).lower() for source in (backtestable_feed.get_historical_sources() or [])}
-            if not requested_sources.intersection(supported_sources):
-                continue
-        social_services.append(feed_name)
-    return sorted(social_services)
+        feeds_sources[feed_name] = {
+            str(source).lower() for source in (backtestable_feed.get_historical_sources() or [])
+        }
+    return feeds_sources
 
 
 def _get_tentacles_config_path(profile_id=None):
     if profile_id:
-        profile = commons_profiles.Profile.load_profile(
-            os.path.join(get_module_appdir_path(), commons_constants.USER_PROFILES_FOLDER),
+        profiles_path = os.path.join(get_module_appdir_path(), commons_constants.USER_PROFILES_FOLDER)
+        # loading a profile parses every profile: only do it again when profiles are added or removed
+        return _get_cached(
+            profiles_path,
             profile_id,
+            lambda: commons_profiles.Profile.load_profile(profiles_path, profile_id).get_tentacles_config_path(),
         )
-        return profile.get_tentacles_config_path()
     return os.path.join(
         get_module_appdir_path(),
         octobot_tentacles_manager_constants.USER_REFERENCE_TENTACLE_CONFIG_PATH,
@@ -144,6 +204,51 @@ def _get_tentacles_config_path(profile_id=None):
     )
 
 
+def clear_cache():
+    """
+    Forget cached configurations, to be called once tentacles are installed: installing tentacles
+    changes files that are not part of the cache keys (ex: nested tentacles configurations).
+    """
+    _CACHE.clear()
+
+
+def _get_cached(file_path, key, loader):
+    """
+    :return: the value returned by loader for file_path and key, loader is only called again
+    when file_path modification time changed
+    """
+    modification_time = _get_modification_time(file_path)
+    cache_key = (file_path, key)
+    try:
+        cached_modification_time, value = _CACHE[cache_key]
+        if cached_modification_time == modification_time:
+            return value
+    except KeyError:
+        pass
+    value = loader()
+    _CACHE[cache_key] = (modification_time, value)
+    return value
+
+
+def _get_modification_time(file_path):
+    try:
+        return os.stat(file_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _copy_tentacles_setup_config(tentacles_setup_config):
+    # cheaper than a deepcopy: only copy the configuration content that can be edited
+    tentacles_setup_config_copy = copy.copy(tentacles_setup_config)
+    tentacles_setup_config_copy.tentacles_activation = {
+        topic: dict(activations)
+        for topic, activations in tentacles_setup_config.tentacles_activation.items()
+    }
+    tentacles_setup_config_copy.registered_tentacles = dict(tentacles_setup_config.registered_tentacles)
+    tentacles_setup_config_copy.installation_context = dict(tentacles_setup_config.installation_context)
+    return tentacles_setup_config_copy
+
+
 def _get_forced_tentacles_activation(forced_tentacles_by_topic=None, activate_strategy_tentacles=False):
     forced_tentacles = {
         octobot_tentacles_manager_constants.TENTACLES_EVALUATOR_PATH: {},
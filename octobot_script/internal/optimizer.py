@@ -0,0 +1,339 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import hashlib
+import itertools
+import json
+import math
+import random
+
+import octobot_commons.logging as logging
+
+import octobot_script.constants as constants
+import octobot_script.model as models
+
+
+GRID = "grid"
+RANDOM = "random"
+TPE = "tpe"
+# consecutive already proposed configurations after which the search space is considered exhausted
+MAX_DUPLICATED_PROPOSALS = 100
+MAX_RANGE_SAMPLING_ATTEMPTS = 10
+LOGGER = logging.get_logger("Optimizer")
+
+
+class Categorical:
+    """
+    Dimension taking one of the given values.
+    """
+    def __init__(self, values):
+        self.values = list(values)
+        if not self.values:
+            raise ValueError("Categorical search space dimensions require at least one value.")
+
+    def grid(self) -> list:
+        return self.values
+
+    def sample(self, rng):
+        return rng.choice(self.values)
+
+    def sample_around(self, rng, observations):
+        return rng.choices(self.values, weights=self._weights(observations))[0]
+
+    def log_density(self, value, observations) -> float:
+        weights = self._weights(observations)
+        return math.log(weights[self.values.index(value)] / sum(weights))
+
+    def _weights(self, observations):
+        # each value keeps a chance to be picked
+        weights = [1.0] * len(self.values)
+        for observation in observations:
+            weights[self.values.index(observation)] += 1
+        return weights
+
+
+class Range:
+    """
+    Dimension taking any value between low and high (included), integers only when both are integers.
+    """
+    def __init__(self, low, high):
+        if low >= high:
+            raise ValueError(f"Invalid search space range: ({low}, {high}), low has to be lower than high.")
+        self.low = low
+        self.high = high
+        self.is_integer = isinstance(low, int) and isinstance(high, int)
+
+    def grid(self) -> list:
+        if not self.is_integer:
+            raise ValueError(f"({self.low}, {self.high}) float range can't be used in a grid search, "
+                             f"use a list of values instead.")
+        return list(range(self.low, self.high + 1))
+
+    def sample(self, rng):
+        if self.is_integer:
+            return rng.randint(self.low, self.high)
+        return rng.uniform(self.low, self.high)
+
+    def sample_around(self, rng, observations):
+        # the uniform prior is one of the mixture components
+        index = rng.randrange(len(observations) + 1)
+        if index == len(observations):
+            return self.sample(rng)
+        bandwidth = self._bandwidth(observations)
+        for _ in range(MAX_RANGE_SAMPLING_ATTEMPTS):
+            # truncated to the range: clipping values would favor its bounds
+            value = rng.gauss(observations[index], bandwidth)
+            if self.low <= value <= self.high:
+                return round(value) if self.is_integer else value
+        return self.sample(rng)
+
+    def log_density(self, value, observations) -> float:
+        bandwidth = self._bandwidth(observations)
+        density = 1 / (self.high - self.low)
+        for observation in observations:
+            density += math.exp(-0.5 * ((value - observation) / bandwidth) ** 2) / (bandwidth * math.sqrt(2 * math.pi))
+        return math.log(density / (len(observations) + 1))
+
+    def _bandwidth(self, observations):
+        return (self.high - self.low) / (len(observations) + 1)
+
+
+class GridSampler:
+    def __init__(self, dimensions):
+        self.size = math.prod(len(dimension.grid()) for dimension in dimensions.values())
+        self._params = (
+            dict(zip(dimensions, values))
+            for values in itertools.product(*(dimension.grid() for dimension in dimensions.values()))
+        )
+
+    def propose(self):
+        """
+        :return: the next params to evaluate or None when every params have been proposed
+        """
+        return next(self._params, None)
+
+    def tell(self, params, score):
+        pass
+
+
+class RandomSampler:
+    def __init__(self, dimensions, seed=None):
+        self.dimensions = dimensions
+        self.rng = random.Random(seed)
+
+    def propose(self):
+        return {name: dimension.sample(self.rng) for name, dimension in self.dimensions.items()}
+
+    def tell(self, params, score):
+        pass
+
+
+class TPESampler(RandomSampler):
+    """
+    Tree-structured Parzen Estimator: once startup_trials params have been evaluated, observations are split
+    into the gamma best ones and the others. For each dimension, the proposed value is, among candidates sampled
+    around the best observations, the one maximizing the best / others densities ratio.
+    Pruned runs (None scores) count as the worst ones.
+    """
+    def __init__(self, dimensions, seed=None,
+                 startup_trials=constants.DEFAULT_TPE_STARTUP_TRIALS,
+                 gamma=constants.DEFAULT_TPE_GAMMA,
+                 candidates=constants.DEFAULT_TPE_CANDIDATES):
+        super().__init__(dimensions, seed=seed)
+        self.startup_trials = startup_trials
+        self.gamma = gamma
+        self.candidates = candidates
+        self._observations = []
+
+    def propose(self):
+        if len(self._observations) < self.startup_trials:
+            return super().propose()
+        ranked_params = [
+            params
+            for params, _ in sorted(
+                self._observations, key=lambda observation: -math.inf if observation[1] is None else observation[1],
+                reverse=True
+            )
+        ]
+        best_count = max(1, math.ceil(self.gamma * len(ranked_params)))
+        best_params, other_params = ranked_params[:best_count], ranked_params[best_count:]
+        return {
+            name: self._propose_value(
+                dimension,
+                [params[name] for params in best_params],
+                [params[name] for params in other_params]
+            )
+            for name, dimension in self.dimensions.items()
+        }
+
+    def tell(self, params, score):
+        self._observations.append((params, score))
+
+    def _propose_value(self, dimension, best_values, other_values):
+        return max(
+            (dimension.sample_around(self.rng, best_values) for _ in range(self.candidates)),
+            key=lambda value: dimension.log_density(value, best_values) - dimension.log_density(value, other_values)
+        )
+
+
+def parse_search_space(search_space) -> dict:
+    """
+    :param search_space: dict of values by strategy config key. A list of values is a Categorical dimension,
+    a (low, high) tuple is a Range and any other value is a fixed value.
+    """
+    dimensions = {}
+    for name, values in search_space.items():
+        if isinstance(values, (Categorical, Range)):
+            dimensions[name] = values
+        elif isinstance(values, tuple):
+            if len(values) != 2:
+                raise ValueError(f"Invalid {name} search space range: {values}, expected (low, high).")
+            dimensions[name] = Range(*values)
+        elif isinstance(values, (list, range)):
+            dimensions[name] = Categorical(values)
+        else:
+            dimensions[name] = Categorical([values])
+    return dimensions
+
+
+def create_sampler(method, dimensions, seed=None):
+    if method == GRID:
+        return GridSampler(dimensions)
+    if method == RANDOM:
+        return RandomSampler(dimensions, seed=seed)
+    if method == TPE:
+        return TPESampler(dimensions, seed=seed)
+    raise ValueError(f"Unknown optimization method: {method}, available methods are: {GRID}, {RANDOM}, {TPE}.")
+
+
+def get_config_hash(strategy_config, run_key=None) -> str:
+    """
+    :param run_key: what strategy_config is run with (see get_run_key), configs hashes differ between run keys
+    """
+    content = strategy_config if run_key is None else [run_key, strategy_config]
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def get_run_key(data_files, strategy_func=None, initialize_func=None, stop_condition=None, max_drawdown=None,
+                profile_id=None) -> dict:
+    """
+    :return: the identity of runs of strategy configs on data_files: functions are identified by their qualified
+    name and code, the values they might capture from their enclosing scope are not part of it.
+    """
+    return {
+        "data_files": sorted(data_files),
+        "strategy_func": _get_function_key(strategy_func),
+        "initialize_func": _get_function_key(initialize_func),
+        "stop_condition": _get_function_key(stop_condition),
+        "max_drawdown": max_drawdown,
+        "profile_id": profile_id,
+    }
+
+
+def _get_function_key(func):
+    if func is None:
+        return None
+    code = getattr(func, "__code__", None)
+    return [
+        f"{getattr(func, '__module__', None)}.{getattr(func, '__qualname__', type(func).__qualname__)}",
+        None if code is None else hashlib.sha256(code.co_code + repr(code.co_consts).encode()).hexdigest(),
+    ]
+
+
+def get_objective_value(metrics, objective):
+    """
+    :return: the objective value of metrics or None when the run has been pruned
+    """
+    if metrics.pruned:
+        return None
+    value = getattr(metrics, objective) if isinstance(objective, str) else objective(metrics)
+    return None if value is None or math.isnan(value) else value
+
+
+async def optimize(submit, search_space, objective, method=GRID, budget=None, workers=1,
+                   maximize=True, strategy_config=None, seed=None, cache=None,
+                   run_key=None) -> models.OptimizationResult:
+    """
+    Evaluates up to budget strategy configs proposed by the method sampler, with up to workers concurrent runs.
+    Failed runs are kept as trials without metrics and count as the worst ones, as pruned runs.
+    :param submit: function of a strategy config returning an awaitable of its BacktestMetrics
+    :param objective: BacktestMetrics attribute name or function of BacktestMetrics, to maximize by default
+    :param strategy_config: base strategy config, updated with the search space values of each run
+    :param cache: dict of BacktestMetrics by config and run_key hash, completed with new successful runs:
+    cached configs are not run again
+    :param run_key: identity of the runs submit starts (see get_run_key)
+    """
+    dimensions = parse_search_space(search_space)
+    sampler = create_sampler(method, dimensions, seed=seed)
+    if budget is None:
+        if method != GRID:
+            raise ValueError(f"A budget is required when using the {method} optimization method.")
+        budget = sampler.size
+    cache = {} if cache is None else cache
+    trials = []
+    pending = {}
+    proposed_hashes = set()
+    duplicated_proposals = 0
+    exhausted = False
+
+    def _add_trial(params, config, metrics, cached):
+        value = get_objective_value(metrics, objective)
+        sampler.tell(params, None if value is None else value if maximize else -value)
+        trials.append(models.OptimizationTrial(config, metrics, value, cached=cached))
+        LOGGER.debug(f"[{len(trials)}/{budget}] {objective if isinstance(objective, str) else 'objective'}: "
+                     f"{'pruned' if value is None else value} {'(cached) ' if cached else ''}with {config}")
+
+    def _add_failed_trial(params, config, error):
+        sampler.tell(params, None)
+        trials.append(models.OptimizationTrial(config, None, None, error=error))
+        LOGGER.exception(error, True, f"[{len(trials)}/{budget}] run failed with {config}: {error}")
+
+    try:
+        while pending or (not exhausted and len(proposed_hashes) < budget):
+            while not exhausted and len(proposed_hashes) < budget and len(pending) < workers:
+                params = sampler.propose()
+                if params is None:
+                    exhausted = True
+                    break
+                config = {**(strategy_config or {}), **params}
+                config_hash = get_config_hash(config)
+                if config_hash in proposed_hashes:
+                    duplicated_proposals += 1
+                    exhausted = duplicated_proposals >= MAX_DUPLICATED_PROPOSALS
+                    continue
+                duplicated_proposals = 0
+                proposed_hashes.add(config_hash)
+                cache_hash = get_config_hash(config, run_key)
+                if cache_hash in cache:
+                    _add_trial(params, config, cache[cache_hash], True)
+                else:
+                    pending[asyncio.ensure_future(submit(config))] = (params, config, cache_hash)
+            if pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    params, config, cache_hash = pending.pop(future)
+                    try:
+                        metrics = future.result()
+                    except Exception as err:
+                        # failed runs are not cached: they are run again by the next optimize calls
+                        _add_failed_trial(params, config, err)
+                    else:
+                        cache[cache_hash] = metrics
+                        _add_trial(params, config, metrics, False)
+    finally:
+        for future in pending:
+            future.cancel()
+    return models.OptimizationResult(trials, maximize=maximize)
@@ -0,0 +1,152 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+
+import octobot_backtesting.api as backtesting_api
+
+import octobot_script
+import octobot_script.internal.data_files as data_files
+import octobot_script.internal.octobot_mocks as octobot_mocks
+import octobot_script.internal.runners as runners
+
+
+# state of the current worker process, populated once by _init_worker
+_WORKER_STATE = {}
+
+
+class WorkersPool:
+    """
+    Process pool running backtests on backtesting_data.
+    Each worker loads backtesting_data.data_files once and then reuses it for every run it executes.
+    As workers are spawned processes, strategy_func, initialize_func and stop_condition have to be picklable
+    (defined at module level).
+    """
+    def __init__(self, backtesting_data,
+                 strategy_func=None, initialize_func=None, workers=None,
+                 tentacles_config=None, profile_id=None,
+                 stop_condition=None, max_drawdown=None):
+        self.workers = workers or os.cpu_count()
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            # spawn workers: forking a process with a running event loop and open databases is unsafe
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                backtesting_data.data_files,
+                data_files.get_backtesting_time_window(backtesting_data.config),
+                backtesting_data.use_accurate_price_time_frame,
+                strategy_func,
+                initialize_func,
+                tentacles_config,
+                profile_id,
+                stop_condition,
+                max_drawdown,
+            ),
+        )
+
+    def submit(self, strategy_config, metrics_only=False) -> asyncio.Future:
+        """
+        :return: a future of the run BacktestResult or, when metrics_only is True, of its BacktestMetrics
+        """
+        return asyncio.get_running_loop().run_in_executor(
+            self._executor, _run_in_worker, strategy_config, metrics_only
+        )
+
+    def shutdown(self):
+        # do not wait for pending runs
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_many(backtesting_data, strategy_configs,
+                   strategy_func=None, initialize_func=None, workers=None,
+                   tentacles_config=None, profile_id=None, metrics_only=False,
+                   stop_condition=None, max_drawdown=None):
+    """
+    Run a backtest for each of the given strategy_configs on a WorkersPool and yield
+    each BacktestResult as soon as it completes.
+    When metrics_only is True, BacktestMetrics are yielded instead of BacktestResult.
+    """
+    pool = WorkersPool(
+        backtesting_data,
+        strategy_func=strategy_func, initialize_func=initialize_func, workers=workers,
+        tentacles_config=tentacles_config, profile_id=profile_id,
+        stop_condition=stop_condition, max_drawdown=max_drawdown,
+    )
+    try:
+        futures = [
+            pool.submit(strategy_config, metrics_only=metrics_only)
+            for strategy_config in strategy_configs
+        ]
+        for future in asyncio.as_completed(futures):
+            yield await future
+    finally:
+        # when the caller stops iterating early
+        pool.shutdown()
+
+
+def _init_worker(backtesting_data_files, time_window, use_accurate_price_time_frame,
+                 strategy_func, initialize_func, tentacles_config, profile_id, stop_condition, max_drawdown):
+    # spawned workers did not load tentacles yet
+    octobot_script.load_tentacles()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    config = octobot_mocks.get_config()
+    data_files.set_backtesting_time_window(config, *time_window)
+    _WORKER_STATE.update(
+        loop=loop,
+        strategy_func=strategy_func,
+        initialize_func=initialize_func,
+        tentacles_config=tentacles_config,
+        profile_id=profile_id,
+        stop_condition=stop_condition,
+        max_drawdown=max_drawdown,
+        backtesting_data=loop.run_until_complete(
+            backtesting_api.create_and_init_backtest_data(
+                backtesting_data_files,
+                config,
+                octobot_mocks.get_tentacles_config(
+                    tentacles_config, profile_id, activate_strategy_tentacles=False
+                ),
+                use_accurate_price_time_frame=use_accurate_price_time_frame,
+            )
+        ),
+    )
+
+
+def _run_in_worker(strategy_config, metrics_only=False):
+    backtest_result = _WORKER_STATE["loop"].run_until_complete(
+        runners.run(
+            _WORKER_STATE["backtesting_data"], strategy_config,
+            enable_logs=False, enable_storage=False,
+            strategy_func=_WORKER_STATE["strategy_func"],
+            initialize_func=_WORKER_STATE["initialize_func"],
+            tentacles_config=_WORKER_STATE["tentacles_config"],
+            profile_id=_WORKER_STATE["profile_id"],
+            metrics_only=metrics_only,
+            stop_condition=_WORKER_STATE["stop_condition"],
+            max_drawdown=_WORKER_STATE["max_drawdown"],
+        )
+    )
+    if metrics_only:
+        return backtest_result
+    # backtesting data and instance are bound to this process: only send back the run summary
+    backtest_result.backtesting_data = None
+    backtest_result.independent_backtesting = None
+    return backtest_result
@@ -0,0 +1,157 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+import gzip
+import json
+import os
+import shutil
+
+try:
+    import orjson
+except ImportError:
+    # optional faster encoder
+    orjson = None
+try:
+    import zstandard
+except ImportError:
+    # optional compression
+    zstandard = None
+
+
+TEMP_FILE_SUFFIX = ".part"
+GZIP = "gzip"
+ZSTD = "zstd"
+# by preference order
+COMPRESSED_FILE_EXTENSIONS = {
+    ZSTD: ".zst",
+    GZIP: ".gz",
+}
+DEFAULT_COMPRESSION = GZIP
+GZIP_COMPRESS_LEVEL = 6
+
+
+def dumps(content) -> bytes:
+    """
+    :return: the JSON encoded content, using orjson when available
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, separators=(",", ":")).encode()
+
+
+def write_json_parts(file_path, *parts, compression=None) -> str:
+    """
+    Writes the given already encoded JSON parts one after the other, compressed when compression is set
+    (in which case the compression extension is added to file_path).
+    The file is replaced at once: hardlinks to its previous version keep their content.
+    :return: the written file path
+    """
+    file_path = get_compressed_file_path(file_path, compression)
+    temp_file_path = f"{file_path}{TEMP_FILE_SUFFIX}"
+    with _open_writer(temp_file_path, compression) as json_file:
+        for part in parts:
+            json_file.write(part)
+    os.replace(temp_file_path, file_path)
+    return file_path
+
+
+def write_bundle(file_path, encoded_meta, encoded_data, compression=None) -> str:
+    """
+    Writes a {"meta": meta, "data": data} bundle from already encoded meta and data.
+    :return: the written file path
+    """
+    return write_json_parts(
+        file_path, b'{"meta":', encoded_meta, b',"data":', encoded_data, b"}", compression=compression
+    )
+
+
+def get_compressed_file_path(file_path, compression) -> str:
+    if compression is None:
+        return file_path
+    if compression == ZSTD and zstandard is None:
+        raise ImportError("zstandard is required to compress reports using zstd")
+    return f"{file_path}{COMPRESSED_FILE_EXTENSIONS[compression]}"
+
+
+def find_file(file_path):
+    """
+    :return: the (path, compression) of the existing compressed or plain version of file_path,
+    None when none of them exist
+    """
+    for compression, extension in COMPRESSED_FILE_EXTENSIONS.items():
+        if os.path.isfile(f"{file_path}{extension}"):
+            return f"{file_path}{extension}", compression
+    if os.path.isfile(file_path):
+        return file_path, None
+    return None
+
+
+def get_file_variants(file_path) -> list:
+    """
+    :return: the plain and compressed paths of file_path
+    """
+    return [file_path] + [f"{file_path}{extension}" for extension in COMPRESSED_FILE_EXTENSIONS.values()]
+
+
+def remove_file_variants(file_path, keep=None):
+    """
+    Removes the plain and compressed versions of file_path, except keep
+    """
+    for variant in get_file_variants(file_path):
+        if variant != keep and os.path.isfile(variant):
+            os.remove(variant)
+
+
+def read_file(file_path) -> bytes:
+    """
+    :return: the decompressed content of the existing version of file_path
+    """
+    found = find_file(file_path)
+    if found is None:
+        raise FileNotFoundError(file_path)
+    with open(found[0], "rb") as stored_file:
+        return decompress(stored_file.read(), found[1])
+
+
+def decompress(content, compression) -> bytes:
+    if compression == GZIP:
+        return gzip.decompress(content)
+    if compression == ZSTD:
+        if zstandard is None:
+            raise ImportError("zstandard is required to read zstd compressed reports")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(content)
+    return content
+
+
+def _open_writer(file_path, compression):
+    if compression == GZIP:
+        return gzip.open(file_path, "wb", compresslevel=GZIP_COMPRESS_LEVEL)
+    if compression == ZSTD:
+        return zstandard.ZstdCompressor().stream_writer(open(file_path, "wb"), closefd=True)
+    return open(file_path, "wb")
+
+
+def link_or_copy(source_path, target_path):
+    """
+    Replaces target_path by a hardlink to source_path, or by a copy when hardlinks are not supported.
+    """
+    temp_file_path = f"{target_path}{TEMP_FILE_SUFFIX}"
+    if os.path.lexists(temp_file_path):
+        os.remove(temp_file_path)
+    try:
+        os.link(source_path, temp_file_path)
+    except OSError:
+        shutil.copyfile(source_path, temp_file_path)
+    os.replace(temp_file_path, target_path)
@@ -14,49 +14,77 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
 
+import numpy as np
+
 import octobot.api as octobot_api
 import octobot_backtesting.api as backtesting_api
-import octobot_commons.constants as commons_constants
-import octobot_commons.enums as commons_enums
 import octobot_commons.logging as logging
+import octobot_trading.api as trading_api
 
 import octobot_script.model as models
 import octobot_script.internal.backtester_trading_mode as backtester_trading_mode
+import octobot_script.internal.candle_store as candle_store
+import octobot_script.internal.data_files as data_files
+import octobot_script.internal.early_stopping as early_stopping_lib
+import octobot_script.internal.signals as signals_lib
 import octobot_script.internal.octobot_mocks as octobot_mocks
 
 
 async def run(backtesting_data, strategy_config,
               enable_logs=False, enable_storage=False,
               strategy_func=None, initialize_func=None,
-              tentacles_config=None, profile_id=None):
+              tentacles_config=None, profile_id=None, signals=None, metrics_only=False,
+              stop_condition=None, max_drawdown=None):
+    """
+    :param metrics_only: when True, only scalar metrics are gathered and a BacktestMetrics is returned instead of a
+    BacktestResult: the backtesting instance is released as soon as the run is over.
+    :param stop_condition: optional (async) function of ctx, the run is stopped and marked as pruned when it returns True
+    :param max_drawdown: optional portfolio drawdown in percent from which the run is stopped and marked as pruned
+    """
     backtest_result = models.BacktestResult(backtesting_data, strategy_config)
-    registered_func = _build_script(strategy_func, initialize_func)
-    _register_script(registered_func, strategy_config)
+    early_stopping = None
+    if stop_condition is not None or max_drawdown is not None:
+        early_stopping = early_stopping_lib.EarlyStopping(stop_condition=stop_condition, max_drawdown=max_drawdown)
+    if signals is not None:
+        # only wake up the trading mode when signals fire or orders are open
+        strategy_func = signals_lib.SignalsSchedule(signals).build_strategy()
     run_tentacles_config = _resolve_run_tentacles_config(
         backtesting_data,
         strategy_func,
         tentacles_config,
         profile_id,
     )
+    start_timestamp, end_timestamp = data_files.get_backtesting_time_window(backtesting_data.config)
     independent_backtesting = octobot_api.create_independent_backtesting(
         backtesting_data.config,
         run_tentacles_config,
         backtesting_data.data_files,
         run_on_common_part_only=True,
-        start_timestamp=None,
-        end_timestamp=None,
+        start_timestamp=start_timestamp,
+        end_timestamp=end_timestamp,
         enable_logs=enable_logs,
         stop_when_finished=False,
         run_on_all_available_time_frames=True,
         enforce_total_databases_max_size_after_run=False,
         enable_storage=enable_storage,
-        backtesting_data=backtesting_data,
+        backtesting_data=candle_store.RunBacktestData(backtesting_data),
+    )
+    bot_id = independent_backtesting.octobot_backtesting.bot_id
+    backtester_trading_mode.register_script(
+        bot_id, _build_script(strategy_func, initialize_func, early_stopping), strategy_config
     )
-    await octobot_api.initialize_and_run_independent_backtesting(independent_backtesting)
-    await independent_backtesting.join_backtesting_updater(None)
-    await _gather_results(independent_backtesting, backtest_result)
-    await octobot_api.stop_independent_backtesting(independent_backtesting)
-    return backtest_result
+    try:
+        await octobot_api.initialize_and_run_independent_backtesting(independent_backtesting)
+        await independent_backtesting.join_backtesting_updater(None)
+        backtest_result.pruned = early_stopping is not None and early_stopping.pruned
+        await _gather_results(
+            independent_backtesting, backtest_result, metrics_only,
+            end_timestamp=early_stopping.pruned_timestamp if backtest_result.pruned else None
+        )
+        await octobot_api.stop_independent_backtesting(independent_backtesting)
+    finally:
+        backtester_trading_mode.unregister_script(bot_id)
+    return backtest_result.metrics if metrics_only else backtest_result
 
 
 def _resolve_run_tentacles_config(backtesting_data, strategy_func, tentacles_config, profile_id):
@@ -75,20 +103,62 @@ def _resolve_run_tentacles_config(backtesting_data, strategy_func, tentacles_con
     )
 
 
-async def _gather_results(independent_backtesting, backtest_result):
-    backtest_result.independent_backtesting = independent_backtesting
+async def _gather_results(independent_backtesting, backtest_result, metrics_only=False, end_timestamp=None):
+    """
+    :param end_timestamp: last backtesting timestamp of runs stopped before the end of their data
+    """
     backtest_result.duration = backtesting_api.get_backtesting_duration(
         independent_backtesting.octobot_backtesting.backtesting
     )
     backtest_result.candles_count = sum(
-        candle_manager.get_preloaded_symbol_candles_count()
+        candle_manager.get_preloaded_symbol_candles_count() if end_timestamp is None
+        else int(np.count_nonzero(
+            np.asarray(candle_manager.get_preloaded_symbol_time_candles()) <= end_timestamp
+        ))
         for candle_manager in backtest_result.backtesting_data.preloaded_candle_managers.values()
     )
-    backtest_result.report = await independent_backtesting.get_dict_formatted_report()
     backtest_result.bot_id = independent_backtesting.octobot_backtesting.bot_id
+    backtest_result.metrics = _get_metrics(independent_backtesting, backtest_result)
+    if not metrics_only:
+        backtest_result.independent_backtesting = independent_backtesting
+        backtest_result.report = await independent_backtesting.get_dict_formatted_report()
+
 
+def _get_metrics(independent_backtesting, backtest_result):
+    exchange_managers = trading_api.get_exchange_managers_from_exchange_ids(
+        independent_backtesting.octobot_backtesting.exchange_manager_ids
+    )
+    profitabilities = []
+    market_average_profitabilities = []
+    end_portfolio_value = trades_count = 0
+    max_drawdown = None
+    for exchange_manager in exchange_managers:
+        _, profitability, _, market_average_profitability, _ = trading_api.get_profitability_stats(exchange_manager)
+        profitabilities.append(float(profitability))
+        market_average_profitabilities.append(float(market_average_profitability))
+        end_portfolio_value += float(trading_api.get_current_portfolio_value(exchange_manager))
+        trades_count += len(trading_api.get_trade_history(exchange_manager))
+        drawdown = float(trading_api.get_draw_down(exchange_manager))
+        max_drawdown = drawdown if max_drawdown is None else max(max_drawdown, drawdown)
+    return models.BacktestMetrics(
+        backtest_result.strategy_config,
+        bot_id=backtest_result.bot_id,
+        duration=backtest_result.duration,
+        candles_count=backtest_result.candles_count,
+        profitability=_mean(profitabilities),
+        market_average_profitability=_mean(market_average_profitabilities),
+        end_portfolio_value=end_portfolio_value,
+        trades_count=trades_count,
+        max_drawdown=max_drawdown,
+        pruned=backtest_result.pruned,
+    )
+
+
+def _mean(values):
+    return sum(values) / len(values) if values else None
 
-def _build_script(strategy_func, initialize_func):
+
+def _build_script(strategy_func, initialize_func, early_stopping=None):
     """
     Compose strategy_func and initialize_func into a single
     async callable that the backtesting engine will invoke on every candle.
@@ -96,11 +166,14 @@ def _build_script(strategy_func, initialize_func):
     Execution order per candle:
       1. initialize_func(ctx)  => only on the very first candle tick
       2. strategy_func(ctx)    => always (signal computation)
+      3. early_stopping.check(ctx) => when early stopping is enabled, nothing is executed once the run is pruned
     """
     logger = logging.get_logger("Script Runner")
     initialized = [False]  # mutable container so the closure can mutate it
 
     async def _combined(ctx):
+        if early_stopping is not None and early_stopping.pruned:
+            return
         if initialize_func is not None and not initialized[0]:
             try:
                 await initialize_func(ctx)
@@ -113,21 +186,10 @@ def _build_script(strategy_func, initialize_func):
                 await strategy_func(ctx)
         except Exception as err:
             logger.exception(err, True, f"Failed to execute strategy function: {err}")
+        if early_stopping is not None:
+            try:
+                await early_stopping.check(ctx)
+            except Exception as err:
+                logger.exception(err, True, f"Failed to execute stop condition: {err}")
     return _combined
 
-
-def _register_script(script_func, strategy_config):
-    def _local_import_scripts(self, *args):
-        self._live_script = script_func
-        original_reload_config = self.reload_config
-
-        async def _local_reload_config(*args, **kwargs):
-            await original_reload_config(*args, **kwargs)
-            updated_config = {
-                commons_constants.CONFIG_ACTIVATION_TOPICS.replace(" ", "_"):
-                    commons_enums.ActivationTopics.FULL_CANDLES.value
-            }
-            updated_config.update(strategy_config)
-            self.trading_config.update(updated_config)
-        self.reload_config = _local_reload_config
-    backtester_trading_mode.BacktesterTradingMode._import_scripts = _local_import_scripts
@@ -0,0 +1,132 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+import octobot_backtesting.api as backtesting_api
+import octobot_trading.api as trading_api
+
+
+TIME = "time"
+ENTRIES = "entries"
+EXITS = "exits"
+AMOUNT = "amount"
+EXIT_AMOUNT = "exit_amount"
+STOP_LOSS_OFFSET = "stop_loss_offset"
+TAKE_PROFIT_OFFSET = "take_profit_offset"
+DEFAULT_EXIT_AMOUNT = "100%"
+SUPPORTED_KEYS = {TIME, ENTRIES, EXITS, AMOUNT, EXIT_AMOUNT, STOP_LOSS_OFFSET, TAKE_PROFIT_OFFSET}
+
+
+class SignalsSchedule:
+    """
+    Orders to create from pre-computed signals arrays aligned with the candles close times:
+    - time: candles close times, as returned by Time(ctx, max_history=True, use_close_time=True)
+    - entries: buy signals mask
+    - exits: optional sell signals mask
+    - amount: entries amount (ex: "10%"), a scalar or an array
+    - exit_amount: optional exits amount, a scalar or an array. Default is "100%"
+    - stop_loss_offset / take_profit_offset: optional entries offsets in percent (ex: -15), a scalar or
+      an array. NaN values disable the associated stop loss or take profit.
+    """
+
+    def __init__(self, signals):
+        unknown_keys = set(signals) - SUPPORTED_KEYS
+        if unknown_keys:
+            raise ValueError(f"Unsupported signals keys: {', '.join(sorted(unknown_keys))}")
+        if TIME not in signals or ENTRIES not in signals:
+            raise ValueError(f"signals require at least '{TIME}' and '{ENTRIES}' arrays.")
+        times = np.asarray(signals[TIME], dtype=np.float64)
+        entries = self._get_mask(signals, ENTRIES, times)
+        exits = self._get_mask(signals, EXITS, times)
+        if entries.any() and AMOUNT not in signals:
+            raise ValueError(f"signals require an '{AMOUNT}' to create entries.")
+        amounts = self._get_values(signals.get(AMOUNT), times)
+        exit_amounts = self._get_values(signals.get(EXIT_AMOUNT, DEFAULT_EXIT_AMOUNT), times)
+        stop_loss_offsets = self._get_values(signals.get(STOP_LOSS_OFFSET), times)
+        take_profit_offsets = self._get_values(signals.get(TAKE_PROFIT_OFFSET), times)
+        self.orders_by_time = {}
+        for index in np.flatnonzero(exits):
+            self.orders_by_time.setdefault(float(times[index]), []).append(
+                ("sell", {"amount": self._to_python(exit_amounts[index])})
+            )
+        for index in np.flatnonzero(entries):
+            order_kwargs = {"amount": self._to_python(amounts[index])}
+            for key, offsets in ((STOP_LOSS_OFFSET, stop_loss_offsets), (TAKE_PROFIT_OFFSET, take_profit_offsets)):
+                offset = self._format_offset(offsets[index])
+                if offset is not None:
+                    order_kwargs[key] = offset
+            self.orders_by_time.setdefault(float(times[index]), []).append(("buy", order_kwargs))
+
+    def get_signal_times(self) -> list:
+        return sorted(self.orders_by_time)
+
+    def build_strategy(self):
+        """
+        :return: a strategy function creating the scheduled orders. At its first call, it restricts
+        backtesting iterations to signal times, to times when orders are open and to the backtesting
+        end time, where positions held until the end are valued.
+        """
+        whitelist_registered = [False]  # mutable container so the closure can mutate it
+
+        async def _signals_strategy(ctx):
+            # lazy import
+            import octobot_script as obs
+
+            if not whitelist_registered[0]:
+                backtesting = ctx.exchange_manager.exchange.backtesting
+                # backtesting stops as soon as the whitelist is exhausted: keep its end time in it
+                backtesting_api.register_backtesting_timestamp_whitelist(
+                    backtesting,
+                    self.get_signal_times() + [backtesting_api.get_backtesting_ending_time(backtesting)],
+                    lambda: bool(trading_api.get_open_orders(ctx.exchange_manager)),
+                )
+                whitelist_registered[0] = True
+            for side, order_kwargs in self.orders_by_time.get(obs.current_live_time(ctx), []):
+                await obs.market(ctx, side, **order_kwargs)
+        return _signals_strategy
+
+    @staticmethod
+    def _get_mask(signals, key, times):
+        if key not in signals:
+            return np.zeros(len(times), dtype=bool)
+        mask = np.asarray(signals[key], dtype=bool)
+        if mask.shape != times.shape:
+            raise ValueError(f"'{key}' signals must be aligned with '{TIME}': {mask.shape} != {times.shape}")
+        return mask
+
+    @staticmethod
+    def _get_values(values, times):
+        if values is None or np.ndim(values) == 0:
+            return np.full(len(times), values, dtype=object)
+        values = np.asarray(values)
+        if values.shape != times.shape:
+            raise ValueError(f"signals values must be aligned with '{TIME}': {values.shape} != {times.shape}")
+        return values
+
+    @staticmethod
+    def _to_python(value):
+        return value.item() if isinstance(value, np.generic) else value
+
+    @staticmethod
+    def _format_offset(offset):
+        if offset is None:
+            return None
+        if isinstance(offset, str):
+            return offset
+        if np.isnan(offset):
+            return None
+        return f"{float(offset)}%"
@@ -0,0 +1,103 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import collections
+import json
+import subprocess
+import sys
+import time
+
+
+IMPORT_STATEMENT = "import octobot_script"
+
+
+def profile_imports(statement=IMPORT_STATEMENT) -> list:
+    """
+    Run statement in a new python process and collect its modules import times.
+    :return: (module, self time, cumulative time) tuples in seconds, in import order
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    return parse_import_times(result.stderr)
+
+
+def parse_import_times(importtime_output) -> list:
+    import_times = []
+    for line in importtime_output.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_time, cumulative_time, module = line[len("import time:"):].split("|")
+        import_times.append((module.strip(), int(self_time) / 1_000_000, int(cumulative_time) / 1_000_000))
+    return import_times
+
+
+def get_import_time_by_package(import_times) -> dict:
+    """
+    :return: the import time of each top level package, sorted by decreasing time
+    """
+    time_by_package = collections.defaultdict(float)
+    for module, self_time, _ in import_times:
+        time_by_package[module.split(".")[0]] += self_time
+    return dict(sorted(time_by_package.items(), key=lambda package_time: package_time[1], reverse=True))
+
+
+def get_total_import_time(import_times, module) -> float:
+    return next(
+        (cumulative_time for imported_module, _, cumulative_time in import_times if imported_module == module),
+        0
+    )
+
+
+def measure_first_calls(symbol, time_frame, data_file) -> dict:
+    """
+    Measure in a new python process the time to import octobot_script, to load data_file using get_data
+    and to run an empty strategy on it.
+    :return: the elapsed time since the process started for each step, in seconds
+    """
+    result = subprocess.run(
+        [
+            sys.executable, "-c",
+            f"import {__name__} as startup_profiler; "
+            f"startup_profiler._print_first_calls_times({symbol!r}, {time_frame!r}, {data_file!r})"
+        ],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _print_first_calls_times(symbol, time_frame, data_file):
+    import asyncio
+    start_time = time.perf_counter()
+    times = {}
+    import octobot_script as obs
+    # octobot_script is lazily loaded: import its content as well
+    obs.load_tentacles()
+    times["import"] = time.perf_counter() - start_time
+
+    async def _empty_strategy(ctx):
+        pass
+
+    async def _first_calls():
+        data = await obs.get_data(symbol, time_frame, data_file=data_file)
+        times["first get_data"] = time.perf_counter() - start_time
+        await obs.run(data, {}, strategy_func=_empty_strategy, enable_storage=False)
+        times["first run"] = time.perf_counter() - start_time
+        await data.stop()
+
+    asyncio.run(_first_calls())
+    print(json.dumps(times))
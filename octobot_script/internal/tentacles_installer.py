@@ -0,0 +1,271 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import urllib.parse
+import urllib.request
+import zipfile
+
+import aiohttp
+import octobot_commons.logging as logging
+import octobot_tentacles_manager.api as tentacles_manager_api
+
+import octobot_script.constants as constants
+
+
+FILE_URL_SCHEME = "file"
+DOWNLOAD_URL_SCHEMES = {"http", "https"}
+DOWNLOADED_DATA_CHUNK_SIZE = 2 ** 16
+ARCHIVE_EXT = ".zip"
+CACHE_INDEX_FILE = "index.json"
+LOGGER = logging.get_logger("TentaclesInstaller")
+
+
+def is_download_url(path_or_url) -> bool:
+    return urllib.parse.urlparse(path_or_url).scheme in DOWNLOAD_URL_SCHEMES
+
+
+def get_local_archive_path(path_or_url) -> str:
+    parsed_url = urllib.parse.urlparse(path_or_url)
+    if parsed_url.scheme == FILE_URL_SCHEME:
+        return urllib.request.url2pathname(parsed_url.path)
+    return path_or_url
+
+
+async def fetch_archives(paths_or_urls, target_dir,
+                         max_connections=constants.DEFAULT_TENTACLES_DOWNLOAD_CONNECTIONS,
+                         aiohttp_session=None, cache_path=None, from_cache=False,
+                         cache_max_size=constants.DEFAULT_TENTACLES_CACHE_MAX_SIZE) -> list:
+    """
+    :return: the local path of each archive, in the paths_or_urls order, None for archives that could not be
+    downloaded. Archives are downloaded concurrently, local and file:// archives are used as is.
+    When cache_path is set, downloaded archives are added to this cache, which is then pruned to
+    cache_max_size bytes, and, when from_cache is True, cached archives are used instead of being
+    downloaded again.
+    """
+    archives = [
+        get_cached_archive(cache_path, path_or_url)
+        if from_cache and cache_path and is_download_url(path_or_url) else None
+        for path_or_url in paths_or_urls
+    ]
+    to_download = [
+        index
+        for index, path_or_url in enumerate(paths_or_urls)
+        if archives[index] is None and is_download_url(path_or_url)
+    ]
+    if aiohttp_session is None and to_download:
+        connector = aiohttp.TCPConnector(limit=max_connections)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await fetch_archives(paths_or_urls, target_dir, aiohttp_session=session,
+                                        cache_path=cache_path, from_cache=from_cache,
+                                        cache_max_size=cache_max_size)
+    downloaded_archives = await asyncio.gather(*(
+        _download_archive(paths_or_urls[index], os.path.join(target_dir, f"{index}{ARCHIVE_EXT}"), aiohttp_session)
+        for index in to_download
+    ))
+    for index, downloaded_archive in zip(to_download, downloaded_archives):
+        archives[index] = cache_archive(cache_path, paths_or_urls[index], downloaded_archive) \
+            if cache_path and downloaded_archive else downloaded_archive
+    if cache_path and os.path.isdir(cache_path):
+        prune_cache(cache_path, cache_max_size, [archive for archive in archives if archive is not None])
+    return [
+        archive if archive is not None or is_download_url(path_or_url) else get_local_archive_path(path_or_url)
+        for path_or_url, archive in zip(paths_or_urls, archives)
+    ]
+
+
+def get_archive_hash(archive) -> str:
+    archive_hash = hashlib.sha256()
+    with open(archive, "rb") as archive_file:
+        for chunk in iter(lambda: archive_file.read(DOWNLOADED_DATA_CHUNK_SIZE), b""):
+            archive_hash.update(chunk)
+    return archive_hash.hexdigest()
+
+
+def get_cached_archive(cache_path, url):
+    """
+    :return: the cached archive of url or None when it is not cached or when its content changed
+    """
+    archive_hash = _load_cache_index(cache_path).get(url)
+    if archive_hash is None:
+        return None
+    archive = _get_cached_archive_path(cache_path, archive_hash)
+    if os.path.isfile(archive) and get_archive_hash(archive) == archive_hash:
+        LOGGER.debug(f"Using cached {url} archive")
+        # keep track of the last use of this archive for cache pruning
+        os.utime(archive)
+        return archive
+    LOGGER.warning(f"Ignoring invalid cached {url} archive")
+    if os.path.isfile(archive):
+        os.remove(archive)
+    return None
+
+
+def cache_archive(cache_path, url, archive) -> str:
+    """
+    Adds archive to the cache, archives are stored by content hash and indexed by url.
+    :return: the cached archive path
+    """
+    os.makedirs(cache_path, exist_ok=True)
+    archive_hash = get_archive_hash(archive)
+    cached_archive = _get_cached_archive_path(cache_path, archive_hash)
+    # cached archives are named after their content hash: an archive of the same size is the same archive,
+    # corrupted ones are detected when they are read from cache
+    if not os.path.isfile(cached_archive) or os.path.getsize(cached_archive) != os.path.getsize(archive):
+        temp_archive = f"{cached_archive}.part"
+        shutil.copyfile(archive, temp_archive)
+        os.replace(temp_archive, cached_archive)
+    else:
+        os.utime(cached_archive)
+    cache_index = _load_cache_index(cache_path)
+    cache_index[url] = archive_hash
+    _save_cache_index(cache_path, cache_index)
+    return cached_archive
+
+
+def prune_cache(cache_path, max_size, kept_archives=None):
+    """
+    Removes the cached archives that are not indexed anymore, then the least recently used ones
+    until the cache size is at most max_size bytes. kept_archives are never removed.
+    """
+    kept_archives = set(kept_archives or [])
+    cache_index = _load_cache_index(cache_path)
+    indexed_hashes = set(cache_index.values())
+    cached_archives = []
+    for file_name in os.listdir(cache_path):
+        if not file_name.endswith(ARCHIVE_EXT):
+            continue
+        archive = os.path.join(cache_path, file_name)
+        archive_hash = file_name[:-len(ARCHIVE_EXT)]
+        if archive_hash in indexed_hashes or archive in kept_archives:
+            stat = os.stat(archive)
+            cached_archives.append((stat.st_mtime_ns, stat.st_size, archive_hash, archive))
+        else:
+            LOGGER.debug(f"Removing unused cached archive {file_name}")
+            os.remove(archive)
+    cache_size = sum(size for _, size, _, _ in cached_archives)
+    removed_hashes = set()
+    for _, size, archive_hash, archive in sorted(cached_archives):
+        if cache_size <= max_size:
+            break
+        if archive in kept_archives:
+            continue
+        LOGGER.debug(f"Removing least recently used cached archive {os.path.basename(archive)}")
+        os.remove(archive)
+        removed_hashes.add(archive_hash)
+        cache_size -= size
+    if removed_hashes:
+        _save_cache_index(cache_path, {
+            url: archive_hash
+            for url, archive_hash in cache_index.items()
+            if archive_hash not in removed_hashes
+        })
+
+
+def merge_archives(archives, merged_archive) -> str:
+    """
+    Writes the content of every archive into merged_archive.
+    Files provided by several archives are taken from the last one, as when installing them one after the other.
+    """
+    members = {}
+    for archive in archives:
+        with zipfile.ZipFile(archive) as zipped_archive:
+            for member in zipped_archive.infolist():
+                members[member.filename] = archive
+    with zipfile.ZipFile(merged_archive, "w", compression=zipfile.ZIP_DEFLATED) as merged:
+        for archive in archives:
+            with zipfile.ZipFile(archive) as zipped_archive:
+                for member in zipped_archive.infolist():
+                    if members[member.filename] == archive:
+                        merged.writestr(member, zipped_archive.read(member))
+    return merged_archive
+
+
+async def install_archives(paths_or_urls, tentacles_path, install_path, quite_mode=False,
+                           max_connections=constants.DEFAULT_TENTACLES_DOWNLOAD_CONNECTIONS,
+                           cache_path=None, from_cache=False) -> int:
+    """
+    Fetches every tentacles archive concurrently and installs them all at once,
+    the tentacles setup config is therefore only refreshed one time.
+    See fetch_archives for cache_path and from_cache.
+    :return: the download and installation errors count
+    """
+    if not paths_or_urls:
+        return 0
+    with tempfile.TemporaryDirectory() as temp_dir:
+        archives = [
+            archive
+            for archive in await fetch_archives(paths_or_urls, temp_dir, max_connections=max_connections,
+                                                cache_path=cache_path, from_cache=from_cache)
+            if archive is not None
+        ]
+        download_error_count = len(paths_or_urls) - len(archives)
+        if not archives:
+            return download_error_count
+        archive = archives[0] if len(archives) == 1 else \
+            merge_archives(archives, os.path.join(temp_dir, "merged_tentacles.zip"))
+        return download_error_count + await tentacles_manager_api.install_all_tentacles(
+            archive,
+            tentacle_path=tentacles_path,
+            bot_path=install_path,
+            quite_mode=quite_mode,
+            bot_install_dir=install_path
+        )
+
+
+async def _download_archive(url, target_file, aiohttp_session):
+    """
+    :return: the downloaded archive path or None when the download failed
+    """
+    LOGGER.debug(f"Downloading {url}")
+    try:
+        async with aiohttp_session.get(url) as response:
+            response.raise_for_status()
+            with open(target_file, "wb") as archive:
+                async for chunk in response.content.iter_chunked(DOWNLOADED_DATA_CHUNK_SIZE):
+                    archive.write(chunk)
+        return target_file
+    except Exception as err:
+        LOGGER.error(f"Failed to download {url} tentacles archive: {err}")
+        return None
+
+
+def _get_cache_index_path(cache_path) -> str:
+    return os.path.join(cache_path, CACHE_INDEX_FILE)
+
+
+def _get_cached_archive_path(cache_path, archive_hash) -> str:
+    return os.path.join(cache_path, f"{archive_hash}{ARCHIVE_EXT}")
+
+
+def _save_cache_index(cache_path, cache_index):
+    temp_index = f"{_get_cache_index_path(cache_path)}.part"
+    with open(temp_index, "w") as index_file:
+        json.dump(cache_index, index_file, indent=2, sort_keys=True)
+    os.replace(temp_index, _get_cache_index_path(cache_path))
+
+
+def _load_cache_index(cache_path) -> dict:
+    try:
+        with open(_get_cache_index_path(cache_path)) as index_file:
+            return json.load(index_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
@@ -15,4 +15,7 @@
 #  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
 
 from octobot_script.model.strategy import *
+from octobot_script.model.backtest_metrics import *
 from octobot_script.model.backtest_result import *
+from octobot_script.model.sweep_results import *
+from octobot_script.model.optimization_result import *
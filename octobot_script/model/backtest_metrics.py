@@ -0,0 +1,58 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+class BacktestMetrics:
+    """
+    Scalar metrics of a backtest run, kept instead of a BacktestResult when running
+    in metrics only mode so that large sweeps do not reference any backtesting instance.
+    Percent values are averaged over the run exchanges.
+    """
+    __slots__ = (
+        "strategy_config",
+        "bot_id",
+        "duration",
+        "candles_count",
+        "profitability",
+        "market_average_profitability",
+        "end_portfolio_value",
+        "trades_count",
+        "max_drawdown",
+        "pruned",
+    )
+
+    def __init__(self, strategy_config, bot_id=None, duration=None, candles_count=None,
+                 profitability=None, market_average_profitability=None, end_portfolio_value=None,
+                 trades_count=None, max_drawdown=None, pruned=False):
+        self.strategy_config = strategy_config
+        self.bot_id = bot_id
+        self.duration = duration
+        self.candles_count = candles_count
+        self.profitability = profitability
+        self.market_average_profitability = market_average_profitability
+        self.end_portfolio_value = end_portfolio_value
+        self.trades_count = trades_count
+        self.max_drawdown = max_drawdown
+        self.pruned = pruned
+
+    def describe(self):
+        return f"{'[pruned] ' if self.pruned else ''}" \
+               f"[{round(self.duration, 3)}s / {self.candles_count} candles] profitability: {self.profitability} " \
+               f"market average: {self.market_average_profitability} " \
+               f"trades: {self.trades_count} max drawdown: {self.max_drawdown} " \
+               f"strategy_config: {self.strategy_config}"
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
@@ -13,12 +13,12 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
 import html
 import os
 import re
 import shutil
 import time
-import json
 
 import octobot_commons.constants as commons_constants
 import octobot_commons.display as display
@@ -28,6 +28,9 @@ import octobot.api as octobot_api
 import octobot_tentacles_manager.api as tentacles_manager_api
 import octobot_script.resources as resources
 import octobot_script.internal.backtester_trading_mode as backtester_trading_mode
+import octobot_script.internal.report_files as report_files
+import octobot_script.internal.chart_series as chart_series
+import octobot_script.internal.chart_lod as chart_lod
 from octobot_script.model.backtest_report_server import BacktestReportServer
 
 
@@ -38,12 +41,22 @@ class BacktestPlot:
     REPORT_DATA_FILENAME = "report_data.json"
     REPORT_META_FILENAME = "report_meta.json"
     REPORT_BUNDLE_FILENAME = "report.json"
+    REPORT_SERIES_FILENAME = "report_series.npz"
+    # compression of the report bundle: None, report_files.GZIP or report_files.ZSTD (requires zstandard)
+    REPORT_COMPRESSION = report_files.DEFAULT_COMPRESSION
+    # encoding of chart elements numeric series: None (JSON arrays) or chart_series.BASE64 (float64 arrays)
+    REPORT_SERIES_ENCODING = chart_series.BASE64
+    # chart elements with more points are downsampled in the report and detailed when zooming,
+    # None to always include every point
+    REPORT_SERIES_MAX_POINTS = chart_lod.DEFAULT_MAX_POINTS
     HISTORY_DIR = "backtesting"
     HISTORY_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
     GENERATED_TIME_FORMAT = "%Y-%m-%d at %H:%M:%S"
     SERVER_PORT = 5555
     SERVER_HOST = "localhost"
     SERVE_TIMEOUT = 300  # seconds — keep server alive for history browsing
+    # maximum symbol and time frame analysis run at the same time when generating the report
+    ANALYSIS_CONCURRENCY = 4
 
     def __init__(self, backtest_result, run_db_identifier, report_file=None):
         self.backtest_result = backtest_result
@@ -60,38 +73,50 @@ class BacktestPlot:
         shutil.copy2(
             resources.get_report_resource_path(template_name), self.report_file
         )
-        meta = template_data["meta"]
-        with open(
-            os.path.join(report_dir, self.REPORT_DATA_FILENAME), "w", encoding="utf-8"
-        ) as f:
-            f.write(template_data["full_data"])
-        with open(
-            os.path.join(report_dir, self.REPORT_META_FILENAME), "w", encoding="utf-8"
-        ) as f:
-            json.dump(meta, f)
-        bundle = {"meta": meta, "data": json.loads(template_data["full_data"])}
-        with open(
-            os.path.join(report_dir, self.REPORT_BUNDLE_FILENAME), "w", encoding="utf-8"
-        ) as f:
-            json.dump(bundle, f)
-        self._save_history_entry(report_dir, template_data["full_data"], meta, bundle)
+        series_levels = {}
+        if self.REPORT_SERIES_MAX_POINTS is not None:
+            series_levels = chart_lod.set_levels_of_detail(
+                template_data["full_data"], max_points=self.REPORT_SERIES_MAX_POINTS
+            )
+        if self.REPORT_SERIES_ENCODING == chart_series.BASE64:
+            chart_series.encode_chart_series(template_data["full_data"])
+        # encode report elements only once: the bundle is written from the encoded parts
+        encoded_meta = report_files.dumps(template_data["meta"])
+        encoded_data = report_files.dumps(template_data["full_data"])
+        run_dir = self._save_history_entry(report_dir, encoded_data, encoded_meta, series_levels)
+        # report files are links to the history entry ones
+        for filename in (self.REPORT_META_FILENAME, self.REPORT_BUNDLE_FILENAME, self.REPORT_SERIES_FILENAME):
+            found = report_files.find_file(os.path.join(run_dir, filename))
+            target_path = None
+            if found is not None:
+                source_path, _ = found
+                target_path = os.path.join(report_dir, os.path.basename(source_path))
+                report_files.link_or_copy(source_path, target_path)
+            # remove outdated versions from previous reports
+            report_files.remove_file_variants(os.path.join(report_dir, filename), keep=target_path)
+        # data is included in the bundle
+        report_files.remove_file_variants(os.path.join(report_dir, self.REPORT_DATA_FILENAME))
 
-    def _save_history_entry(self, report_dir, data_str, meta, bundle):
+    def _save_history_entry(self, report_dir, encoded_data, encoded_meta, series_levels):
         ts = time.strftime(self.HISTORY_TIMESTAMP_FORMAT)
         run_dir = os.path.join(report_dir, self.HISTORY_DIR, ts)
         os.makedirs(run_dir, exist_ok=True)
-        with open(
-            os.path.join(run_dir, self.REPORT_DATA_FILENAME), "w", encoding="utf-8"
-        ) as f:
-            f.write(data_str)
-        with open(
-            os.path.join(run_dir, self.REPORT_META_FILENAME), "w", encoding="utf-8"
-        ) as f:
-            json.dump(meta, f)
-        with open(
-            os.path.join(run_dir, self.REPORT_BUNDLE_FILENAME), "w", encoding="utf-8"
-        ) as f:
-            json.dump(bundle, f)
+        report_files.write_json_parts(
+            os.path.join(run_dir, self.REPORT_META_FILENAME), encoded_meta
+        )
+        bundle_file = report_files.write_bundle(
+            os.path.join(run_dir, self.REPORT_BUNDLE_FILENAME), encoded_meta, encoded_data,
+            compression=self.REPORT_COMPRESSION,
+        )
+        report_files.remove_file_variants(
+            os.path.join(run_dir, self.REPORT_BUNDLE_FILENAME), keep=bundle_file
+        )
+        series_file = os.path.join(run_dir, self.REPORT_SERIES_FILENAME)
+        if series_levels:
+            chart_lod.write_levels(series_file, series_levels)
+        else:
+            report_files.remove_file_variants(series_file)
+        return run_dir
 
     def show(self):
         import octobot_script.internal.octobot_mocks as octobot_mocks
@@ -112,6 +137,7 @@ class BacktestPlot:
             data_filename=self.REPORT_DATA_FILENAME,
             meta_filename=self.REPORT_META_FILENAME,
             bundle_filename=self.REPORT_BUNDLE_FILENAME,
+            series_filename=self.REPORT_SERIES_FILENAME,
         )
         server.user_data_dir = user_data_dir
         server.serve()
@@ -139,8 +165,7 @@ class BacktestPlot:
     @staticmethod
     def _extract_summary_metrics(full_data):
         try:
-            parsed = json.loads(full_data)
-            sub_elements = parsed.get("data", {}).get("sub_elements", [])
+            sub_elements = full_data.get("data", {}).get("sub_elements", [])
             details = next(
                 (
                     element
@@ -211,6 +236,10 @@ class BacktestPlot:
         symbols = []
         time_frames = []
         exchanges = []
+        combinations_by_exchange = {}
+        config_time_frames = octobot_api.get_independent_backtesting_config(
+            self.backtest_result.independent_backtesting
+        )[commons_constants.CONFIG_TIME_FRAME]
         for (
             exchange,
             available_symbols,
@@ -218,43 +247,64 @@ class BacktestPlot:
             self.backtest_result.independent_backtesting
         ).items():
             exchanges.append(exchange)
+            combinations = combinations_by_exchange.setdefault(exchange, [])
             for symbol in available_symbols:
                 symbol = str(symbol)
                 symbols.append(symbol)
-                for time_frame in octobot_api.get_independent_backtesting_config(
-                    self.backtest_result.independent_backtesting
-                )[commons_constants.CONFIG_TIME_FRAME]:
+                for time_frame in config_time_frames:
                     time_frames.append(time_frame.value)
-                    await elements.fill_from_database(
-                        trading_mode,
-                        self.run_db_identifier,
-                        exchange,
-                        symbol,
-                        time_frame.value,
-                        None,
-                        with_inputs=False,
-                    )
-                    ctx = scripting_library.Context.minimal(
-                        trading_mode,
-                        logger,
-                        exchange,
-                        symbol,
-                        self.run_db_identifier.backtesting_id,
-                        self.run_db_identifier.optimizer_id,
-                        self.run_db_identifier.optimization_campaign_name,
-                        self.backtesting_analysis_settings,
+                    combinations.append((exchange, symbol, time_frame.value))
+        semaphore = asyncio.Semaphore(self.ANALYSIS_CONCURRENCY)
+        # each combination reads the run databases on its own: combinations are only gathered one exchange
+        # after the other
+        for combinations in combinations_by_exchange.values():
+            results = await asyncio.gather(
+                *(
+                    self._get_analysis_elements(
+                        scripting_library, semaphore, trading_mode, logger, exchange, symbol, time_frame
                     )
-                    try:
-                        elements.add_parts_from_other(
-                            await scripting_library.default_backtesting_analysis_script(
-                                ctx
-                            )
-                        )
-                    except Exception as err:
-                        logger.error(
-                            f"Failed to build advanced analysis for {exchange} {symbol} {time_frame.value}: {err}"
-                        )
-        return json.dumps(elements.to_json()), symbols, time_frames, exchanges
+                    for exchange, symbol, time_frame in combinations
+                )
+            )
+            # results are in combinations order: as when filling a single display translator one combination
+            # after the other, parts of later combinations replace the same name parts of previous ones
+            for filled_elements, analysis_elements in results:
+                elements.add_parts_from_other(filled_elements)
+                if analysis_elements is not None:
+                    elements.add_parts_from_other(analysis_elements)
+        return elements.to_json(), symbols, time_frames, exchanges
+
+    async def _get_analysis_elements(
+        self, scripting_library, semaphore, trading_mode, logger, exchange, symbol, time_frame
+    ):
+        async with semaphore:
+            filled_elements = display.display_translator_factory()
+            await filled_elements.fill_from_database(
+                trading_mode,
+                self.run_db_identifier,
+                exchange,
+                symbol,
+                time_frame,
+                None,
+                with_inputs=False,
+            )
+            ctx = scripting_library.Context.minimal(
+                trading_mode,
+                logger,
+                exchange,
+                symbol,
+                self.run_db_identifier.backtesting_id,
+                self.run_db_identifier.optimizer_id,
+                self.run_db_identifier.optimization_campaign_name,
+                self.backtesting_analysis_settings,
+            )
+            try:
+                return filled_elements, await scripting_library.default_backtesting_analysis_script(ctx)
+            except Exception as err:
+                logger.error(
+                    f"Failed to build advanced analysis for {exchange} {symbol} {time_frame}: {err}"
+                )
+                return filled_elements, None
 
     def _resolve_trading_mode_class(self):
         trading_mode_name = getattr(self.run_db_identifier, "tentacle_class", None)
@@ -19,12 +19,20 @@ import json
 import os
 import shutil
 import threading
+import urllib.parse
 import webbrowser
 import http.server
 import socketserver
 
 import octobot_commons.logging as logging
 
+import octobot_script.internal.report_files as report_files
+import octobot_script.internal.chart_lod as chart_lod
+import octobot_script.internal.chart_series as chart_series
+
+# visible range points of chart elements having levels of detail
+SERIES_ENDPOINT = "series.json"
+
 
 class BacktestReportServer:
     def __init__(
@@ -40,6 +48,7 @@ class BacktestReportServer:
         data_filename,
         meta_filename,
         bundle_filename,
+        series_filename=None,
     ):
         self.report_file = report_file
         self.report_dir = report_dir
@@ -52,6 +61,7 @@ class BacktestReportServer:
         self.data_filename = data_filename
         self.meta_filename = meta_filename
         self.bundle_filename = bundle_filename
+        self.series_filename = series_filename
         self.logger = logging.get_logger(self.__class__.__name__)
 
     @staticmethod
@@ -87,15 +97,14 @@ class BacktestReportServer:
         if os.path.isfile(meta_path):
             with open(meta_path, encoding="utf-8") as f:
                 return json.load(f)
-        with open(bundle_path, encoding="utf-8") as f:
-            return json.load(f).get("meta", {})
+        return json.loads(report_files.read_file(bundle_path)).get("meta", {})
 
     def _has_report_data(self, root_path):
         data_path = os.path.join(root_path, self.data_filename)
         meta_path = os.path.join(root_path, self.meta_filename)
         bundle_path = os.path.join(root_path, self.bundle_filename)
-        return os.path.isfile(bundle_path) or (
-            os.path.isfile(meta_path) and os.path.isfile(data_path)
+        return report_files.find_file(bundle_path) is not None or (
+            os.path.isfile(meta_path) and report_files.find_file(data_path) is not None
         )
 
     def _collect_history_entries(self):
@@ -145,20 +154,73 @@ class BacktestReportServer:
                         self.bundle_filename,
                         self.data_filename,
                         self.meta_filename,
+                        self.series_filename,
                     ):
-                        file_path = os.path.join(run_dir, filename)
-                        if os.path.isfile(file_path):
-                            try:
-                                os.remove(file_path)
-                                removed_any = True
-                            except Exception:
-                                pass
+                        if filename is None:
+                            continue
+                        for file_path in report_files.get_file_variants(
+                            os.path.join(run_dir, filename)
+                        ):
+                            if os.path.isfile(file_path):
+                                try:
+                                    os.remove(file_path)
+                                    removed_any = True
+                                except Exception:
+                                    pass
                     if removed_any:
                         cleared_run_reports += 1
         except Exception:
             pass
         return cleared_history_dirs, cleared_run_reports
 
+    def _get_series(self, run_dir, query):
+        """
+        :return: the series points of the element and visible range of the given query, None when unavailable
+        :raises ValueError: when the query is invalid
+        """
+        params = urllib.parse.parse_qs(query)
+        try:
+            element_id = params["element"][0]
+            start = float(params["start"][0])
+            end = float(params["end"][0])
+            max_points = min(
+                int(params.get("points", [chart_lod.DEFAULT_MAX_POINTS])[0]),
+                chart_lod.MAX_REQUESTED_POINTS,
+            )
+        except (KeyError, IndexError) as err:
+            raise ValueError(f"Missing series parameter: {err}") from err
+        if self.series_filename is None:
+            return None
+        series_path = os.path.join(run_dir, self.series_filename)
+        if not os.path.isfile(series_path):
+            return None
+        visible_range = chart_lod.get_visible_range(
+            series_path, element_id, start, end, max_points=max(max_points, 1)
+        )
+        if visible_range is None:
+            return None
+        factor, series = visible_range
+        return {
+            "element": element_id,
+            "factor": factor,
+            **{key: chart_series.encode_array(values) for key, values in series.items()},
+        }
+
+    def _get_report_filenames(self):
+        return {self.data_filename, self.meta_filename, self.bundle_filename}
+
+    @staticmethod
+    def _accepts_encoding(accept_encoding, encoding):
+        for accepted in accept_encoding.split(","):
+            name, _, params = accepted.strip().partition(";")
+            if name.strip().lower() in (encoding, "*"):
+                quality = params.strip()
+                try:
+                    return not (quality.startswith("q=") and float(quality[2:]) == 0)
+                except ValueError:
+                    return True
+        return False
+
     def _create_handler(self):
         server = self
 
@@ -172,7 +234,7 @@ class BacktestReportServer:
                 self.wfile.write(body)
 
             def do_GET(self):
-                path = self.path.split("?")[0]
+                path, _, query = self.path.partition("?")
                 if path == "/history.json":
                     history = [
                         {
@@ -185,21 +247,58 @@ class BacktestReportServer:
                     self._send_json(history)
                     return
                 if path.startswith("/history/"):
-                    self._serve_history_file(path)
+                    self._serve_history_file(path, query)
+                    return
+                if path == f"/{SERIES_ENDPOINT}":
+                    self._send_series(server.report_dir, query)
+                    return
+                if path.lstrip("/") in server._get_report_filenames():
+                    self._send_report_file(
+                        os.path.join(server.report_dir, path.lstrip("/"))
+                    )
                     return
                 super().do_GET()
 
-            def _serve_history_file(self, path):
+            def _send_report_file(self, file_path):
+                found = report_files.find_file(file_path)
+                if found is None:
+                    self.send_error(404)
+                    return
+                stored_path, compression = found
+                with open(stored_path, "rb") as f:
+                    body = f.read()
+                if compression is not None and not server._accepts_encoding(
+                    self.headers.get("Accept-Encoding", ""), compression
+                ):
+                    body = report_files.decompress(body, compression)
+                    compression = None
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                if compression is not None:
+                    self.send_header("Content-Encoding", compression)
+                self.send_header("Vary", "Accept-Encoding")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send_series(self, run_dir, query):
+                try:
+                    series = server._get_series(run_dir, query)
+                except ValueError:
+                    self.send_error(400)
+                    return
+                if series is None:
+                    self.send_error(404)
+                    return
+                self._send_json(series)
+
+            def _serve_history_file(self, path, query=""):
                 parts = path.strip("/").split("/")
                 if len(parts) != 3 or parts[0] != "history":
                     self.send_error(404)
                     return
                 run_id, filename = parts[1], parts[2]
-                if filename not in {
-                    server.data_filename,
-                    server.meta_filename,
-                    server.bundle_filename,
-                }:
+                if filename != SERIES_ENDPOINT and filename not in server._get_report_filenames():
                     self.send_error(404)
                     return
                 # Decode the base64 path directly instead of re-scanning the filesystem,
@@ -221,17 +320,10 @@ class BacktestReportServer:
                 if not any(abs_decoded.startswith(root) for root in allowed_roots):
                     self.send_error(404)
                     return
-                file_path = os.path.join(decoded_path, filename)
-                if not os.path.isfile(file_path):
-                    self.send_error(404)
+                if filename == SERIES_ENDPOINT:
+                    self._send_series(decoded_path, query)
                     return
-                with open(file_path, "rb") as f:
-                    body = f.read()
-                self.send_response(200)
-                self.send_header("Content-Type", "application/json")
-                self.send_header("Content-Length", str(len(body)))
-                self.end_headers()
-                self.wfile.write(body)
+                self._send_report_file(os.path.join(decoded_path, filename))
 
             def do_POST(self):
                 path = self.path.split("?")[0]
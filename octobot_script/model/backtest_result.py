@@ -29,9 +29,13 @@ class BacktestResult:
         self.candles_count = None
         self.report = {}
         self.bot_id = None
+        self.metrics = None
+        # True when the run has been stopped early
+        self.pruned = False
 
     def describe(self):
-        return f"[{round(self.duration, 3)}s / {self.candles_count} candles] profitability: {self.report['bot_report']['profitability']} " \
+        return f"{'[pruned] ' if self.pruned else ''}" \
+               f"[{round(self.duration, 3)}s / {self.candles_count} candles] profitability: {self.report['bot_report']['profitability']} " \
                f"market average: {self.report['bot_report']['market_average_profitability']} " \
                f"strategy_config: {self.strategy_config}"
 
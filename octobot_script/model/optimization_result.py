@@ -0,0 +1,72 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+import octobot_script.model.sweep_results as sweep_results
+
+
+class OptimizationTrial:
+    __slots__ = ("strategy_config", "metrics", "value", "cached", "error")
+
+    def __init__(self, strategy_config, metrics, value, cached=False, error=None):
+        self.strategy_config = strategy_config
+        # BacktestMetrics of the run, None when the run failed
+        self.metrics = metrics
+        # objective value, None when the run has been pruned or failed
+        self.value = value
+        self.cached = cached
+        # exception raised by the run when it failed
+        self.error = error
+
+    def describe(self):
+        if self.metrics is None:
+            return f"failed: {self.error} {self.strategy_config}"
+        return f"objective: {'pruned' if self.value is None else self.value} {self.metrics.describe()}"
+
+
+class OptimizationResult:
+    def __init__(self, trials, maximize=True):
+        self.trials = trials
+        self.maximize = maximize
+
+    def best(self, k=1) -> list:
+        """
+        :return: the k best trials, pruned runs excluded
+        """
+        return sorted(
+            (trial for trial in self.trials if trial.value is not None),
+            key=lambda trial: trial.value,
+            reverse=self.maximize
+        )[:k]
+
+    @property
+    def best_trial(self):
+        best = self.best()
+        return best[0] if best else None
+
+    @property
+    def best_config(self):
+        return None if self.best_trial is None else self.best_trial.strategy_config
+
+    @property
+    def best_metrics(self):
+        return None if self.best_trial is None else self.best_trial.metrics
+
+    def to_sweep_results(self):
+        results = sweep_results.SweepResults()
+        results.extend(trial.metrics for trial in self.trials if trial.metrics is not None)
+        return results
+
+    def describe(self, k=5):
+        return "\n".join(trial.describe() for trial in self.best(k))
@@ -0,0 +1,177 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import csv
+import numbers
+
+import numpy as np
+
+import octobot_script.model.backtest_metrics as backtest_metrics
+
+
+CONFIG_COLUMN_PREFIX = "config."
+METRICS_COLUMNS = tuple(
+    key for key in backtest_metrics.BacktestMetrics.__slots__ if key not in ("strategy_config", "bot_id")
+)
+INITIAL_CAPACITY = 1024
+
+
+class SweepResults:
+    """
+    Columnar table of sweep runs: each added BacktestResult or BacktestMetrics appends its scalar metrics and its
+    flattened strategy_config (as "config.<key>" columns) to numpy columns.
+    Numeric columns are float64 arrays (NaN when missing), other values are stored in object arrays.
+    """
+    def __init__(self, columns=None):
+        self._columns = {name: np.asarray(values) for name, values in (columns or {}).items()}
+        self._size = self._capacity = len(next(iter(self._columns.values()))) if self._columns else 0
+
+    def add(self, result):
+        metrics = result.metrics if hasattr(result, "metrics") else result
+        row = {column: getattr(metrics, column) for column in METRICS_COLUMNS}
+        row.update(
+            (f"{CONFIG_COLUMN_PREFIX}{key}", value)
+            for key, value in _flatten(metrics.strategy_config)
+        )
+        self._ensure_capacity(self._size + 1)
+        for name, value in row.items():
+            self._set_value(name, value)
+        self._size += 1
+
+    def extend(self, results):
+        for result in results:
+            self.add(result)
+
+    @property
+    def columns(self) -> list:
+        return list(self._columns)
+
+    def column(self, name) -> np.ndarray:
+        return self._columns[name][:self._size]
+
+    def __getitem__(self, name) -> np.ndarray:
+        return self.column(name)
+
+    def __len__(self):
+        return self._size
+
+    def to_dict(self) -> dict:
+        return {name: self.column(name) for name in self._columns}
+
+    def filter(self, mask):
+        """
+        :param mask: boolean array, ex: results["max_drawdown"] < 10
+        :return: a new SweepResults with the selected rows
+        """
+        return self.take(np.flatnonzero(mask))
+
+    def sort(self, by, ascending=True):
+        return self.take(_argsort(self.column(by), ascending))
+
+    def top(self, k, by, ascending=False):
+        """
+        :return: a new SweepResults with the k best rows according to the by column, ordered
+        """
+        values = self.column(by)
+        if k < len(values) and values.dtype != object:
+            # only sort the k best values
+            candidates = np.sort(np.argpartition(values if ascending else -values, k - 1)[:k])
+        else:
+            candidates = np.arange(len(values))
+        return self.take(candidates[_argsort(values[candidates], ascending)[:k]])
+
+    def take(self, indexes):
+        return SweepResults({name: self.column(name)[indexes] for name in self._columns})
+
+    def to_csv(self, file_path):
+        with open(file_path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(self.columns)
+            writer.writerows(zip(*(self.column(name).tolist() for name in self._columns)))
+
+    def to_parquet(self, file_path):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as err:
+            raise ImportError("pyarrow is required to export sweep results to Parquet") from err
+        pyarrow.parquet.write_table(
+            pyarrow.table({
+                # object columns can mix value types which parquet columns can't: store them as strings
+                name: [None if value is None else str(value) for value in self.column(name).tolist()]
+                if self.column(name).dtype == object else self.column(name)
+                for name in self._columns
+            }),
+            file_path
+        )
+
+    def _set_value(self, name, value):
+        if name not in self._columns:
+            self._columns[name] = _new_column(value, self._capacity)
+        column = self._columns[name]
+        if column.dtype != object and not _is_number(value):
+            column = self._columns[name] = _to_object_column(column)
+        column[self._size] = np.nan if value is None and column.dtype != object else value
+
+    def _ensure_capacity(self, size):
+        if size <= self._capacity:
+            return
+        self._capacity = max(INITIAL_CAPACITY, self._capacity * 2)
+        for name, column in self._columns.items():
+            grown_column = _empty_column(column.dtype, self._capacity)
+            grown_column[:self._size] = column[:self._size]
+            self._columns[name] = grown_column
+
+
+def _flatten(config, prefix=""):
+    if not isinstance(config, dict):
+        if config is not None:
+            yield prefix.rstrip(".") or "value", config
+        return
+    for key, value in config.items():
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", value
+
+
+def _is_number(value):
+    return value is None or (isinstance(value, numbers.Real) and not isinstance(value, bool))
+
+
+def _empty_column(dtype, capacity):
+    if dtype == object:
+        return np.full(capacity, None, dtype=object)
+    return np.full(capacity, np.nan, dtype=np.float64)
+
+
+def _new_column(value, capacity):
+    return _empty_column(np.float64 if _is_number(value) else object, capacity)
+
+
+def _to_object_column(column):
+    object_column = column.astype(object)
+    object_column[np.isnan(column)] = None
+    return object_column
+
+
+def _argsort(values, ascending):
+    if ascending:
+        return np.argsort(values, kind="stable")
+    if values.dtype == object:
+        return np.argsort(values, kind="stable")[::-1]
+    # keep NaN values last and equal values in their original order
+    return np.argsort(-values, kind="stable")
@@ -2,6 +2,7 @@
 
 import type { ChartElement } from "@/types"
 import { useEffect, useRef } from "react"
+import { fetchSeriesRange } from "@/lib/series"
 import { cn } from "@/lib/utils"
 import {
   ColorType,
@@ -22,6 +23,9 @@ const CANDLE_COLORS = {
   down: "#f6465d",
 }
 
+// wait for the visible range to settle before loading detailed series
+const LOD_DEBOUNCE_MS = 250
+
 interface LegendItem {
   key: string
   label: string
@@ -36,15 +40,42 @@ interface MarkerPoint {
   text: string
 }
 
+interface MarkerTarget {
+  series: any
+  timeSet: Set<number>
+  el: ChartElement | null
+}
+
 interface AppliedElement {
+  el: ChartElement
   series: any | null
   markers: MarkerPoint[]
   isCandles: boolean
   timeSet: Set<number>
 }
 
+interface Pane {
+  applied: AppliedElement[]
+  refreshMarkers: () => void
+}
+
+interface TimePoint {
+  time: UTCTimestamp
+}
+
+// x values in milliseconds are displayed in seconds
+function getTimeScale(el: ChartElement): number {
+  if (!el.x) return 1
+  for (let i = 0; i < el.x.length; i += 1) {
+    const raw = el.x[i]
+    if (typeof raw === "number" && Number.isFinite(raw)) return raw > 10_000_000_000 ? 1000 : 1
+  }
+  return 1
+}
+
 function toTime(raw: number | string): UTCTimestamp | null {
   if (typeof raw === "number") {
+    if (!Number.isFinite(raw)) return null
     if (raw > 10_000_000_000) return Math.floor(raw / 1000) as UTCTimestamp
     return Math.floor(raw) as UTCTimestamp
   }
@@ -62,7 +93,7 @@ function inferIsLogScale(elements: ChartElement[]): boolean {
   for (const el of elements) {
     const series = [el.y, el.open, el.high, el.low, el.close]
     for (const arr of series) {
-      if (!Array.isArray(arr)) continue
+      if (!arr) continue
       for (const v of arr) {
         if (typeof v !== "number" || !Number.isFinite(v) || v <= 0) return false
       }
@@ -186,6 +217,37 @@ function filterMarkersByTimes(markers: MarkerPoint[], times: Set<number>) {
   return markers.filter((m) => times.has(m.time))
 }
 
+// on downsampled series, markers are moved to the point including their time
+function snapMarkersToTimes(markers: MarkerPoint[], times: Set<number>) {
+  if (times.size === 0) return []
+  const sorted = Array.from(times).sort((a, b) => a - b)
+  const snapped: MarkerPoint[] = []
+  for (const marker of markers) {
+    if (marker.time < sorted[0]) continue
+    let low = 0
+    let high = sorted.length - 1
+    while (low < high) {
+      const middle = (low + high + 1) >> 1
+      if (sorted[middle] <= marker.time) low = middle
+      else high = middle - 1
+    }
+    snapped.push({ ...marker, time: sorted[low] as UTCTimestamp })
+  }
+  return snapped
+}
+
+// detailed points replace the overview ones in their time range
+function mergeSeriesData<T extends TimePoint>(overview: T[], detail: T[]): T[] {
+  if (detail.length === 0) return overview
+  const first = detail[0].time
+  const last = detail[detail.length - 1].time
+  return [
+    ...overview.filter((point) => point.time < first),
+    ...detail,
+    ...overview.filter((point) => point.time > last),
+  ]
+}
+
 function isMarkerElement(el: ChartElement): boolean {
   return (el.mode ?? "").includes("markers")
 }
@@ -237,6 +299,7 @@ function applyElement(chart: ReturnType<typeof createChart>, el: ChartElement):
 
   if (isMarkerElement(el)) {
     return {
+      el,
       series: null,
       markers: buildMarkers(el),
       isCandles: false,
@@ -259,11 +322,11 @@ function applyElement(chart: ReturnType<typeof createChart>, el: ChartElement):
       for (const point of candles) timeSet.add(point.time)
       series.setData(candles)
     }
-    return { series, markers: [], isCandles: true, timeSet }
+    return { el, series, markers: [], isCandles: true, timeSet }
   }
 
   const lineData = toLineData(el)
-  if (lineData.length === 0) return { series: null, markers: [], isCandles: false, timeSet: new Set<number>() }
+  if (lineData.length === 0) return { el, series: null, markers: [], isCandles: false, timeSet: new Set<number>() }
 
   const series = chart.addLineSeries({
     color: getSeriesLineColor(el),
@@ -275,7 +338,97 @@ function applyElement(chart: ReturnType<typeof createChart>, el: ChartElement):
   series.setData(lineData)
   const timeSet = new Set<number>()
   for (const point of lineData) timeSet.add(point.time)
-  return { series, markers: [], isCandles: false, timeSet }
+  return { el, series, markers: [], isCandles: false, timeSet }
+}
+
+function renderPane(chart: ReturnType<typeof createChart>, elements: ChartElement[], preferCandles: boolean): Pane {
+  const markerBuffers: MarkerPoint[] = []
+  const appliedElements: AppliedElement[] = []
+  let markerTarget: MarkerTarget | null = null
+  for (const el of elements) {
+    const applied = applyElement(chart, el)
+    if (!applied) continue
+    appliedElements.push(applied)
+    if (applied.series && (!markerTarget || (preferCandles && applied.isCandles))) markerTarget = applied
+    if (applied.markers && applied.markers.length > 0) {
+      if (applied.series) {
+        applied.series.setMarkers(applied.markers.sort((a, b) => a.time - b.time) as any)
+      } else {
+        markerBuffers.push(...applied.markers)
+      }
+    }
+  }
+  if (markerBuffers.length > 0 && !markerTarget) {
+    const markerData = markerBuffers.map((m) => ({ time: m.time, value: 1 }))
+    markerData.sort((a, b) => a.time - b.time)
+    const series = chart.addLineSeries({
+      color: "transparent",
+      lineVisible: false,
+      priceLineVisible: false,
+      lastValueVisible: false,
+    })
+    series.setData(markerData as any)
+    markerTarget = { series, timeSet: new Set<number>(markerData.map((p) => p.time)), el: null }
+  }
+  const refreshMarkers = () => {
+    if (markerBuffers.length === 0 || !markerTarget) return
+    const markers = markerTarget.el?.lod
+      ? snapMarkersToTimes(markerBuffers, markerTarget.timeSet)
+      : filterMarkersByTimes(markerBuffers, markerTarget.timeSet)
+    markerTarget.series.setMarkers(markers.sort((a, b) => a.time - b.time) as any)
+  }
+  refreshMarkers()
+  return { applied: appliedElements, refreshMarkers }
+}
+
+async function loadVisibleRange(applied: AppliedElement, from: number, to: number, signal: AbortSignal) {
+  const el = applied.el
+  const scale = getTimeScale(el)
+  const detail = await fetchSeriesRange(el, from * scale, to * scale, signal)
+  if (!detail || signal.aborted) return
+  const detailed = { ...el, ...detail }
+  const data: TimePoint[] = applied.isCandles
+    ? mergeSeriesData(toCandleData(el), toCandleData(detailed))
+    : mergeSeriesData(toLineData(el), toLineData(detailed))
+  applied.series.setData(data)
+  applied.timeSet = new Set<number>(data.map((point) => point.time))
+}
+
+// Loads the detailed points of downsampled series when the visible range changes
+function attachLevelsOfDetail(chart: ReturnType<typeof createChart>, pane: Pane) {
+  const downsampled = pane.applied.filter((applied) => applied.series && applied.el.lod?.url)
+  if (downsampled.length === 0) return () => {}
+  let timer: ReturnType<typeof setTimeout> | null = null
+  let controller: AbortController | null = null
+  let loadedRange = ""
+  const onRangeChange = (range: { from: unknown; to: unknown } | null) => {
+    if (!range) return
+    if (timer) clearTimeout(timer)
+    timer = setTimeout(() => {
+      const from = Number(range.from)
+      const to = Number(range.to)
+      const rangeKey = `${from}-${to}`
+      if (rangeKey === loadedRange) return
+      loadedRange = rangeKey
+      controller?.abort()
+      const current = new AbortController()
+      controller = current
+      Promise.all(downsampled.map((applied) => loadVisibleRange(applied, from, to, current.signal)))
+        .then(() => {
+          if (current.signal.aborted) return
+          pane.refreshMarkers()
+          // keep the visible range when more detailed points are added
+          chart.timeScale().setVisibleRange(range as any)
+        })
+        .catch(() => {})
+    }, LOD_DEBOUNCE_MS)
+  }
+  chart.timeScale().subscribeVisibleTimeRangeChange(onRangeChange)
+  return () => {
+    if (timer) clearTimeout(timer)
+    controller?.abort()
+    chart.timeScale().unsubscribeVisibleTimeRangeChange(onRangeChange)
+  }
 }
 
 interface TradingChartProps {
@@ -323,81 +476,8 @@ export function TradingChart({ elements, height = 350, className }: TradingChart
       : null
 
     const targetMain = mainElements.length > 0 ? mainElements : visibleElements
-    const markerBuffersMain: ReturnType<typeof buildMarkers> = []
-    let markerTargetMain: any = null
-    let markerTargetMainTimes = new Set<number>()
-    for (const el of targetMain) {
-      const applied = applyElement(mainChart, el)
-      if (!applied) continue
-      if (applied.series && !markerTargetMain) markerTargetMain = applied.series
-      if (applied.series && !markerTargetMainTimes.size) markerTargetMainTimes = applied.timeSet
-      if (applied.isCandles && applied.series) {
-        markerTargetMain = applied.series
-        markerTargetMainTimes = applied.timeSet
-      }
-      if (applied.markers && applied.markers.length > 0) {
-        if (applied.series) {
-          applied.series.setMarkers(applied.markers.sort((a, b) => a.time - b.time) as any)
-        } else {
-          markerBuffersMain.push(...applied.markers)
-        }
-      }
-    }
-    if (markerBuffersMain.length > 0) {
-      if (!markerTargetMain) {
-        const markerData = markerBuffersMain.map((m) => ({ time: m.time, value: 1 }))
-        markerData.sort((a, b) => a.time - b.time)
-        markerTargetMain = mainChart.addLineSeries({
-          color: "transparent",
-          lineVisible: false,
-          priceLineVisible: false,
-          lastValueVisible: false,
-        })
-        markerTargetMain.setData(markerData as any)
-        markerTargetMainTimes = new Set<number>(markerData.map((p) => p.time))
-      }
-      const filteredMarkers = filterMarkersByTimes(markerBuffersMain, markerTargetMainTimes)
-      if (filteredMarkers.length > 0) {
-        markerTargetMain.setMarkers(filteredMarkers.sort((a, b) => a.time - b.time) as any)
-      }
-    }
-
-    if (indicatorChart) {
-      const markerBuffersIndicator: ReturnType<typeof buildMarkers> = []
-      let markerTargetIndicator: any = null
-      let markerTargetIndicatorTimes = new Set<number>()
-      for (const el of indicatorElements) {
-        const applied = applyElement(indicatorChart, el)
-        if (!applied) continue
-        if (applied.series && !markerTargetIndicator) markerTargetIndicator = applied.series
-        if (applied.series && !markerTargetIndicatorTimes.size) markerTargetIndicatorTimes = applied.timeSet
-        if (applied.markers && applied.markers.length > 0) {
-          if (applied.series) {
-            applied.series.setMarkers(applied.markers.sort((a, b) => a.time - b.time) as any)
-          } else {
-            markerBuffersIndicator.push(...applied.markers)
-          }
-        }
-      }
-      if (markerBuffersIndicator.length > 0) {
-        if (!markerTargetIndicator) {
-          const markerData = markerBuffersIndicator.map((m) => ({ time: m.time, value: 1 }))
-          markerData.sort((a, b) => a.time - b.time)
-          markerTargetIndicator = indicatorChart.addLineSeries({
-            color: "transparent",
-            lineVisible: false,
-            priceLineVisible: false,
-            lastValueVisible: false,
-          })
-          markerTargetIndicator.setData(markerData as any)
-          markerTargetIndicatorTimes = new Set<number>(markerData.map((p) => p.time))
-        }
-        const filteredMarkers = filterMarkersByTimes(markerBuffersIndicator, markerTargetIndicatorTimes)
-        if (filteredMarkers.length > 0) {
-          markerTargetIndicator.setMarkers(filteredMarkers.sort((a, b) => a.time - b.time) as any)
-        }
-      }
-    }
+    const mainPane = renderPane(mainChart, targetMain, true)
+    const indicatorPane = indicatorChart ? renderPane(indicatorChart, indicatorElements, false) : null
 
     mainChart.timeScale().fitContent()
     if (indicatorChart) indicatorChart.timeScale().fitContent()
@@ -426,7 +506,13 @@ export function TradingChart({ elements, height = 350, className }: TradingChart
     const observer = new ResizeObserver(resize)
     observer.observe(root)
 
+    const detachLevelsOfDetail = [
+      attachLevelsOfDetail(mainChart, mainPane),
+      ...(indicatorChart && indicatorPane ? [attachLevelsOfDetail(indicatorChart, indicatorPane)] : []),
+    ]
+
     return () => {
+      for (const detach of detachLevelsOfDetail) detach()
       observer.disconnect()
       mainChart.remove()
       if (indicatorChart) indicatorChart.remove()
@@ -0,0 +1,72 @@
+import type { ChartElement, EncodedSeries, ReportData, SubElement } from "@/types"
+
+// ChartElement numeric series that can be encoded as float64 arrays (see octobot_script/internal/chart_series.py)
+const SERIES_KEYS = ["x", "y", "open", "high", "low", "close", "volume"] as const
+
+export function isEncodedSeries(value: unknown): value is EncodedSeries {
+  return (
+    typeof value === "object" &&
+    value !== null &&
+    (value as EncodedSeries).encoding === "base64" &&
+    (value as EncodedSeries).dtype === "float64"
+  )
+}
+
+export function decodeSeries(series: EncodedSeries): Float64Array {
+  const raw = atob(series.data)
+  const bytes = new Uint8Array(raw.length)
+  for (let i = 0; i < raw.length; i += 1) bytes[i] = raw.charCodeAt(i)
+  // values are little endian float64, as are typed arrays on all supported platforms
+  return new Float64Array(bytes.buffer, 0, series.length)
+}
+
+function decodeElement(el: ChartElement, seriesUrl?: string) {
+  const encoded = el as unknown as Record<string, unknown>
+  for (const key of SERIES_KEYS) {
+    const value = encoded[key]
+    if (isEncodedSeries(value)) encoded[key] = decodeSeries(value)
+  }
+  if (el.lod && seriesUrl) el.lod.url = seriesUrl
+}
+
+function decodeSubElement(el: SubElement, seriesUrl?: string) {
+  if (el.type === "chart") {
+    for (const chartElement of el.data.elements as ChartElement[]) decodeElement(chartElement, seriesUrl)
+  }
+  for (const subElement of el.data.sub_elements ?? []) decodeSubElement(subElement, seriesUrl)
+}
+
+// Replaces base64 encoded chart series by Float64Array in place.
+// seriesUrl is the endpoint serving the visible range of downsampled series.
+export function decodeReportSeries(data: ReportData, seriesUrl?: string): ReportData {
+  if (data.type === "chart") {
+    for (const el of data.data.elements as ChartElement[]) decodeElement(el, seriesUrl)
+  }
+  for (const subElement of data.data.sub_elements ?? []) decodeSubElement(subElement, seriesUrl)
+  return data
+}
+
+// Fetches the most detailed series of a downsampled element between start and end (in the element x unit)
+export async function fetchSeriesRange(
+  el: ChartElement,
+  start: number,
+  end: number,
+  signal?: AbortSignal,
+): Promise<Partial<ChartElement> | null> {
+  if (!el.lod?.url) return null
+  const params = new URLSearchParams({
+    element: el.lod.id,
+    start: String(Math.floor(start)),
+    end: String(Math.ceil(end)),
+    points: String(el.lod.max_points),
+  })
+  const response = await fetch(`${el.lod.url}?${params}`, { signal })
+  if (!response.ok) return null
+  const json = (await response.json()) as Record<string, unknown>
+  const series: Record<string, Float64Array> = {}
+  for (const key of SERIES_KEYS) {
+    const value = json[key]
+    if (isEncodedSeries(value)) series[key] = decodeSeries(value)
+  }
+  return series as Partial<ChartElement>
+}
@@ -2,6 +2,7 @@ import { StrictMode, useEffect, useState } from "react"
 import ReactDOM from "react-dom/client"
 import { App } from "./App"
 import "./index.css"
+import { decodeReportSeries } from "./lib/series"
 import type { HistoryRun, ReportData, ReportMeta } from "./types"
 
 type LoadState =
@@ -13,7 +14,9 @@ async function loadReport(base: string): Promise<{ data: ReportData; meta: Repor
   const bundle = await fetch(`${base}/report.json`)
   if (bundle.ok) {
     const json = (await bundle.json()) as { data: ReportData; meta: ReportMeta }
-    if (json?.data && json?.meta) return json
+    if (json?.data && json?.meta) {
+      return { data: decodeReportSeries(json.data, `${base}/series.json`), meta: json.meta }
+    }
   }
 
   const [data, meta] = await Promise.all([
@@ -26,7 +29,7 @@ async function loadReport(base: string): Promise<{ data: ReportData; meta: Repor
       return r.json() as Promise<ReportMeta>
     }),
   ])
-  return { data, meta }
+  return { data: decodeReportSeries(data, `${base}/series.json`), meta }
 }
 
 function Root() {
@@ -1,12 +1,33 @@
+// float64 series as encoded by octobot_script/internal/chart_series.py
+export interface EncodedSeries {
+  encoding: "base64"
+  dtype: "float64"
+  length: number
+  data: string
+}
+
+// encoded series are decoded into Float64Array when the report is loaded, missing values are NaN
+export type NumericSeries = number[] | Float64Array
+
+// levels of detail of downsampled series, see octobot_script/internal/chart_lod.py
+export interface SeriesLevels {
+  id: string
+  levels: number[]
+  length: number
+  max_points: number
+  // visible range series endpoint, set when the report is loaded
+  url?: string
+}
+
 export interface ChartElement {
   kind: string
-  x: (number | string)[] | null
-  y: number[] | null
-  open: number[] | null
-  high: number[] | null
-  low: number[] | null
-  close: number[] | null
-  volume: number[] | null
+  x: (number | string)[] | Float64Array | null
+  y: NumericSeries | null
+  open: NumericSeries | null
+  high: NumericSeries | null
+  low: NumericSeries | null
+  close: NumericSeries | null
+  volume: NumericSeries | null
   x_type: string | null
   y_type: string | null
   title: string
@@ -22,6 +43,7 @@ export interface ChartElement {
   html: string | null
   is_hidden: boolean | null
   opacity: number | null
+  lod?: SeriesLevels | null
 }
 
 export interface TableColumn {
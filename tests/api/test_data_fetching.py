@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
 import pytest
 import mock
 
@@ -32,11 +33,21 @@ pytestmark = pytest.mark.asyncio
 
 async def test_historical_data():
     with (
-        mock.patch(
-            "octobot_script.api.data_fetching.backtesting_api.find_matching_data_file",
+        mock.patch.object(
+            data_fetching.data_files,
+            "find_matching_data_file",
             mock.AsyncMock(return_value=None),
-            create=True,
         ) as find_matching_data_file_mock,
+        mock.patch.object(
+            data_fetching.data_files,
+            "find_covering_data_file",
+            mock.AsyncMock(return_value=None),
+        ),
+        mock.patch.object(
+            data_fetching.data_files,
+            "find_extendable_data_file",
+            mock.AsyncMock(return_value=None),
+        ) as find_extendable_data_file_mock,
         mock.patch.object(
             backtesting_api,
             "initialize_and_run_data_collector",
@@ -50,15 +61,89 @@ async def test_historical_data():
             == "data"
         )
         find_matching_data_file_mock.assert_awaited_once()
+        find_extendable_data_file_mock.assert_awaited_once()
         initialize_and_run_data_collector_mock.assert_awaited_once()
 
 
+async def test_historical_data_incremental():
+    with (
+        mock.patch.object(
+            data_fetching.data_files,
+            "find_matching_data_file",
+            mock.AsyncMock(return_value=None),
+        ),
+        mock.patch.object(
+            data_fetching.data_files,
+            "find_covering_data_file",
+            mock.AsyncMock(return_value=None),
+        ),
+        mock.patch.object(
+            data_fetching.data_files,
+            "find_extendable_data_file",
+            mock.AsyncMock(return_value="old_data"),
+        ),
+        mock.patch.object(
+            data_fetching.data_files,
+            "get_data_file_end_timestamp_ms",
+            mock.AsyncMock(return_value=1700000000000),
+        ),
+        mock.patch.object(
+            data_fetching.data_files,
+            "extend_data_file",
+            mock.AsyncMock(return_value="extended_data"),
+        ) as extend_data_file_mock,
+        mock.patch.object(
+            data_fetching, "_collect_exchange_data", mock.AsyncMock(return_value="tail_data")
+        ) as collect_exchange_data_mock,
+    ):
+        assert (
+            await obs.historical_data(
+                "BTC/USDT", commons_enums.TimeFrames.ONE_DAY.value,
+                start_timestamp=1600000000, end_timestamp=1710000000,
+            )
+            == "extended_data"
+        )
+        # only the missing candles are collected
+        collect_exchange_data_mock.assert_awaited_once()
+        assert collect_exchange_data_mock.await_args.args[4:6] == (1700000000000, 1710000000000)
+        extend_data_file_mock.assert_awaited_once_with("old_data", "tail_data", 1710000000000)
+
+
+async def test_historical_data_with_covering_file():
+    with (
+        mock.patch.object(
+            data_fetching.data_files,
+            "find_matching_data_file",
+            mock.AsyncMock(return_value=None),
+        ),
+        mock.patch.object(
+            data_fetching.data_files,
+            "find_covering_data_file",
+            mock.AsyncMock(return_value="wider_data"),
+        ) as find_covering_data_file_mock,
+        mock.patch.object(
+            data_fetching, "_collect_exchange_data", mock.AsyncMock()
+        ) as collect_exchange_data_mock,
+    ):
+        assert (
+            await obs.historical_data(
+                "BTC/USDT", commons_enums.TimeFrames.ONE_DAY.value,
+                start_timestamp=1600000000, end_timestamp=1710000000,
+            )
+            == "wider_data"
+        )
+        find_covering_data_file_mock.assert_awaited_once_with(
+            "binance", ["BTC/USDT"], [commons_enums.TimeFrames.ONE_DAY], 1600000000000, 1710000000000
+        )
+        collect_exchange_data_mock.assert_not_awaited()
+
+
 async def test_social_historical_data():
     with (
-        mock.patch(
-            "octobot_script.api.data_fetching.backtesting_api.find_matching_data_file",
+        mock.patch.object(
+            data_fetching.data_files,
+            "find_matching_data_file",
             mock.AsyncMock(return_value=None),
-            create=True,
         ) as find_matching_data_file_mock,
         mock.patch(
             "octobot_script.api.data_fetching.backtesting_api.social_historical_data_collector_factory",
@@ -135,6 +220,93 @@ async def test_get_data(mocked_config):
         )
 
 
+async def test_get_data_from_covering_file(mocked_config):
+    with (
+        mock.patch.object(
+            data_fetching, "historical_data", mock.AsyncMock(return_value="wider_data")
+        ),
+        mock.patch.object(
+            data_fetching.octobot_mocks, "get_config", mock.Mock(return_value={})
+        ),
+        mock.patch.object(
+            data_fetching.data_files, "get_time_window", mock.Mock(return_value=(1600000000, 1710000000))
+        ) as get_time_window_mock,
+        mock.patch.object(
+            backtesting_api,
+            "create_and_init_backtest_data",
+            mock.AsyncMock(return_value="backtest_data"),
+        ) as create_and_init_backtest_data_mock,
+    ):
+        assert (
+            await obs.get_data(
+                "BTC/USDT", commons_enums.TimeFrames.ONE_DAY.value,
+                start_timestamp=1600000000, end_timestamp=1710000000,
+            )
+            == "backtest_data"
+        )
+        get_time_window_mock.assert_called_once_with("wider_data", 1600000000000, 1710000000000)
+        config = create_and_init_backtest_data_mock.await_args.args[1]
+        # backtesting runs will only use requested candles
+        assert data_fetching.data_files.get_backtesting_time_window(config) == (1600000000, 1710000000)
+
+
+async def test_get_data_with_many_symbols(mocked_config):
+    running = []
+    max_running = []
+
+    async def _collect(name):
+        running.append(name)
+        max_running.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(name)
+        return f"{name}_data"
+
+    async def _historical_data(symbol, **_):
+        return await _collect(symbol)
+
+    async def _social_historical_data(services, **_):
+        return await _collect(services[0])
+
+    with (
+        mock.patch.object(
+            data_fetching,
+            "historical_data",
+            mock.AsyncMock(side_effect=_historical_data),
+        ) as historical_data_mock,
+        mock.patch.object(
+            data_fetching,
+            "social_historical_data",
+            mock.AsyncMock(side_effect=_social_historical_data),
+        ),
+        mock.patch.object(
+            backtesting_api,
+            "create_and_init_backtest_data",
+            mock.AsyncMock(return_value="backtest_data"),
+        ) as create_and_init_backtest_data_mock,
+    ):
+        assert (
+            await obs.get_data(
+                ["BTC/USDT", "ETH/USDT", "SOL/USDT"],
+                [commons_enums.TimeFrames.ONE_HOUR.value, commons_enums.TimeFrames.ONE_DAY.value],
+                social_services=["CoindeskServiceFeed"],
+                max_concurrent_collections=2,
+            )
+            == "backtest_data"
+        )
+        assert historical_data_mock.await_count == 3
+        assert historical_data_mock.await_args.kwargs["timeframe"] == [
+            commons_enums.TimeFrames.ONE_HOUR.value, commons_enums.TimeFrames.ONE_DAY.value
+        ]
+        assert max(max_running) == 2
+        # exchange data files first, in the symbols order
+        create_and_init_backtest_data_mock.assert_awaited_once_with(
+            ["BTC/USDT_data", "ETH/USDT_data", "SOL/USDT_data", "CoindeskServiceFeed_data"],
+            TEST_CONFIG,
+            TEST_TENTACLES_CONFIG,
+            use_accurate_price_time_frame=True,
+        )
+
+
 async def test_get_data_with_social_services(mocked_config):
     with (
         mock.patch.object(
@@ -390,3 +562,34 @@ async def test_get_data_with_profile_id_and_tentacles_config_raises():
             tentacles_config={"any": {}},
             profile_id="profile-1",
         )
+
+
+async def test_get_data_with_columnar_cache_files(mocked_config):
+    with (
+        mock.patch.object(
+            data_fetching, "historical_data", mock.AsyncMock(return_value="data")
+        ),
+        mock.patch.object(
+            data_fetching.columnar_cache, "write_columns", mock.AsyncMock(return_value=True)
+        ) as write_columns_mock,
+        mock.patch.object(
+            backtesting_api,
+            "create_and_init_backtest_data",
+            mock.AsyncMock(return_value="backtest_data"),
+        ),
+    ):
+        assert (
+            await obs.get_data("BTC/USDT", commons_enums.TimeFrames.ONE_DAY.value)
+            == "backtest_data"
+        )
+        write_columns_mock.assert_not_awaited()
+        assert (
+            await obs.get_data(
+                "BTC/USDT",
+                commons_enums.TimeFrames.ONE_DAY.value,
+                social_data_files=["social_file"],
+                columnar_cache_files=True,
+            )
+            == "backtest_data"
+        )
+        write_columns_mock.assert_awaited_once_with("data")
@@ -20,6 +20,7 @@ import mock
 import octobot_script as obs
 import octobot_script.internal.logging_util as logging_util
 import octobot_script.internal.runners as runners
+import octobot_script.internal.pool_runners as pool_runners
 
 
 # All test coroutines will be treated as marked.
@@ -42,6 +43,10 @@ async def test_run():
             initialize_func=None,
             tentacles_config=None,
             profile_id=None,
+            signals=None,
+            metrics_only=False,
+            stop_condition=None,
+            max_drawdown=None,
         )
         load_logging_config_mock.reset_mock()
         run_mock.reset_mock()
@@ -60,6 +65,52 @@ async def test_run():
             initialize_func=None,
             tentacles_config=None,
             profile_id=None,
+            signals=None,
+            metrics_only=False,
+            stop_condition=None,
+            max_drawdown=None,
+        )
+
+
+async def test_run_metrics_only():
+    with mock.patch.object(runners, "run", mock.AsyncMock(return_value="ret")) as run_mock:
+        assert await obs.run("backtesting_data", "strat_config", metrics_only=True) == "ret"
+        run_mock.assert_awaited_once_with(
+            "backtesting_data",
+            "strat_config",
+            enable_logs=False,
+            # storage is disabled when only gathering metrics
+            enable_storage=False,
+            strategy_func=None,
+            initialize_func=None,
+            tentacles_config=None,
+            profile_id=None,
+            signals=None,
+            metrics_only=True,
+            stop_condition=None,
+            max_drawdown=None,
+        )
+
+
+async def test_run_with_early_stopping():
+    with mock.patch.object(runners, "run", mock.AsyncMock(return_value="ret")) as run_mock:
+        def stop_condition(ctx):
+            return False
+        assert await obs.run("backtesting_data", "strat_config",
+                             stop_condition=stop_condition, max_drawdown=20) == "ret"
+        run_mock.assert_awaited_once_with(
+            "backtesting_data",
+            "strat_config",
+            enable_logs=False,
+            enable_storage=True,
+            strategy_func=None,
+            initialize_func=None,
+            tentacles_config=None,
+            profile_id=None,
+            signals=None,
+            metrics_only=False,
+            stop_condition=stop_condition,
+            max_drawdown=20,
         )
 
 
@@ -78,6 +129,10 @@ async def test_run_with_tentacles_config():
             initialize_func=None,
             tentacles_config=tentacles_config,
             profile_id=None,
+            signals=None,
+            metrics_only=False,
+            stop_condition=None,
+            max_drawdown=None,
         )
 
 
@@ -96,6 +151,10 @@ async def test_run_with_profile_id():
             initialize_func=None,
             tentacles_config=None,
             profile_id=profile_id,
+            signals=None,
+            metrics_only=False,
+            stop_condition=None,
+            max_drawdown=None,
         )
 
 
@@ -107,3 +166,53 @@ async def test_run_with_profile_id_and_tentacles_config_raises():
             tentacles_config={"any": {}},
             profile_id="profile-1",
         )
+
+
+async def test_run_with_strategy_func_and_signals_raises():
+    def strategy_func():
+        pass
+    with pytest.raises(ValueError):
+        await obs.run(
+            "backtesting_data",
+            "strat_config",
+            strategy_func=strategy_func,
+            signals={"time": [], "entries": []},
+        )
+
+
+async def test_run_many():
+    async def _run_many(*_, **__):
+        for result in ("ret_1", "ret_2"):
+            yield result
+
+    with mock.patch.object(pool_runners, "run_many", mock.Mock(side_effect=_run_many)) as run_many_mock:
+        def strategy_func():
+            pass
+        configs = [{"period": 10}, {"period": 20}]
+        assert [
+            result
+            async for result in obs.run_many("backtesting_data", configs, strategy_func=strategy_func, workers=2)
+        ] == ["ret_1", "ret_2"]
+        run_many_mock.assert_called_once_with(
+            "backtesting_data",
+            configs,
+            strategy_func=strategy_func,
+            initialize_func=None,
+            workers=2,
+            tentacles_config=None,
+            profile_id=None,
+            metrics_only=False,
+            stop_condition=None,
+            max_drawdown=None,
+        )
+
+
+async def test_run_many_with_profile_id_and_tentacles_config_raises():
+    with pytest.raises(ValueError):
+        async for _ in obs.run_many(
+            "backtesting_data",
+            [{}],
+            tentacles_config={"any": {}},
+            profile_id="profile-1",
+        ):
+            pass
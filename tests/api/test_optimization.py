@@ -0,0 +1,83 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import mock
+import pytest
+
+import octobot_script as obs
+import octobot_script.model as models
+import octobot_script.internal.pool_runners as pool_runners
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _submit(strategy_config, metrics_only=False):
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(models.BacktestMetrics(strategy_config, profitability=strategy_config["period"] % 7))
+    return future
+
+
+async def test_optimize():
+    pool = mock.Mock(workers=2, submit=mock.Mock(side_effect=_submit), shutdown=mock.Mock())
+    backtesting_data = mock.Mock(data_files=["data_file"])
+    cache = {}
+    with mock.patch.object(pool_runners, "WorkersPool", mock.Mock(return_value=pool)) as workers_pool_mock:
+        def strategy_func():
+            pass
+        result = await obs.optimize(
+            backtesting_data, {"period": [5, 6, 8]}, "profitability",
+            strategy_func=strategy_func, strategy_config={"rsi": 30}, workers=2, max_drawdown=50, cache=cache,
+        )
+        workers_pool_mock.assert_called_once_with(
+            backtesting_data,
+            strategy_func=strategy_func,
+            initialize_func=None,
+            workers=2,
+            tentacles_config=None,
+            profile_id=None,
+            stop_condition=None,
+            max_drawdown=50,
+        )
+        # only collect metrics
+        assert all(call.kwargs == {"metrics_only": True} for call in pool.submit.call_args_list)
+        assert pool.submit.call_count == 3
+        pool.shutdown.assert_called_once()
+        assert result.best_config == {"rsi": 30, "period": 6}
+
+        # cached results are only reused with the same runs settings
+        await obs.optimize(
+            backtesting_data, {"period": [5, 6, 8]}, "profitability",
+            strategy_func=strategy_func, strategy_config={"rsi": 30}, workers=2, max_drawdown=50, cache=cache,
+        )
+        assert pool.submit.call_count == 3
+        await obs.optimize(
+            backtesting_data, {"period": [5, 6, 8]}, "profitability",
+            strategy_func=strategy_func, strategy_config={"rsi": 30}, workers=2, max_drawdown=40, cache=cache,
+        )
+        assert pool.submit.call_count == 6
+        assert len(cache) == 6
+
+
+async def test_optimize_with_profile_id_and_tentacles_config_raises():
+    with pytest.raises(ValueError):
+        await obs.optimize(
+            "backtesting_data", {"period": [5]}, "profitability",
+            tentacles_config={"any": {}},
+            profile_id="profile-1",
+        )
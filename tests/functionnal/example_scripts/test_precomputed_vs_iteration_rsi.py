@@ -14,13 +14,17 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
 import pytest
 import os
+import numpy as np
 import tulipy
 
+import octobot_commons.enums as commons_enums
+import octobot_backtesting.api as backtesting_api
 import octobot_script as obs
 from octobot_script.api.ploting import generate_and_show_report
-from tests.functionnal import one_day_btc_usdt_data
+from tests.functionnal import one_day_btc_usdt_data, ONE_DAY_BTC_USDT_DATA
 
 
 # All test coroutines will be treated as marked.
@@ -92,6 +96,10 @@ async def test_precomputed_vs_iteration_rsi(one_day_btc_usdt_data):
         enable_storage=False,
     )
     assert res_2.bot_id != res.bot_id
+    # candles are loaded once and shared read-only by every run on the same data
+    assert res_2.candles_count == res.candles_count
+    for candles_manager in one_day_btc_usdt_data.preloaded_candle_managers.values():
+        assert not candles_manager.time_candles.flags.writeable
     assert (
         res_2.report["bot_report"]["profitability"]
         == res.report["bot_report"]["profitability"]
@@ -160,6 +168,166 @@ async def test_precomputed_vs_iteration_rsi(one_day_btc_usdt_data):
     )
 
 
+async def test_precomputed_vs_signals_rsi(one_day_btc_usdt_data):
+    config = {
+        "period": 10,
+        "rsi_value_buy_threshold": 28,
+    }
+    candles = await backtesting_api.get_all_ohlcvs(
+        ONE_DAY_BTC_USDT_DATA, "binance", "BTC/USDT", commons_enums.TimeFrames.ONE_DAY
+    )
+    closes = np.array([candle[commons_enums.PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles])
+    # candles close times
+    times = np.array([
+        candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value]
+        + commons_enums.TimeFramesMinutes[commons_enums.TimeFrames.ONE_DAY] * 60
+        for candle in candles
+    ])
+    rsi_v = tulipy.rsi(closes, period=config["period"])
+    entries = np.zeros(len(closes), dtype=bool)
+    entries[len(closes) - len(rsi_v):] = rsi_v < config["rsi_value_buy_threshold"]
+
+    async def _pre_compute_update(ctx):
+        if obs.current_live_time(ctx) in entry_times:
+            await obs.market(
+                ctx,
+                "buy",
+                amount="10%",
+                stop_loss_offset="-15%",
+                take_profit_offset="25%",
+            )
+
+    entry_times = set(times[entries])
+    res = await obs.run(
+        one_day_btc_usdt_data,
+        config,
+        strategy_func=_pre_compute_update,
+        enable_storage=False,
+    )
+    res_signals = await obs.run(
+        one_day_btc_usdt_data,
+        config,
+        signals={
+            "time": times,
+            "entries": entries,
+            "amount": "10%",
+            "stop_loss_offset": -15,
+            "take_profit_offset": 25,
+        },
+        enable_storage=False,
+    )
+    assert res.report["bot_report"]["profitability"]["binance"] != 0
+    # same orders: same result
+    assert (
+        res_signals.report["bot_report"]["profitability"]
+        == res.report["bot_report"]["profitability"]
+    )
+
+
+async def test_precomputed_vs_signals_rsi_with_held_position(one_day_btc_usdt_data):
+    config = {
+        "period": 10,
+        "rsi_value_buy_threshold": 28,
+    }
+    candles = await backtesting_api.get_all_ohlcvs(
+        ONE_DAY_BTC_USDT_DATA, "binance", "BTC/USDT", commons_enums.TimeFrames.ONE_DAY
+    )
+    closes = np.array([candle[commons_enums.PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles])
+    times = np.array([
+        candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value]
+        + commons_enums.TimeFramesMinutes[commons_enums.TimeFrames.ONE_DAY] * 60
+        for candle in candles
+    ])
+    rsi_v = tulipy.rsi(closes, period=config["period"])
+    entries = np.zeros(len(closes), dtype=bool)
+    entries[len(closes) - len(rsi_v):] = rsi_v < config["rsi_value_buy_threshold"]
+
+    async def _pre_compute_update(ctx):
+        if obs.current_live_time(ctx) in entry_times:
+            # no stop loss nor take profit: bought assets are held until the end of the backtest
+            await obs.market(ctx, "buy", amount="10%")
+
+    entry_times = set(times[entries])
+    res = await obs.run(
+        one_day_btc_usdt_data,
+        config,
+        strategy_func=_pre_compute_update,
+        enable_storage=False,
+    )
+    res_signals = await obs.run(
+        one_day_btc_usdt_data,
+        config,
+        signals={
+            "time": times,
+            "entries": entries,
+            "amount": "10%",
+        },
+        enable_storage=False,
+    )
+    assert (
+        res.report["bot_report"]["end_portfolio"]["binance"]
+        != res.report["bot_report"]["starting_portfolio"]["binance"]
+    )
+    # the backtest runs until the data end: held position is valued at the same price
+    assert res_signals.candles_count == res.candles_count
+    assert (
+        res_signals.report["bot_report"]["end_portfolio"]
+        == res.report["bot_report"]["end_portfolio"]
+    )
+    assert (
+        res_signals.report["bot_report"]["profitability"]
+        == res.report["bot_report"]["profitability"]
+    )
+    assert res_signals.metrics.end_portfolio_value == res.metrics.end_portfolio_value
+
+
+async def test_concurrent_vs_serial_runs(one_day_btc_usdt_data):
+    async def _iterations_update(ctx):
+        if obs.current_live_time(ctx) != await obs.current_candle_time(
+            ctx, use_close_time=True
+        ):
+            return
+        close = await obs.Close(ctx)
+        if len(close) <= ctx.tentacle.trading_config["period"]:
+            return
+        rsi_v = tulipy.rsi(close, period=ctx.tentacle.trading_config["period"])
+        if rsi_v[-1] < ctx.tentacle.trading_config["rsi_value_buy_threshold"]:
+            await obs.market(
+                ctx,
+                "buy",
+                amount="10%",
+                stop_loss_offset="-15%",
+                take_profit_offset="25%",
+            )
+
+    configs = [
+        {"period": 10, "rsi_value_buy_threshold": 28},
+        {"period": 14, "rsi_value_buy_threshold": 35},
+        {"period": 10, "rsi_value_buy_threshold": 28},
+    ]
+    serial_results = [
+        await obs.run(one_day_btc_usdt_data, config, strategy_func=_iterations_update, enable_storage=False)
+        for config in configs
+    ]
+    concurrent_results = await asyncio.gather(*(
+        obs.run(one_day_btc_usdt_data, config, strategy_func=_iterations_update, enable_storage=False)
+        for config in configs
+    ))
+    assert serial_results[0].report["bot_report"]["profitability"]["binance"] != 0
+    # runs on the same data don't interfere with each other
+    for serial_result, concurrent_result in zip(serial_results, concurrent_results):
+        assert concurrent_result.candles_count == serial_result.candles_count
+        assert (
+            concurrent_result.report["bot_report"]["profitability"]
+            == serial_result.report["bot_report"]["profitability"]
+        )
+        assert (
+            concurrent_result.report["bot_report"]["end_portfolio"]
+            == serial_result.report["bot_report"]["end_portfolio"]
+        )
+        assert concurrent_result.metrics.trades_count == serial_result.metrics.trades_count
+
+
 async def _check_report(res):
     description = res.describe()
     assert str(res.strategy_config) in description
@@ -0,0 +1,45 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import mock
+
+import octobot_script.internal.backtester_trading_mode as backtester_trading_mode
+
+
+def test_import_scripts_uses_bot_id_bound_script():
+    def script_1():
+        pass
+
+    def script_2():
+        pass
+
+    trading_mode_1 = mock.Mock(exchange_manager=mock.Mock(bot_id="bot_1"))
+    trading_mode_2 = mock.Mock(exchange_manager=mock.Mock(bot_id="bot_2"))
+    try:
+        backtester_trading_mode.register_script("bot_1", script_1, {"period": 1})
+        backtester_trading_mode.register_script("bot_2", script_2, {"period": 2})
+        backtester_trading_mode.BacktesterTradingMode._import_scripts(trading_mode_1)
+        backtester_trading_mode.BacktesterTradingMode._import_scripts(trading_mode_2)
+        assert trading_mode_1._live_script is script_1
+        assert trading_mode_1._strategy_config == {"period": 1}
+        assert trading_mode_2._live_script is script_2
+        assert trading_mode_2._strategy_config == {"period": 2}
+    finally:
+        backtester_trading_mode.unregister_script("bot_1")
+        backtester_trading_mode.unregister_script("bot_2")
+    backtester_trading_mode.BacktesterTradingMode._import_scripts(trading_mode_1)
+    assert trading_mode_1._live_script is None
+    assert trading_mode_1._strategy_config == {}
@@ -0,0 +1,200 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import mock
+import numpy as np
+import pytest
+
+import octobot_script.internal.candle_store as candle_store
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _candles_manager():
+    candles_manager = mock.Mock()
+    for candles_array in candle_store.CANDLES_ARRAYS:
+        setattr(candles_manager, candles_array, np.array([1, 2, 3], dtype=np.float64))
+        setattr(candles_manager, f"{candles_array}_index", 2)
+    return candles_manager
+
+
+async def test_run_backtest_data_shares_pinned_candles():
+    pinned_candles_manager = _candles_manager()
+    backtesting_data = mock.Mock(
+        data_files=["file"],
+        get_preloaded_candles_manager=mock.AsyncMock(return_value=pinned_candles_manager),
+    )
+    run_data_1 = candle_store.RunBacktestData(backtesting_data)
+    run_data_2 = candle_store.RunBacktestData(backtesting_data)
+    assert run_data_1.data_files == ["file"]
+
+    run_candles_1 = await run_data_1.get_preloaded_candles_manager("binance", "BTC/USDT", "1d", 1, 2)
+    run_candles_2 = await run_data_2.get_preloaded_candles_manager("binance", "BTC/USDT", "1d", 1, 2)
+    backtesting_data.get_preloaded_candles_manager.assert_awaited_with("binance", "BTC/USDT", "1d", 1, 2)
+    assert run_candles_1 is not run_candles_2
+    for candles_array in candle_store.CANDLES_ARRAYS:
+        # same read-only arrays, run-specific indexes
+        assert getattr(run_candles_1, candles_array) is getattr(pinned_candles_manager, candles_array)
+        assert getattr(run_candles_2, candles_array) is getattr(pinned_candles_manager, candles_array)
+        assert not getattr(pinned_candles_manager, candles_array).flags.writeable
+        assert getattr(run_candles_1, f"{candles_array}_index") == 0
+        assert getattr(pinned_candles_manager, f"{candles_array}_index") == 2
+    run_candles_1.close_candles_index = 1
+    assert run_candles_2.close_candles_index == 0
+
+
+async def test_run_backtest_data_concurrent_candles_loading():
+    pinned_candles_manager = _candles_manager()
+    loaded_event = asyncio.Event()
+
+    async def _get_preloaded_candles_manager(*_):
+        await loaded_event.wait()
+        return pinned_candles_manager
+
+    backtesting_data = mock.Mock(
+        data_files=[],
+        get_preloaded_candles_manager=mock.AsyncMock(side_effect=_get_preloaded_candles_manager),
+    )
+    run_candles_tasks = [
+        asyncio.create_task(
+            candle_store.RunBacktestData(backtesting_data).get_preloaded_candles_manager(
+                "binance", "BTC/USDT", "1d", 1, 2
+            )
+        )
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    # a cancelled run does not cancel the loading other runs are waiting for
+    run_candles_tasks[0].cancel()
+    loaded_event.set()
+    run_candles = await asyncio.gather(*run_candles_tasks[1:])
+    backtesting_data.get_preloaded_candles_manager.assert_awaited_once_with("binance", "BTC/USDT", "1d", 1, 2)
+    assert run_candles[0] is not run_candles[1]
+    assert run_candles[0].close_candles is pinned_candles_manager.close_candles
+    assert run_candles_tasks[0].cancelled()
+
+
+async def test_run_backtest_data_reloads_after_failed_loading():
+    pinned_candles_manager = _candles_manager()
+    backtesting_data = mock.Mock(
+        data_files=[],
+        get_preloaded_candles_manager=mock.AsyncMock(side_effect=[RuntimeError, pinned_candles_manager]),
+    )
+    with pytest.raises(RuntimeError):
+        await candle_store.RunBacktestData(backtesting_data).get_preloaded_candles_manager(
+            "binance", "BTC/USDT", "1d", 1, 2
+        )
+    run_candles = await candle_store.RunBacktestData(backtesting_data).get_preloaded_candles_manager(
+        "binance", "BTC/USDT", "1d", 1, 2
+    )
+    assert run_candles.close_candles is pinned_candles_manager.close_candles
+    assert backtesting_data.get_preloaded_candles_manager.await_count == 2
+
+
+class _ChronologicalCache:
+    CHRONO_INDEX_KEY = "chrono_index"
+
+    def __init__(self, timestamped_sorted_data):
+        self.timestamped_sorted_data = timestamped_sorted_data
+
+
+class _Importer:
+    def __init__(self, database, chronological_cache):
+        self.database = database
+        self.chronological_cache = chronological_cache
+
+    def reset_cache(self):
+        for cached_data in self.chronological_cache.timestamped_sorted_data["binance"].values():
+            cached_data["chrono_index"] = 0
+
+
+async def test_run_backtest_data_importers():
+    candles = [{"time": 1}, {"time": 2}]
+    importer = _Importer("database", _ChronologicalCache({"binance": {
+        "BTC/USDT": {"data": candles, "data_sort_key": "time", "chrono_index": 1}
+    }}))
+    backtesting_data = mock.Mock(importers_by_data_file={"file": importer})
+    run_data_1 = candle_store.RunBacktestData(backtesting_data)
+    run_data_2 = candle_store.RunBacktestData(backtesting_data)
+    run_importer_1 = run_data_1.importers_by_data_file["file"]
+    run_importer_2 = run_data_2.importers_by_data_file["file"]
+    assert run_data_1.importers_by_data_file["file"] is run_importer_1
+    assert run_importer_1 is not importer and run_importer_1 is not run_importer_2
+    # same database and cached candles, run-specific read indexes
+    assert run_importer_1.database == "database"
+    run_cached_data_1 = run_importer_1.chronological_cache.timestamped_sorted_data["binance"]["BTC/USDT"]
+    run_cached_data_2 = run_importer_2.chronological_cache.timestamped_sorted_data["binance"]["BTC/USDT"]
+    assert run_cached_data_1["data"] is candles
+    assert run_cached_data_1["chrono_index"] == 0
+    run_cached_data_1["chrono_index"] = 1
+    assert run_cached_data_2["chrono_index"] == 0
+    # resetting a run indexes does not reset other runs ones
+    run_cached_data_2["chrono_index"] = 1
+    run_data_1.reset_cached_indexes()
+    assert run_cached_data_1["chrono_index"] == 0
+    assert run_cached_data_2["chrono_index"] == 1
+    assert importer.chronological_cache.timestamped_sorted_data["binance"]["BTC/USDT"]["chrono_index"] == 1
+
+
+async def test_run_backtest_data_without_preloaded_candles():
+    backtesting_data = mock.Mock(
+        data_files=["file"],
+        get_preloaded_candles_manager=mock.AsyncMock(return_value=None),
+    )
+    assert await candle_store.RunBacktestData(backtesting_data).get_preloaded_candles_manager(
+        "binance", "BTC/USDT", "1d", 1, 2
+    ) is None
+
+
+async def test_run_backtest_data_preloads_from_columns():
+    columns = {
+        candles_array.split("_")[0]: np.array([1, 2, 3], dtype=np.float64)
+        for candles_array in candle_store.CANDLES_ARRAYS
+    }
+    backtesting_data = mock.Mock(
+        data_files=["social_file", "exchange_file"],
+        get_preloaded_candles_manager=mock.AsyncMock(),
+    )
+    candles_manager = _candles_manager()
+
+    def _load_columns(data_file, exchange, symbol, *_):
+        return columns if (data_file, symbol) == ("exchange_file", "BTC/USDT") else None
+
+    with mock.patch.object(candle_store.columnar_cache, "load_columns", mock.Mock(side_effect=_load_columns)) \
+            as load_columns_mock, \
+            mock.patch.object(candle_store, "create_candles_manager", mock.AsyncMock(return_value=candles_manager)) \
+            as create_candles_manager_mock:
+        run_data = candle_store.RunBacktestData(backtesting_data)
+        run_candles = await run_data.get_preloaded_candles_manager("binance", "BTC/USDT", "1d", 1, 2)
+        assert load_columns_mock.mock_calls == [
+            mock.call("social_file", "binance", "BTC/USDT", "1d", 1, 2),
+            mock.call("exchange_file", "binance", "BTC/USDT", "1d", 1, 2),
+        ]
+        create_candles_manager_mock.assert_awaited_once_with(columns)
+        backtesting_data.get_preloaded_candles_manager.assert_not_awaited()
+        assert run_candles.close_candles is candles_manager.close_candles
+        # already preloaded, including for other runs
+        await candle_store.RunBacktestData(backtesting_data).get_preloaded_candles_manager(
+            "binance", "BTC/USDT", "1d", 1, 2
+        )
+        assert load_columns_mock.call_count == 2
+        create_candles_manager_mock.assert_awaited_once()
+        # no columns: loaded by the backtesting data
+        await run_data.get_preloaded_candles_manager("binance", "ETH/USDT", "1d", 1, 2)
+        backtesting_data.get_preloaded_candles_manager.assert_awaited_once_with("binance", "ETH/USDT", "1d", 1, 2)
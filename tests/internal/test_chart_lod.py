@@ -0,0 +1,126 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+import numpy as np
+import pytest
+
+import octobot_script.internal.chart_lod as chart_lod
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _get_candles(size):
+    close = 1000 + np.cumsum(np.sin(np.arange(size)))
+    return {
+        "title": "candles",
+        "kind": "candlestick",
+        "x": list(range(0, size * 60000, 60000)),
+        "open": close.tolist(),
+        "high": (close + 2).tolist(),
+        "low": (close - 2).tolist(),
+        "close": close.tolist(),
+        "volume": [1] * size,
+    }
+
+
+async def test_aggregate_ohlc():
+    level = {
+        "x": np.array([1., 2, 3, 4, 5]),
+        "open": np.array([10., 11, 12, 13, 14]),
+        "high": np.array([15., np.nan, 20, 16, 17]),
+        "low": np.array([9., 8, 10, 7, 12]),
+        "close": np.array([11., 12, 13, 14, 15]),
+        "volume": np.array([1., 2, np.nan, 4, 5]),
+    }
+    aggregated = chart_lod.aggregate_ohlc(level, 2)
+    assert {key: values.tolist() for key, values in aggregated.items()} == {
+        "x": [1, 3, 5],
+        "open": [10, 12, 14],
+        "high": [15, 20, 17],
+        "low": [8, 7, 12],
+        "close": [12, 14, 15],
+        "volume": [3, 4, 5],
+    }
+
+
+async def test_lttb():
+    x = np.arange(1000, dtype=np.float64)
+    y = np.zeros(1000)
+    y[500] = 100
+    indexes = chart_lod.lttb(x, y, 50)
+    assert len(indexes) == 50
+    assert indexes[0] == 0 and indexes[-1] == 999
+    assert np.all(np.diff(indexes) > 0)
+    # peaks are kept
+    assert 500 in indexes
+    assert chart_lod.lttb(x[:10], y[:10], 50).tolist() == list(range(10))
+
+
+async def test_get_levels():
+    levels = chart_lod.get_levels(_get_candles(1000), max_points=100, level_factor=4)
+    assert {factor: len(level["x"]) for factor, level in levels.items()} == {1: 1000, 4: 250, 16: 63}
+    assert levels[16]["volume"].sum() == 1000
+    assert levels[16]["high"].max() == levels[1]["high"].max()
+
+    line = {"x": list(range(1000)), "y": [None] * 10 + list(range(990)), "mode": "lines"}
+    levels = chart_lod.get_levels(line, max_points=100, level_factor=4)
+    assert {factor: len(level["x"]) for factor, level in levels.items()} == {1: 1000, 4: 250, 16: 63}
+    assert not np.isnan(levels[4]["y"]).any()
+    assert levels[4]["x"][0] == 10
+
+    for element in (
+        _get_candles(100),
+        {**line, "mode": "markers"},
+        {**line, "text": ["a"] * 1000},
+        {**line, "x": ["2023-01-01"] * 1000},
+        {**line, "x": list(reversed(range(1000)))},
+        {**line, "y": line["y"][:-1]},
+    ):
+        assert chart_lod.get_levels(element, max_points=100, level_factor=4) is None
+
+
+async def test_set_levels_of_detail():
+    candles = _get_candles(1000)
+    small_line = {"x": [1, 2], "y": [1, None]}
+    full_data = {"type": "chart", "data": {"elements": [], "sub_elements": [
+        {"type": "chart", "data": {"elements": [small_line, candles], "sub_elements": []}},
+    ]}}
+    levels_by_element = chart_lod.set_levels_of_detail(full_data, max_points=100, level_factor=4)
+    assert list(levels_by_element) == ["0"]
+    assert small_line == {"x": [1, 2], "y": [1, None]}
+    assert candles["lod"] == {"id": "0", "levels": [1, 4, 16], "length": 1000, "max_points": 100}
+    assert len(candles["x"]) == len(candles["volume"]) == 63
+    assert candles["close"] == levels_by_element["0"][16]["close"].tolist()
+
+
+async def test_get_visible_range(tmp_path):
+    levels = {"0": chart_lod.get_levels(_get_candles(1000), max_points=100, level_factor=4)}
+    file_path = chart_lod.write_levels(str(tmp_path / "series.npz"), levels)
+    # everything: coarsest level
+    factor, series = chart_lod.get_visible_range(file_path, "0", 0, 1000 * 60000, max_points=100)
+    assert factor == 16
+    assert series["x"].tolist() == levels["0"][16]["x"].tolist()
+    # zoomed: more detailed level with surrounding points
+    factor, series = chart_lod.get_visible_range(file_path, "0", 100 * 60000, 300 * 60000, max_points=100)
+    assert factor == 4
+    assert series["x"][0] < 100 * 60000 <= series["x"][1]
+    assert series["x"][-2] <= 300 * 60000 < series["x"][-1]
+    assert set(series) == {"x", "open", "high", "low", "close", "volume"}
+    factor, series = chart_lod.get_visible_range(file_path, "0", 100 * 60000, 150 * 60000, max_points=100)
+    assert factor == 1
+    assert series["x"].tolist() == [60000 * i for i in range(99, 152)]
+    assert chart_lod.get_visible_range(file_path, "1", 0, 1, max_points=100) is None
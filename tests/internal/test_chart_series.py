@@ -0,0 +1,94 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+import math
+import numpy as np
+import pytest
+
+import octobot_script.internal.chart_series as chart_series
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _get_report_data():
+    return {
+        "name": "root",
+        "type": "chart",
+        "data": {
+            "sub_elements": [
+                {
+                    "name": "main-chart",
+                    "type": "chart",
+                    "data": {
+                        "sub_elements": [],
+                        "elements": [
+                            {
+                                "title": "candles",
+                                "x": [1672531200000, 1672534800000, 1672538400000],
+                                "y": None,
+                                "open": [1.5, 2, 3],
+                                "close": [2, 3, None],
+                                "text": ["a", "b", "c"],
+                            },
+                            {
+                                "title": "dates",
+                                "x": ["2023-01-01", "2023-01-02"],
+                                "y": [1, 2],
+                            },
+                        ],
+                    },
+                },
+                {
+                    "name": "backtesting-details",
+                    "type": "value",
+                    "data": {"sub_elements": [], "elements": [{"title": "gains", "value": "1", "x": [1]}]},
+                },
+            ],
+            "elements": [],
+        },
+    }
+
+
+async def test_encode_series():
+    encoded = chart_series.encode_series([1, 2.5, None])
+    assert encoded["encoding"] == chart_series.BASE64
+    assert encoded["dtype"] == chart_series.SERIES_DTYPE
+    assert encoded["length"] == 3
+    decoded = chart_series.decode_series(encoded)
+    assert decoded.dtype == np.float64
+    assert decoded[:2].tolist() == [1, 2.5]
+    assert math.isnan(decoded[2])
+    assert chart_series.decode_series(chart_series.encode_series([])).tolist() == []
+    for not_numbers in (None, ["a", 1], [True, False], (1, 2)):
+        assert chart_series.encode_series(not_numbers) is None
+    with pytest.raises(ValueError):
+        chart_series.decode_series({"encoding": "hex", "dtype": chart_series.SERIES_DTYPE, "data": ""})
+
+
+async def test_encode_chart_series():
+    data = _get_report_data()
+    assert chart_series.encode_chart_series(data) is data
+    candles, dates = data["data"]["sub_elements"][0]["data"]["elements"]
+    for key in ("x", "open", "close"):
+        assert chart_series.is_encoded_series(candles[key])
+    assert candles["y"] is None
+    assert candles["text"] == ["a", "b", "c"]
+    assert dates["x"] == ["2023-01-01", "2023-01-02"]
+    assert chart_series.is_encoded_series(dates["y"])
+    # only chart elements are encoded
+    assert data["data"]["sub_elements"][1]["data"]["elements"][0]["x"] == [1]
+    assert chart_series.decode_chart_series(data) == _get_report_data()
@@ -0,0 +1,83 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import mock
+import numpy as np
+import pytest
+
+import octobot_commons.enums as commons_enums
+import octobot_script.internal.columnar_cache as columnar_cache
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+DAY = 86400
+CANDLES = [
+    [DAY * index, 10 + index, 20 + index, 5 + index, 15 + index, 100 + index]
+    for index in range(10)
+]
+
+
+async def _write_columns(data_file):
+    with mock.patch.object(columnar_cache.backtesting_api, "get_file_description", mock.AsyncMock(return_value={
+                "exchange": "binance",
+                "symbols": ["BTC/USDT"],
+                "time_frames": ["1d"],
+            })), \
+            mock.patch.object(columnar_cache.backtesting_api, "get_all_ohlcvs", mock.AsyncMock(return_value=CANDLES)) \
+            as get_all_ohlcvs_mock:
+        assert await columnar_cache.write_columns(data_file) is True
+        return get_all_ohlcvs_mock
+
+
+async def test_write_and_load_columns(tmp_path):
+    data_file = str(tmp_path / "ExchangeHistoryDataCollector_1.data")
+    with open(data_file, "w") as f:
+        f.write("data")
+    assert not columnar_cache.has_columns(data_file)
+    assert columnar_cache.load_columns(data_file, "binance", "BTC/USDT", "1d", 0, DAY * 10) is None
+    get_all_ohlcvs_mock = await _write_columns(data_file)
+    get_all_ohlcvs_mock.assert_awaited_once_with(data_file, "binance", "BTC/USDT", commons_enums.TimeFrames.ONE_DAY)
+    assert columnar_cache.has_columns(data_file)
+    # already written
+    get_all_ohlcvs_mock = await _write_columns(data_file)
+    get_all_ohlcvs_mock.assert_not_awaited()
+
+    columns = columnar_cache.load_columns(data_file, "binance", "BTC/USDT", "1d", 0, DAY * 10)
+    assert np.array_equal(columns["time"], [candle[0] for candle in CANDLES])
+    assert np.array_equal(columns["close"], [candle[4] for candle in CANDLES])
+    assert not columns["close"].flags.writeable
+    # candles closing from start_timestamp and opening until end_timestamp
+    columns = columnar_cache.load_columns(data_file, "binance", "BTC/USDT", "1d", DAY * 3, DAY * 6)
+    assert np.array_equal(columns["time"], [DAY * 2, DAY * 3, DAY * 4, DAY * 5, DAY * 6])
+    assert columnar_cache.load_columns(data_file, "binance", "ETH/USDT", "1d", 0, DAY * 10) is None
+
+    # data file changed: columns are outdated
+    with open(data_file, "a") as f:
+        f.write("new data")
+    assert not columnar_cache.has_columns(data_file)
+    assert columnar_cache.load_columns(data_file, "binance", "BTC/USDT", "1d", 0, DAY * 10) is None
+
+
+async def test_write_columns_of_non_exchange_data_file(tmp_path):
+    data_file = str(tmp_path / "SocialHistoryDataCollector_1.data")
+    with mock.patch.object(columnar_cache.backtesting_api, "get_file_description",
+                           mock.AsyncMock(return_value=None)):
+        assert await columnar_cache.write_columns(data_file) is False
+    assert not os.path.exists(columnar_cache.get_columns_dir(data_file))
@@ -0,0 +1,301 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+import sqlite3
+import mock
+import pytest
+
+import octobot_commons.enums as commons_enums
+import octobot_script.internal.data_files as data_files
+import octobot_script.internal.data_files_index as data_files_index
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+DAY = 86400
+
+
+def _create_data_file(path, start_timestamp, end_timestamp):
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE description(timestamp REAL, version TEXT, exchange TEXT, symbols TEXT, "
+                       "time_frames TEXT, start_timestamp INTEGER, end_timestamp INTEGER)")
+    connection.execute("CREATE TABLE ohlcv(timestamp REAL, exchange_name TEXT, cryptocurrency TEXT, symbol TEXT, "
+                       "time_frame TEXT, candle TEXT)")
+    connection.execute("INSERT INTO description VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       (0, "1.1", "binance", json.dumps(["BTC/USDT"]), json.dumps(["1d"]),
+                        start_timestamp, end_timestamp))
+    connection.executemany(
+        "INSERT INTO ohlcv VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (timestamp + DAY, "binance", "Bitcoin", "BTC/USDT", "1d", json.dumps([timestamp, 1, 2, 0.5, 1.5, 10]))
+            for timestamp in range(start_timestamp, end_timestamp, DAY)
+        ]
+    )
+    connection.commit()
+    connection.close()
+
+
+def _get_content(path):
+    connection = sqlite3.connect(path)
+    try:
+        return (
+            [row[0] for row in connection.execute("SELECT timestamp FROM ohlcv ORDER BY timestamp")],
+            connection.execute("SELECT start_timestamp, end_timestamp FROM description").fetchone(),
+        )
+    finally:
+        connection.close()
+
+
+def _description(symbols, time_frames, start_timestamp, end_timestamp, exchange="binance"):
+    return {
+        "exchange": exchange, "symbols": symbols, "time_frames": time_frames,
+        "start_timestamp": start_timestamp, "end_timestamp": end_timestamp,
+    }
+
+
+def _mocked_data_folder(data_path, descriptions):
+    for data_file in descriptions:
+        with open(os.path.join(data_path, data_file), "w") as f:
+            f.write(data_file)
+
+    async def _get_file_description(data_file, data_path=None):
+        return descriptions[data_file]
+
+    return (
+        mock.patch.object(
+            data_files_index.backtesting_api, "get_all_available_data_files",
+            mock.Mock(side_effect=lambda path: [file for file in os.listdir(path) if file.endswith(".data")])
+        ),
+        mock.patch.object(
+            data_files_index.backtesting_api, "get_file_description", mock.AsyncMock(side_effect=_get_file_description)
+        ),
+    )
+
+
+async def test_find_extendable_data_file(tmp_path):
+    data_path = str(tmp_path / "data")
+    os.mkdir(data_path)
+    descriptions = {
+        "ExchangeHistoryDataCollector_1.data": _description(["BTC/USDT"], ["1d"], 0, DAY * 5),
+        "ExchangeHistoryDataCollector_2.data": _description(["BTC/USDT"], ["1d"], 0, DAY * 8),
+        "ExchangeHistoryDataCollector_3.data": _description(["ETH/USDT"], ["1d"], 0, DAY * 9),
+    }
+    list_mock, description_mock = _mocked_data_folder(data_path, descriptions)
+    with list_mock, description_mock:
+        assert await data_files.find_extendable_data_file(
+            "binance", ["BTC/USDT"], [commons_enums.TimeFrames.ONE_DAY], None, DAY * 10 * 1000, data_path=data_path
+        ) == "ExchangeHistoryDataCollector_2.data"
+        # no file ending before the requested end
+        assert await data_files.find_extendable_data_file(
+            "binance", ["BTC/USDT"], [commons_enums.TimeFrames.ONE_DAY], None, DAY * 4 * 1000, data_path=data_path
+        ) is None
+        # different start
+        assert await data_files.find_extendable_data_file(
+            "binance", ["BTC/USDT"], [commons_enums.TimeFrames.ONE_DAY], DAY * 1000, DAY * 10 * 1000,
+            data_path=data_path
+        ) is None
+        assert await data_files.find_extendable_data_file(
+            "binance", ["BTC/USDT"], [commons_enums.TimeFrames.ONE_HOUR], None, DAY * 10 * 1000, data_path=data_path
+        ) is None
+    data_files.get_index(data_path).close()
+
+
+async def test_extend_data_file(tmp_path):
+    data_file = "ExchangeHistoryDataCollector_1.data"
+    tail_data_file = "ExchangeHistoryDataCollector_2.data"
+    _create_data_file(str(tmp_path / data_file), 0, DAY * 5)
+    # the tail overlaps the last candle of data_file
+    _create_data_file(str(tmp_path / tail_data_file), DAY * 4, DAY * 8)
+    os.mkdir(tmp_path / f"{data_file}.columns")
+    with mock.patch.object(data_files.backtesting_api, "get_file_description", mock.AsyncMock(return_value=None)):
+        extended_data_file = await data_files.extend_data_file(
+            data_file, tail_data_file, DAY * 8 * 1000, data_path=str(tmp_path)
+        )
+    assert extended_data_file.startswith("ExchangeHistoryDataCollector_")
+    assert extended_data_file.endswith(".data")
+    assert _get_content(str(tmp_path / extended_data_file)) == (
+        [DAY * index for index in range(1, 9)], (0, DAY * 8)
+    )
+    # the extended file replaces the original file, tail file is removed
+    assert not os.path.exists(tmp_path / data_file)
+    assert not os.path.exists(tmp_path / f"{data_file}.columns")
+    assert not os.path.exists(tmp_path / tail_data_file)
+    assert data_files.get_index(str(tmp_path)).get(data_file) is None
+    assert not os.path.exists(tmp_path / f"{extended_data_file}.part")
+    data_files.get_index(str(tmp_path)).close()
+
+
+async def test_find_covering_data_file(tmp_path):
+    data_path = str(tmp_path / "data")
+    os.mkdir(data_path)
+    descriptions = {
+        "ExchangeHistoryDataCollector_1.data": _description(["BTC/USDT"], ["1d"], 0, DAY * 10),
+        "ExchangeHistoryDataCollector_2.data": _description(["BTC/USDT"], ["1d"], DAY * 2, DAY * 8),
+        "ExchangeHistoryDataCollector_3.data": _description(["BTC/USDT", "ETH/USDT"], ["1h", "1d"], 0, DAY * 5),
+        "ExchangeHistoryDataCollector_4.data": _description(["ETH/USDT"], ["1h"], 0, DAY * 10),
+    }
+    list_mock, description_mock = _mocked_data_folder(data_path, descriptions)
+    with list_mock, description_mock:
+        # the smallest covering file is selected
+        assert await data_files.find_covering_data_file(
+            "binance", ["BTC/USDT"], [commons_enums.TimeFrames.ONE_DAY], DAY * 3 * 1000, DAY * 5 * 1000,
+            data_path=data_path
+        ) == "ExchangeHistoryDataCollector_2.data"
+        # a file starting from the first available candle covers requests without start
+        assert await data_files.find_covering_data_file(
+            "binance", ["BTC/USDT"], [commons_enums.TimeFrames.ONE_DAY], None, DAY * 5 * 1000,
+            data_path=data_path
+        ) == "ExchangeHistoryDataCollector_1.data"
+        assert await data_files.find_covering_data_file(
+            "binance", ["ETH/USDT"], [commons_enums.TimeFrames.ONE_HOUR], None, DAY * 10 * 1000, data_path=data_path
+        ) == "ExchangeHistoryDataCollector_4.data"
+        assert await data_files.find_covering_data_file(
+            "binance", ["ETH/USDT", "BTC/USDT"], [commons_enums.TimeFrames.ONE_DAY, commons_enums.TimeFrames.ONE_HOUR],
+            DAY * 1000, DAY * 5 * 1000, data_path=data_path
+        ) == "ExchangeHistoryDataCollector_3.data"
+        # files with other symbols or time frames are not used: they would be part of the backtest
+        assert await data_files.find_covering_data_file(
+            "binance", ["ETH/USDT"], [commons_enums.TimeFrames.ONE_DAY], None, DAY * 5 * 1000, data_path=data_path
+        ) is None
+        assert await data_files.find_covering_data_file(
+            "binance", ["BTC/USDT"], [commons_enums.TimeFrames.ONE_HOUR], None, DAY * 5 * 1000, data_path=data_path
+        ) is None
+        assert await data_files.find_covering_data_file(
+            "binance", ["BTC/USDT"], [commons_enums.TimeFrames.ONE_DAY], DAY * 3 * 1000, DAY * 11 * 1000,
+            data_path=data_path
+        ) is None
+        assert await data_files.find_covering_data_file(
+            "binance", ["SOL/USDT"], [commons_enums.TimeFrames.ONE_DAY], DAY * 3 * 1000, DAY * 5 * 1000,
+            data_path=data_path
+        ) is None
+        assert await data_files.find_covering_data_file(
+            "kucoin", ["BTC/USDT"], [commons_enums.TimeFrames.ONE_DAY], DAY * 3 * 1000, DAY * 5 * 1000,
+            data_path=data_path
+        ) is None
+    data_files.get_index(data_path).close()
+
+
+async def test_find_matching_data_file(tmp_path):
+    data_path = str(tmp_path / "data")
+    os.mkdir(data_path)
+    social_description = {"services": ["RedditService"], "symbols": ["BTC/USDT"], "time_frames": [],
+                          "start_timestamp": DAY, "end_timestamp": DAY * 5}
+    descriptions = {
+        "ExchangeHistoryDataCollector_1.data": _description(["BTC/USDT"], ["1d"], DAY, DAY * 5),
+        "ExchangeHistoryDataCollector_2.data": _description(["BTC/USDT", "ETH/USDT"], ["1d"], DAY, DAY * 5),
+        "ExchangeHistoryDataCollector_3.data": _description(["BTC/USDT"], ["1d"], DAY, DAY * 5),
+        "SocialHistoryDataCollector_4.data": social_description,
+    }
+    list_mock, description_mock = _mocked_data_folder(data_path, descriptions)
+    with list_mock, description_mock:
+        # most recent exact match
+        assert await data_files.find_matching_data_file(
+            exchange_name="binance", symbols=["BTC/USDT"], time_frames=[commons_enums.TimeFrames.ONE_DAY],
+            start_timestamp=DAY * 1000, end_timestamp=DAY * 5 * 1000, data_path=data_path
+        ) == "ExchangeHistoryDataCollector_3.data"
+        assert await data_files.find_matching_data_file(
+            exchange_name="binance", symbols=["ETH/USDT", "BTC/USDT"], time_frames=[commons_enums.TimeFrames.ONE_DAY],
+            start_timestamp=DAY * 1000, end_timestamp=DAY * 5 * 1000, data_path=data_path
+        ) == "ExchangeHistoryDataCollector_2.data"
+        # covering files are not exact matches
+        assert await data_files.find_matching_data_file(
+            exchange_name="binance", symbols=["BTC/USDT"], time_frames=[commons_enums.TimeFrames.ONE_DAY],
+            start_timestamp=DAY * 2 * 1000, end_timestamp=DAY * 5 * 1000, data_path=data_path
+        ) is None
+        assert await data_files.find_matching_data_file(
+            services=["RedditService"], symbols=["BTC/USDT"],
+            start_timestamp=DAY * 1000, end_timestamp=DAY * 5 * 1000, data_path=data_path
+        ) == "SocialHistoryDataCollector_4.data"
+        assert await data_files.find_matching_data_file(
+            services=["TwitterService"], symbols=["BTC/USDT"],
+            start_timestamp=DAY * 1000, end_timestamp=DAY * 5 * 1000, data_path=data_path
+        ) is None
+    data_files.get_index(data_path).close()
+
+
+async def test_get_time_window(tmp_path):
+    data_path = str(tmp_path / "data")
+    os.mkdir(data_path)
+    data_file = "ExchangeHistoryDataCollector_1.data"
+    list_mock, description_mock = _mocked_data_folder(
+        data_path, {data_file: _description(["BTC/USDT"], ["1d"], DAY * 2, DAY * 8)}
+    )
+    # not indexed yet
+    assert data_files.get_time_window(data_file, DAY * 3 * 1000, DAY * 5 * 1000, data_path=data_path) is None
+    with list_mock, description_mock:
+        await data_files.register_data_file(data_file, data_path=data_path)
+    assert data_files.get_time_window(
+        data_file, DAY * 3 * 1000, DAY * 5 * 1000, data_path=data_path
+    ) == (DAY * 3, DAY * 5)
+    # the whole file is requested
+    assert data_files.get_time_window(data_file, DAY * 2 * 1000, DAY * 8 * 1000, data_path=data_path) is None
+    data_files.get_index(data_path).close()
+
+    config = {"backtesting": {"files": []}}
+    assert data_files.get_backtesting_time_window(config) == (None, None)
+    data_files.set_backtesting_time_window(config, DAY * 3, DAY * 5)
+    assert data_files.get_backtesting_time_window(config) == (DAY * 3, DAY * 5)
+
+
+async def test_data_files_index(tmp_path):
+    data_path = str(tmp_path / "data")
+    os.mkdir(data_path)
+    descriptions = {
+        "ExchangeHistoryDataCollector_1.data": _description(["BTC/USDT"], ["1d"], 0, DAY * 5),
+        "SocialHistoryDataCollector_2.data": None,
+    }
+    list_mock, description_mock = _mocked_data_folder(data_path, descriptions)
+    with list_mock, description_mock as get_file_description_mock:
+        index = data_files_index.DataFilesIndex(data_path)
+        await index.sync()
+        assert get_file_description_mock.await_count == 2
+        description = index.get("ExchangeHistoryDataCollector_1.data")
+        assert description["symbols"] == ["BTC/USDT"]
+        assert description["size"] == len("ExchangeHistoryDataCollector_1.data")
+        # checksums are computed on demand only
+        assert "checksum" not in description
+        assert index._get_connection().execute("SELECT checksum FROM data_files").fetchone()[0] is None
+        checksum = await index.get_checksum("ExchangeHistoryDataCollector_1.data")
+        assert len(checksum) == 64
+        assert index._get_connection().execute("SELECT checksum FROM data_files").fetchone()[0] == checksum
+        assert await index.get_checksum("ExchangeHistoryDataCollector_1.data") == checksum
+        assert index.get("SocialHistoryDataCollector_2.data") is None
+        assert await index.get_checksum("unknown.data") is None
+        index.close()
+
+        # index is persisted: unchanged data files are not read again
+        index = data_files_index.DataFilesIndex(data_path)
+        await index.sync()
+        assert get_file_description_mock.await_count == 2
+        assert os.path.isfile(str(tmp_path / "data.index.sqlite"))
+
+        # updated data files are ignored until they are indexed again
+        with open(os.path.join(data_path, "ExchangeHistoryDataCollector_1.data"), "a") as f:
+            f.write("new data")
+        assert index.get("ExchangeHistoryDataCollector_1.data") is None
+        assert await index.select("binance", "1 = 1", (), "file_name") == {}
+        get_file_description_mock.assert_awaited_with("ExchangeHistoryDataCollector_1.data", data_path=data_path)
+        assert list(await index.select("binance", "1 = 1", (), "file_name")) == ["ExchangeHistoryDataCollector_1.data"]
+
+        # deleted data files are removed from index
+        os.remove(os.path.join(data_path, "ExchangeHistoryDataCollector_1.data"))
+        await index.sync()
+        assert await index.select("binance", "1 = 1", (), "file_name") == {}
+        index.close()
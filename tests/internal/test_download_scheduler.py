@@ -0,0 +1,189 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import mock
+import pytest
+
+import octobot_trading.errors as trading_errors
+import octobot_script.internal.download_scheduler as download_scheduler
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0
+
+    def __call__(self):
+        return self.time
+
+    async def sleep(self, delay):
+        self.time += delay
+
+
+class StubExchange:
+    """
+    Local exchange accepting at most max_requests requests during each window seconds
+    and responding with rate limit errors otherwise.
+    """
+    def __init__(self, clock, max_requests, window):
+        self.clock = clock
+        self.max_requests = max_requests
+        self.window = window
+        self.accepted_requests = []
+        self.rejected_requests = 0
+
+    def request(self):
+        now = self.clock()
+        if len([timestamp for timestamp in self.accepted_requests if now - timestamp < self.window]) \
+                >= self.max_requests:
+            self.rejected_requests += 1
+            raise trading_errors.RateLimitExceeded("too many requests")
+        self.accepted_requests.append(now)
+
+
+class StubCollector:
+    def __init__(self, exchange, file_name, requests_count=1):
+        self.exchange = exchange
+        self.file_name = file_name
+        self.requests_count = requests_count
+
+    async def initialize(self):
+        pass
+
+    async def start(self):
+        for _ in range(self.requests_count):
+            self.exchange.request()
+
+
+async def _initialize_and_run_data_collector(collector):
+    await collector.initialize()
+    await collector.start()
+    return collector.file_name
+
+
+async def test_token_bucket():
+    clock = FakeClock()
+    bucket = download_scheduler.TokenBucket(2, 2, clock=clock, sleep=clock.sleep)
+    await bucket.acquire()
+    await bucket.acquire()
+    assert clock.time == 0
+    await bucket.acquire()
+    assert clock.time == 0.5
+    bucket.slow_down()
+    assert bucket.rate == 1
+    await bucket.acquire()
+    # the reduced rate also applies to the pending token
+    assert clock.time == 2
+    bucket.speed_up()
+    assert bucket.rate == 1.25
+    for _ in range(10):
+        bucket.speed_up()
+    assert bucket.rate == 2
+
+
+async def test_download_scheduler_with_rate_limited_exchange():
+    clock = FakeClock()
+    exchange = StubExchange(clock, max_requests=1, window=1)
+    scheduler = download_scheduler.DownloadScheduler(
+        collections_per_second=10, burst=10, max_retries=5, backoff_seconds=0.5, clock=clock, sleep=clock.sleep
+    )
+    with mock.patch.object(download_scheduler.backtesting_api, "initialize_and_run_data_collector",
+                           mock.AsyncMock(side_effect=_initialize_and_run_data_collector)):
+        assert await asyncio.gather(*(
+            scheduler.run("binance", lambda name=f"data_{index}": StubCollector(exchange, name))
+            for index in range(3)
+        )) == ["data_0", "data_1", "data_2"]
+    assert exchange.rejected_requests > 0
+    assert len(exchange.accepted_requests) == 3
+    # requests got spread over time
+    assert exchange.accepted_requests[-1] - exchange.accepted_requests[0] >= 2
+    assert scheduler.get_bucket("binance").rate < 10
+
+
+async def test_download_scheduler_budget_limits_collections():
+    clock = FakeClock()
+    exchange = StubExchange(clock, max_requests=100, window=1)
+    scheduler = download_scheduler.DownloadScheduler(
+        collections_per_second=1, burst=1, clock=clock, sleep=clock.sleep
+    )
+    with mock.patch.object(download_scheduler.backtesting_api, "initialize_and_run_data_collector",
+                           mock.AsyncMock(side_effect=_initialize_and_run_data_collector)):
+        await asyncio.gather(*(
+            scheduler.run("binance", lambda name=f"data_{index}": StubCollector(exchange, name, requests_count=3))
+            for index in range(3)
+        ))
+    assert len(exchange.accepted_requests) == 9
+    # one token per collection: only the 2nd and 3rd collections waited, not their requests
+    assert clock.time == 2
+
+
+async def test_download_scheduler_budgets_and_errors():
+    clock = FakeClock()
+    exchange = StubExchange(clock, max_requests=0, window=1)
+    scheduler = download_scheduler.DownloadScheduler(
+        collections_per_second=10, burst=1, budgets={"kucoin": 1}, max_retries=2, backoff_seconds=1,
+        clock=clock, sleep=clock.sleep
+    )
+    assert scheduler.get_bucket("binance").rate == 10
+    assert scheduler.get_bucket("kucoin").rate == 1
+    with mock.patch.object(download_scheduler.backtesting_api, "initialize_and_run_data_collector",
+                           mock.AsyncMock(side_effect=_initialize_and_run_data_collector)):
+        with pytest.raises(trading_errors.RateLimitExceeded):
+            await scheduler.run("binance", lambda: StubCollector(exchange, "data"))
+        assert exchange.rejected_requests == 3
+        # other errors are not retried
+        with pytest.raises(ZeroDivisionError):
+            await scheduler.run("binance", lambda: 1 / 0)
+
+
+async def test_download_scheduler_progress():
+    collector = mock.Mock()
+    progress_callback = mock.Mock()
+    scheduler = download_scheduler.DownloadScheduler(progress_callback=progress_callback, progress_interval=0.01)
+
+    async def _long_collection(_):
+        await asyncio.sleep(0.05)
+        return "data"
+
+    with mock.patch.object(download_scheduler.backtesting_api, "initialize_and_run_data_collector",
+                           mock.AsyncMock(side_effect=_long_collection)), \
+            mock.patch.object(download_scheduler.backtesting_api, "get_data_collector_progress",
+                              mock.Mock(return_value=(1, 2, 50))):
+        assert await scheduler.run("binance", lambda: collector) == "data"
+    progress_callback.assert_called_with("binance", 1, 2, 50)
+
+    # social data collectors have no progress to report
+    progress_callback.reset_mock()
+    with mock.patch.object(download_scheduler.backtesting_api, "initialize_and_run_data_collector",
+                           mock.AsyncMock(side_effect=_long_collection)), \
+            mock.patch.object(download_scheduler.backtesting_api, "get_data_collector_progress",
+                              mock.Mock(side_effect=AttributeError)) as get_data_collector_progress_mock:
+        assert await scheduler.run("reddit", lambda: StubCollector(None, "social_data")) == "data"
+    get_data_collector_progress_mock.assert_not_called()
+    progress_callback.assert_not_called()
+
+
+async def test_is_rate_limit_error():
+    class DDoSProtection(Exception):
+        pass
+
+    assert download_scheduler.is_rate_limit_error(trading_errors.RateLimitExceeded())
+    assert download_scheduler.is_rate_limit_error(DDoSProtection())
+    assert not download_scheduler.is_rate_limit_error(ValueError())
@@ -0,0 +1,88 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import mock
+import pytest
+
+import octobot_backtesting.api as backtesting_api
+import octobot_trading.api as trading_api
+import octobot_script.internal.early_stopping as early_stopping
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _ctx():
+    return mock.Mock(exchange_manager=mock.Mock(exchange=mock.Mock(backtesting=mock.Mock(
+        time_manager=mock.Mock(current_timestamp=1000, finishing_timestamp=5000)
+    ))))
+
+
+def _finishing_timestamp(ctx):
+    return ctx.exchange_manager.exchange.backtesting.time_manager.finishing_timestamp
+
+
+@pytest.fixture(autouse=True)
+def current_time():
+    with mock.patch.object(backtesting_api, "get_backtesting_current_time",
+                           mock.Mock(side_effect=lambda backtesting: backtesting.time_manager.current_timestamp)):
+        yield
+
+
+async def test_check_max_drawdown():
+    ctx = _ctx()
+    stopping = early_stopping.EarlyStopping(max_drawdown=20)
+    with mock.patch.object(trading_api, "get_current_portfolio_value",
+                           mock.Mock(side_effect=[1000, 1200, 1000, 961, 950])):
+        # 0, 0, 16.7 and 19.9% drawdown from 1200
+        for _ in range(4):
+            assert await stopping.check(ctx) is False
+        assert _finishing_timestamp(ctx) == 5000
+        assert stopping.pruned_timestamp is None
+        # 20.8% drawdown
+        assert await stopping.check(ctx) is True
+    assert stopping.pruned is True
+    # backtesting finishes after the current iteration
+    assert stopping.pruned_timestamp == 1000
+    assert _finishing_timestamp(ctx) == 1000
+    # no more check once pruned
+    assert await stopping.check(ctx) is True
+
+
+async def test_check_stop_condition():
+    ctx = _ctx()
+    calls = []
+
+    async def stop_condition(stop_ctx):
+        calls.append(stop_ctx)
+        return len(calls) == 2
+
+    stopping = early_stopping.EarlyStopping(stop_condition=stop_condition, check_interval=3)
+    for _ in range(5):
+        assert await stopping.check(ctx) is False
+    # only called every 3 checks
+    assert calls == [ctx]
+    assert await stopping.check(ctx) is True
+    assert calls == [ctx, ctx]
+    assert _finishing_timestamp(ctx) == 1000
+
+
+async def test_check_sync_stop_condition():
+    ctx = _ctx()
+    stopping = early_stopping.EarlyStopping(stop_condition=lambda _: True, check_interval=1)
+    assert await stopping.check(ctx) is True
+    assert stopping.pruned is True
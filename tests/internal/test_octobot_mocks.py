@@ -0,0 +1,127 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+import mock
+
+import octobot_script.internal.octobot_mocks as octobot_mocks
+
+
+class FakeTentaclesSetupConfig:
+    def __init__(self):
+        self.is_successfully_loaded = True
+        self.tentacles_activation = {"Evaluator": {"RSIMomentumEvaluator": True}}
+        self.registered_tentacles = {}
+        self.installation_context = {}
+
+
+def _touch(file_path, content):
+    with open(file_path, "w") as f:
+        f.write(content)
+    # ensure the modification time changes even on coarse file systems
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_get_config_is_cached(tmp_path):
+    config_path = str(tmp_path / "config_mock.json")
+    _touch(config_path, json.dumps({"backtesting": {"files": []}}))
+    with mock.patch.object(octobot_mocks, "get_module_config_path", mock.Mock(return_value=config_path)), \
+            mock.patch.object(octobot_mocks, "_load_json", mock.Mock(wraps=octobot_mocks._load_json)) \
+            as load_json_mock:
+        config = octobot_mocks.get_config()
+        config["backtesting"]["files"].append("data")
+        # returned configs are copies
+        assert octobot_mocks.get_config() == {"backtesting": {"files": []}}
+        load_json_mock.assert_called_once()
+        # updated file is read again
+        _touch(config_path, json.dumps({"backtesting": {"files": ["data"]}}))
+        assert octobot_mocks.get_config() == {"backtesting": {"files": ["data"]}}
+        assert load_json_mock.call_count == 2
+
+
+def test_clear_cache(tmp_path):
+    config_path = str(tmp_path / "config_mock.json")
+    _touch(config_path, json.dumps({"backtesting": {"files": []}}))
+    with mock.patch.object(octobot_mocks, "get_module_config_path", mock.Mock(return_value=config_path)), \
+            mock.patch.object(octobot_mocks, "_load_json", mock.Mock(wraps=octobot_mocks._load_json)) \
+            as load_json_mock:
+        octobot_mocks.get_config()
+        octobot_mocks.get_config()
+        load_json_mock.assert_called_once()
+        # unchanged file is read again once the cache is cleared
+        octobot_mocks.clear_cache()
+        octobot_mocks.get_config()
+        assert load_json_mock.call_count == 2
+
+
+def test_get_tentacles_config_is_cached(tmp_path):
+    config_path = str(tmp_path / "tentacles_config.json")
+    _touch(config_path, "{}")
+    with mock.patch.object(octobot_mocks, "_get_tentacles_config_path", mock.Mock(return_value=config_path)), \
+            mock.patch.object(octobot_mocks.octobot_tentacles_manager_api, "get_tentacles_setup_config",
+                              mock.Mock(side_effect=lambda _: FakeTentaclesSetupConfig())) \
+            as get_tentacles_setup_config_mock:
+        tentacles_config = octobot_mocks.get_tentacles_config()
+        tentacles_config.tentacles_activation["Evaluator"]["RSIMomentumEvaluator"] = False
+        # returned configs are copies
+        assert octobot_mocks.get_tentacles_config().tentacles_activation["Evaluator"]["RSIMomentumEvaluator"] is True
+        get_tentacles_setup_config_mock.assert_called_once_with(config_path)
+
+        # forced activations are part of the cache key
+        forced_config = octobot_mocks.get_tentacles_config({"Services": {"RedditServiceFeed": True}})
+        assert forced_config.tentacles_activation["Services"] == {"RedditServiceFeed": True}
+        assert octobot_mocks.get_tentacles_config().tentacles_activation["Services"] == {}
+        assert get_tentacles_setup_config_mock.call_count == 2
+
+        # updated file is read again
+        _touch(config_path, "{\"updated\": true}")
+        octobot_mocks.get_tentacles_config()
+        assert get_tentacles_setup_config_mock.call_count == 3
+
+
+def test_get_activated_social_services_is_memoized(tmp_path):
+    config_path = str(tmp_path / "tentacles_config.json")
+    tentacles_path = str(tmp_path / "tentacles")
+    _touch(config_path, "{}")
+    os.mkdir(tentacles_path)
+    tentacles_config = FakeTentaclesSetupConfig()
+    tentacles_config.tentacles_activation["Services"] = {"AlternativeMeServiceFeed": True, "RedditServiceFeed": True}
+    feeds_sources = {
+        "AlternativeMeServiceFeed": {"topic_fear_and_greed"},
+        "RedditServiceFeed": {"reddit"},
+        "TwitterServiceFeed": {"twitter"},
+    }
+    with mock.patch.object(octobot_mocks, "_get_tentacles_config_path", mock.Mock(return_value=config_path)), \
+            mock.patch.object(octobot_mocks, "get_imported_tentacles_path", mock.Mock(return_value=tentacles_path)), \
+            mock.patch.object(octobot_mocks, "get_tentacles_config", mock.Mock(return_value=tentacles_config)) \
+            as get_tentacles_config_mock, \
+            mock.patch.object(octobot_mocks, "_inspect_backtestable_feeds_sources",
+                              mock.Mock(return_value=feeds_sources)) as inspect_mock:
+        for _ in range(3):
+            assert octobot_mocks.get_activated_social_services() == ["AlternativeMeServiceFeed", "RedditServiceFeed"]
+        assert octobot_mocks.get_activated_social_services(requested_sources=["Reddit"]) == ["RedditServiceFeed"]
+        inspect_mock.assert_called_once()
+        assert get_tentacles_config_mock.call_count == 2
+
+        # tentacles installed again
+        os.rmdir(tentacles_path)
+        os.mkdir(tentacles_path)
+        os.utime(tentacles_path, ns=(0, 1))
+        assert octobot_mocks.get_activated_social_services() == ["AlternativeMeServiceFeed", "RedditServiceFeed"]
+        assert inspect_mock.call_count == 2
+        assert get_tentacles_config_mock.call_count == 3
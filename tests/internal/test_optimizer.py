@@ -0,0 +1,203 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import pytest
+
+import octobot_script.model as models
+import octobot_script.internal.optimizer as optimizer
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+class FakeRunner:
+    """
+    Computes metrics from strategy configs, keeping track of the concurrent runs.
+    """
+    def __init__(self, prune=None, fail=None):
+        self.runs = []
+        self.running = 0
+        self.max_running = 0
+        self.prune = prune
+        self.fail = fail
+
+    async def submit(self, strategy_config):
+        self.runs.append(strategy_config)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0)
+        self.running -= 1
+        if self.fail is not None and self.fail(strategy_config):
+            raise RuntimeError(f"{strategy_config} failed")
+        x, y = strategy_config["x"], strategy_config.get("y", 0)
+        return models.BacktestMetrics(
+            strategy_config,
+            # best at x = 3, y = 7
+            profitability=100 - (x - 3) ** 2 - (y - 7) ** 2,
+            max_drawdown=abs(x),
+            pruned=self.prune is not None and self.prune(strategy_config),
+        )
+
+
+def _mean_value(trials):
+    return sum(trial.value for trial in trials) / len(trials)
+
+
+async def test_grid():
+    runner = FakeRunner()
+    result = await optimizer.optimize(
+        runner.submit, {"x": [1, 3, 5], "y": (6, 8)}, "profitability", workers=2, strategy_config={"z": 1}
+    )
+    assert len(runner.runs) == len(result.trials) == 9
+    assert runner.max_running == 2
+    assert result.best_config == {"z": 1, "x": 3, "y": 7}
+    assert result.best_metrics.profitability == 100
+    assert [trial.strategy_config for trial in result.best(3)][0] == {"z": 1, "x": 3, "y": 7}
+    assert len(result.to_sweep_results()) == 9
+
+
+async def test_grid_with_float_range():
+    with pytest.raises(ValueError):
+        await optimizer.optimize(FakeRunner().submit, {"x": (1.0, 5.0)}, "profitability")
+
+
+async def test_minimize_and_budget():
+    runner = FakeRunner()
+    result = await optimizer.optimize(
+        runner.submit, {"x": [-4, -1, 2, 5]}, lambda metrics: metrics.max_drawdown, maximize=False, budget=3
+    )
+    assert len(runner.runs) == 3
+    assert result.best_config == {"x": -1}
+    assert result.best_trial.value == 1
+
+
+async def test_random():
+    runner = FakeRunner()
+    result = await optimizer.optimize(
+        runner.submit, {"x": (0.0, 10.0), "y": range(20)}, "profitability", method=optimizer.RANDOM,
+        budget=30, workers=4, seed=1
+    )
+    assert len(runner.runs) == 30
+    assert runner.max_running == 4
+    assert all(0 <= config["x"] <= 10 and isinstance(config["y"], int) for config in runner.runs)
+    # same seed: same proposals
+    other_runner = FakeRunner()
+    await optimizer.optimize(
+        other_runner.submit, {"x": (0.0, 10.0), "y": range(20)}, "profitability", method=optimizer.RANDOM,
+        budget=30, workers=4, seed=1
+    )
+    assert other_runner.runs == runner.runs
+    with pytest.raises(ValueError):
+        await optimizer.optimize(runner.submit, {"x": (0.0, 10.0)}, "profitability", method=optimizer.RANDOM)
+
+
+async def test_random_exhausted_search_space():
+    runner = FakeRunner()
+    result = await optimizer.optimize(
+        runner.submit, {"x": [1, 2, 3]}, "profitability", method=optimizer.RANDOM, budget=10, seed=1
+    )
+    # each config is only run once
+    assert sorted(config["x"] for config in runner.runs) == [1, 2, 3]
+    assert len(result.trials) == 3
+
+
+async def test_tpe_converges():
+    search_space = {"x": (-20.0, 20.0), "y": (-20, 20)}
+    tpe_result = await optimizer.optimize(
+        FakeRunner().submit, search_space, "profitability", method=optimizer.TPE, budget=60, seed=2
+    )
+    random_result = await optimizer.optimize(
+        FakeRunner().submit, search_space, "profitability", method=optimizer.RANDOM, budget=60, seed=2
+    )
+    assert tpe_result.best_trial.value > 95
+    # later trials are in the best region
+    assert _mean_value(tpe_result.trials[-20:]) > 50
+    assert _mean_value(tpe_result.trials[-20:]) > _mean_value(tpe_result.trials[:20])
+    assert _mean_value(tpe_result.trials[-20:]) > _mean_value(random_result.trials[-20:])
+
+
+async def test_cache():
+    runner = FakeRunner()
+    cache = {}
+    await optimizer.optimize(runner.submit, {"x": [1, 2]}, "profitability", cache=cache)
+    assert len(cache) == 2
+    result = await optimizer.optimize(runner.submit, {"x": [1, 2, 3]}, "profitability", cache=cache)
+    # only x = 3 is run again
+    assert runner.runs == [{"x": 1}, {"x": 2}, {"x": 3}]
+    assert [trial.cached for trial in result.trials] == [True, True, False]
+    assert result.best_config == {"x": 3}
+    assert optimizer.get_config_hash({"x": 1, "y": 2}) == optimizer.get_config_hash({"y": 2, "x": 1})
+
+    # runs of other data files or strategies are not reused
+    def strategy(ctx):
+        pass
+
+    def other_strategy(ctx):
+        pass
+
+    run_key = optimizer.get_run_key(["data_file"], strategy_func=strategy, max_drawdown=10)
+    assert run_key == optimizer.get_run_key(["data_file"], strategy_func=strategy, max_drawdown=10)
+    for other_run_key in (
+        optimizer.get_run_key(["other_data_file"], strategy_func=strategy, max_drawdown=10),
+        optimizer.get_run_key(["data_file"], strategy_func=other_strategy, max_drawdown=10),
+        optimizer.get_run_key(["data_file"], strategy_func=strategy, max_drawdown=20),
+    ):
+        assert optimizer.get_config_hash({"x": 1}, run_key) != optimizer.get_config_hash({"x": 1}, other_run_key)
+    result = await optimizer.optimize(runner.submit, {"x": [1, 2]}, "profitability", cache=cache, run_key=run_key)
+    assert [trial.cached for trial in result.trials] == [False, False]
+    assert len(cache) == 5
+
+
+async def test_pruned_runs():
+    runner = FakeRunner(prune=lambda strategy_config: strategy_config["x"] == 3)
+    result = await optimizer.optimize(runner.submit, {"x": [1, 3, 4]}, "profitability")
+    assert [trial.value for trial in result.trials] == [47, None, 50]
+    assert result.best_config == {"x": 4}
+    assert [trial.strategy_config for trial in result.best(5)] == [{"x": 4}, {"x": 1}]
+
+
+async def test_failed_runs():
+    runner = FakeRunner(fail=lambda strategy_config: strategy_config["x"] == 3)
+    cache = {}
+    result = await optimizer.optimize(runner.submit, {"x": [1, 3, 4]}, "profitability", workers=2, cache=cache)
+    # completed runs are kept
+    assert [trial.value for trial in result.trials] == [47, None, 50]
+    failed_trial = result.trials[1]
+    assert failed_trial.metrics is None
+    assert isinstance(failed_trial.error, RuntimeError)
+    assert "failed" in failed_trial.describe()
+    assert result.best_config == {"x": 4}
+    assert len(result.to_sweep_results()) == 2
+    # failed runs are not cached
+    assert len(cache) == 2
+
+
+async def test_tpe_with_failed_runs():
+    runner = FakeRunner(fail=lambda strategy_config: strategy_config["x"] > 8)
+    result = await optimizer.optimize(
+        runner.submit, {"x": (-10.0, 10.0), "y": (-10.0, 10.0)}, "profitability", method="tpe", budget=40, seed=1
+    )
+    assert len(result.trials) == 40
+    # failed runs count as the worst ones
+    assert any(trial.error is not None for trial in result.trials)
+    assert result.best_trial.metrics is not None
+
+
+async def test_unknown_method():
+    with pytest.raises(ValueError):
+        await optimizer.optimize(FakeRunner().submit, {"x": [1]}, "profitability", method="unknown")
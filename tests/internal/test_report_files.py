@@ -0,0 +1,86 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+import mock
+import pytest
+
+import octobot_script.internal.report_files as report_files
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_dumps():
+    content = {"a": [1, 2.5, "b"], "c": {"d": None}}
+    assert json.loads(report_files.dumps(content)) == content
+    with mock.patch.object(report_files, "orjson", None):
+        assert report_files.dumps(content) == b'{"a":[1,2.5,"b"],"c":{"d":null}}'
+
+
+async def test_write_bundle(tmp_path):
+    file_path = str(tmp_path / "report.json")
+    report_files.write_bundle(file_path, report_files.dumps({"title": "BTC/USDT"}), report_files.dumps({"x": [1]}))
+    with open(file_path) as bundle_file:
+        assert json.load(bundle_file) == {"meta": {"title": "BTC/USDT"}, "data": {"x": [1]}}
+    assert not os.path.exists(f"{file_path}{report_files.TEMP_FILE_SUFFIX}")
+
+
+async def test_link_or_copy(tmp_path):
+    source_path = str(tmp_path / "source.json")
+    target_path = str(tmp_path / "target.json")
+    report_files.write_json_parts(source_path, b"[1]")
+    report_files.link_or_copy(source_path, target_path)
+    assert os.path.samefile(source_path, target_path)
+    # replacing the target does not change the source
+    report_files.write_json_parts(target_path, b"[2]")
+    with open(source_path, "rb") as source_file:
+        assert source_file.read() == b"[1]"
+    # copy when links are not supported
+    with mock.patch.object(os, "link", mock.Mock(side_effect=OSError)):
+        report_files.link_or_copy(source_path, target_path)
+    assert not os.path.samefile(source_path, target_path)
+    with open(target_path, "rb") as target_file:
+        assert target_file.read() == b"[1]"
+
+
+@pytest.mark.parametrize("compression", [None, report_files.GZIP, report_files.ZSTD])
+async def test_compressed_bundle(tmp_path, compression):
+    if compression == report_files.ZSTD:
+        pytest.importorskip("zstandard")
+    file_path = str(tmp_path / "report.json")
+    written_path = report_files.write_bundle(file_path, b'{"title":"a"}', b"[1,2]", compression=compression)
+    assert report_files.find_file(file_path) == (written_path, compression)
+    assert json.loads(report_files.read_file(file_path)) == {"meta": {"title": "a"}, "data": [1, 2]}
+    if compression is not None:
+        assert written_path == f"{file_path}{report_files.COMPRESSED_FILE_EXTENSIONS[compression]}"
+        with open(written_path, "rb") as written_file:
+            assert json.loads(report_files.decompress(written_file.read(), compression))["data"] == [1, 2]
+
+
+async def test_remove_file_variants(tmp_path):
+    file_path = str(tmp_path / "report.json")
+    plain_path = report_files.write_json_parts(file_path, b"[1]")
+    gzip_path = report_files.write_json_parts(file_path, b"[1]", compression=report_files.GZIP)
+    report_files.remove_file_variants(file_path, keep=gzip_path)
+    assert not os.path.exists(plain_path)
+    assert report_files.find_file(file_path) == (gzip_path, report_files.GZIP)
+    report_files.remove_file_variants(file_path)
+    assert report_files.find_file(file_path) is None
+    with pytest.raises(FileNotFoundError):
+        report_files.read_file(file_path)
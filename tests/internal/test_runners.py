@@ -0,0 +1,125 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import decimal
+import mock
+import numpy as np
+import pytest
+
+import octobot_backtesting.api as backtesting_api
+import octobot_trading.api as trading_api
+
+import octobot_script.model as models
+import octobot_script.internal.runners as runners
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _backtest_result():
+    candle_manager = mock.Mock(
+        get_preloaded_symbol_candles_count=mock.Mock(return_value=100),
+        get_preloaded_symbol_time_candles=mock.Mock(return_value=np.arange(100, dtype=np.float64) * 3600),
+    )
+    backtesting_data = mock.Mock(preloaded_candle_managers={"BTC/USDT1h": candle_manager})
+    return models.BacktestResult(backtesting_data, {"period": 10})
+
+
+def _independent_backtesting():
+    return mock.Mock(
+        octobot_backtesting=mock.Mock(bot_id="bot_id", exchange_manager_ids=["exchange_1", "exchange_2"]),
+        get_dict_formatted_report=mock.AsyncMock(return_value={"bot_report": {}}),
+    )
+
+
+async def _gather_results(independent_backtesting, backtest_result, metrics_only, end_timestamp=None):
+    with mock.patch.object(backtesting_api, "get_backtesting_duration", mock.Mock(return_value=1.5)), \
+         mock.patch.object(trading_api, "get_exchange_managers_from_exchange_ids",
+                           mock.Mock(side_effect=lambda ids: ids)), \
+         mock.patch.object(trading_api, "get_profitability_stats",
+                           mock.Mock(side_effect=lambda exchange_manager: (
+                               None, decimal.Decimal("10") if exchange_manager == "exchange_1" else 20,
+                               None, decimal.Decimal("5"), None
+                           ))), \
+         mock.patch.object(trading_api, "get_current_portfolio_value",
+                           mock.Mock(return_value=decimal.Decimal("1000"))), \
+         mock.patch.object(trading_api, "get_trade_history", mock.Mock(return_value=["trade_1", "trade_2"])), \
+         mock.patch.object(trading_api, "get_draw_down",
+                           mock.Mock(side_effect=lambda exchange_manager: (
+                               decimal.Decimal("3") if exchange_manager == "exchange_1" else decimal.Decimal("7")
+                           ))):
+        await runners._gather_results(independent_backtesting, backtest_result, metrics_only, end_timestamp)
+
+
+async def test_gather_results():
+    backtest_result = _backtest_result()
+    independent_backtesting = _independent_backtesting()
+    await _gather_results(independent_backtesting, backtest_result, False)
+    assert backtest_result.independent_backtesting is independent_backtesting
+    assert backtest_result.report == {"bot_report": {}}
+    assert backtest_result.duration == 1.5
+    assert backtest_result.candles_count == 100
+    assert backtest_result.bot_id == "bot_id"
+    assert backtest_result.metrics.to_dict() == {
+        "strategy_config": {"period": 10},
+        "bot_id": "bot_id",
+        "duration": 1.5,
+        "candles_count": 100,
+        "profitability": 15,
+        "market_average_profitability": 5,
+        "end_portfolio_value": 2000,
+        "trades_count": 4,
+        "max_drawdown": 7,
+        "pruned": False,
+    }
+
+
+async def test_gather_results_metrics_only():
+    backtest_result = _backtest_result()
+    independent_backtesting = _independent_backtesting()
+    await _gather_results(independent_backtesting, backtest_result, True)
+    # the backtesting instance is not referenced and its report is not computed
+    assert backtest_result.independent_backtesting is None
+    assert backtest_result.report == {}
+    independent_backtesting.get_dict_formatted_report.assert_not_called()
+    assert backtest_result.metrics.profitability == 15
+    assert backtest_result.metrics.trades_count == 4
+    assert not hasattr(backtest_result.metrics, "__dict__")
+
+
+async def test_gather_results_of_pruned_run():
+    backtest_result = _backtest_result()
+    backtest_result.pruned = True
+    await _gather_results(_independent_backtesting(), backtest_result, True, end_timestamp=9 * 3600)
+    # only candles until the run was stopped are counted
+    assert backtest_result.candles_count == 10
+    assert backtest_result.metrics.candles_count == 10
+    assert backtest_result.metrics.pruned is True
+
+
+async def test_build_script_with_early_stopping():
+    strategy_func = mock.AsyncMock()
+    early_stopping = mock.Mock(pruned=False, check=mock.AsyncMock(return_value=False))
+    script = runners._build_script(strategy_func, None, early_stopping)
+    await script("ctx")
+    strategy_func.assert_awaited_once_with("ctx")
+    early_stopping.check.assert_awaited_once_with("ctx")
+    # nothing is executed once pruned
+    early_stopping.pruned = True
+    await script("ctx")
+    strategy_func.assert_awaited_once()
+    early_stopping.check.assert_awaited_once()
@@ -0,0 +1,90 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import mock
+import numpy as np
+import pytest
+
+import octobot_script.internal.signals as signals
+
+
+def test_signals_schedule():
+    schedule = signals.SignalsSchedule({
+        "time": np.array([10, 20, 30, 40], dtype=np.float64),
+        "entries": np.array([True, False, True, False]),
+        "exits": np.array([False, True, False, True]),
+        "amount": "10%",
+        "stop_loss_offset": np.array([-15, np.nan, np.nan, np.nan]),
+        "take_profit_offset": 25,
+    })
+    assert schedule.get_signal_times() == [10, 20, 30, 40]
+    assert schedule.orders_by_time == {
+        10: [("buy", {"amount": "10%", "stop_loss_offset": "-15.0%", "take_profit_offset": "25.0%"})],
+        20: [("sell", {"amount": "100%"})],
+        30: [("buy", {"amount": "10%", "take_profit_offset": "25.0%"})],
+        40: [("sell", {"amount": "100%"})],
+    }
+
+
+def test_signals_schedule_with_amounts_array():
+    schedule = signals.SignalsSchedule({
+        "time": [10, 20],
+        "entries": [True, True],
+        "amount": np.array([1.5, 2]),
+    })
+    assert schedule.orders_by_time == {
+        10: [("buy", {"amount": 1.5})],
+        20: [("buy", {"amount": 2})],
+    }
+
+
+def test_signals_schedule_invalid_signals():
+    with pytest.raises(ValueError):
+        signals.SignalsSchedule({"time": [10, 20]})
+    with pytest.raises(ValueError):
+        signals.SignalsSchedule({"time": [10, 20], "entries": [True], "amount": 1})
+    with pytest.raises(ValueError):
+        signals.SignalsSchedule({"time": [10, 20], "entries": [True, False]})
+    with pytest.raises(ValueError):
+        signals.SignalsSchedule({"time": [10, 20], "entries": [True, False], "amount": [1]})
+    with pytest.raises(ValueError):
+        signals.SignalsSchedule({"time": [10, 20], "entries": [True, False], "amount": 1, "size": 1})
+
+
+@pytest.mark.asyncio
+async def test_build_strategy():
+    schedule = signals.SignalsSchedule({
+        "time": [10, 20],
+        "entries": [True, False],
+        "exits": [False, True],
+        "amount": "10%",
+    })
+    ctx = mock.Mock()
+    import octobot_script as obs
+    with mock.patch.object(signals.backtesting_api, "register_backtesting_timestamp_whitelist", mock.Mock()) \
+            as register_mock, \
+            mock.patch.object(signals.backtesting_api, "get_backtesting_ending_time", mock.Mock(return_value=100)), \
+            mock.patch.object(obs, "current_live_time", mock.Mock(return_value=20), create=True), \
+            mock.patch.object(obs, "market", mock.AsyncMock(), create=True) as market_mock:
+        strategy = schedule.build_strategy()
+        await strategy(ctx)
+        register_mock.assert_called_once()
+        # signal times and backtesting end time
+        assert register_mock.mock_calls[0].args[1] == [10, 20, 100]
+        market_mock.assert_awaited_once_with(ctx, "sell", amount="100%")
+        await strategy(ctx)
+        # whitelist is only registered once
+        register_mock.assert_called_once()
@@ -0,0 +1,39 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import octobot_script.internal.startup_profiler as startup_profiler
+
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       490 |        490 |   appdirs
+import time:       229 |        229 |   octobot_script.constants
+import time:      1000 |       2000 |     octobot_trading.enums
+import time:      3000 |       5000 |   octobot_trading
+import time:      3243 |       8962 | octobot_script
+"""
+
+
+def test_parse_import_times():
+    import_times = startup_profiler.parse_import_times(IMPORTTIME_OUTPUT)
+    assert import_times[0] == ("appdirs", 0.00049, 0.00049)
+    assert len(import_times) == 5
+    assert startup_profiler.get_total_import_time(import_times, "octobot_script") == 0.008962
+    assert startup_profiler.get_total_import_time(import_times, "octobot") == 0
+    assert startup_profiler.get_import_time_by_package(import_times) == {
+        "octobot_trading": 0.004,
+        "octobot_script": 0.003243 + 0.000229,
+        "appdirs": 0.00049,
+    }
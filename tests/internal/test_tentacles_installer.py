@@ -0,0 +1,221 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import contextlib
+import os
+import pathlib
+import zipfile
+import mock
+import pytest
+
+import octobot_tentacles_manager.api as tentacles_manager_api
+import octobot_script.internal.tentacles_installer as tentacles_installer
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _create_archive(archive_path, files):
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return str(archive_path)
+
+
+def _read_archive(archive_path):
+    with zipfile.ZipFile(archive_path) as archive:
+        return {name: archive.read(name).decode() for name in archive.namelist()}
+
+
+class FakeContent:
+    def __init__(self, content):
+        self.content = content
+
+    async def iter_chunked(self, _):
+        yield self.content
+
+
+class FakeSession:
+    """
+    Serves the archives of files_by_url, keeping track of the concurrently running downloads.
+    """
+    def __init__(self, files_by_url):
+        self.files_by_url = files_by_url
+        self.running_downloads = 0
+        self.max_running_downloads = 0
+
+    @contextlib.asynccontextmanager
+    async def get(self, url):
+        if url not in self.files_by_url:
+            raise ConnectionError(f"{url} not found")
+        self.running_downloads += 1
+        self.max_running_downloads = max(self.max_running_downloads, self.running_downloads)
+        await asyncio.sleep(0.01)
+        response = mock.Mock(content=FakeContent(pathlib.Path(self.files_by_url[url]).read_bytes()))
+        try:
+            yield response
+        finally:
+            self.running_downloads -= 1
+
+
+async def test_fetch_archives_local_archives(tmp_path):
+    archive = _create_archive(tmp_path / "local.zip", {"reference_tentacles/Trading/a.py": "a"})
+    assert await tentacles_installer.fetch_archives(
+        [archive, pathlib.Path(archive).as_uri()], str(tmp_path)
+    ) == [archive, archive]
+
+
+async def test_fetch_archives_downloads_concurrently(tmp_path):
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    urls = {
+        f"https://tentacles.test/{index}.zip": _create_archive(
+            source_dir / f"{index}.zip", {f"reference_tentacles/Trading/{index}.py": str(index)}
+        )
+        for index in range(3)
+    }
+    session = FakeSession(urls)
+    archives = await tentacles_installer.fetch_archives(list(urls), str(tmp_path), aiohttp_session=session)
+    assert session.max_running_downloads == 3
+    assert [_read_archive(archive) for archive in archives] == [
+        {"reference_tentacles/Trading/0.py": "0"},
+        {"reference_tentacles/Trading/1.py": "1"},
+        {"reference_tentacles/Trading/2.py": "2"},
+    ]
+
+
+async def test_merge_archives(tmp_path):
+    first = _create_archive(tmp_path / "first.zip", {"reference_tentacles/Trading/a.py": "a1",
+                                                     "reference_tentacles/Trading/b.py": "b1"})
+    second = _create_archive(tmp_path / "second.zip", {"reference_tentacles/Trading/b.py": "b2",
+                                                       "reference_tentacles/Evaluator/c.py": "c2"})
+    merged = tentacles_installer.merge_archives([first, second], str(tmp_path / "merged.zip"))
+    assert _read_archive(merged) == {
+        "reference_tentacles/Trading/a.py": "a1",
+        "reference_tentacles/Trading/b.py": "b2",
+        "reference_tentacles/Evaluator/c.py": "c2",
+    }
+
+
+async def test_install_archives(tmp_path):
+    first = _create_archive(tmp_path / "first.zip", {"reference_tentacles/Trading/a.py": "a"})
+    second = _create_archive(tmp_path / "second.zip", {"reference_tentacles/Evaluator/b.py": "b"})
+    installed_files = []
+
+    async def _install_all_tentacles(archive, **_):
+        installed_files.append(_read_archive(archive))
+        return 0
+
+    with mock.patch.object(tentacles_manager_api, "install_all_tentacles",
+                           mock.AsyncMock(side_effect=_install_all_tentacles)) as install_all_tentacles_mock:
+        assert await tentacles_installer.install_archives(
+            [first, pathlib.Path(second).as_uri()], "tentacles", "install"
+        ) == 0
+        # single install step for every archive
+        install_all_tentacles_mock.assert_awaited_once()
+        assert install_all_tentacles_mock.await_args.kwargs["tentacle_path"] == "tentacles"
+        assert install_all_tentacles_mock.await_args.kwargs["bot_install_dir"] == "install"
+    assert installed_files == [{"reference_tentacles/Trading/a.py": "a", "reference_tentacles/Evaluator/b.py": "b"}]
+    # temporary files are removed
+    assert not os.path.exists(install_all_tentacles_mock.await_args.args[0])
+
+
+async def test_install_archives_with_download_errors(tmp_path):
+    local = _create_archive(tmp_path / "local.zip", {"reference_tentacles/Trading/a.py": "a"})
+    url = "https://tentacles.test/tentacles.zip"
+    session = FakeSession({})
+    with mock.patch.object(tentacles_installer.aiohttp, "ClientSession", mock.Mock()) as client_session_mock, \
+            mock.patch.object(tentacles_installer.aiohttp, "TCPConnector", mock.Mock()):
+        client_session_mock.return_value.__aenter__ = mock.AsyncMock(return_value=session)
+        client_session_mock.return_value.__aexit__ = mock.AsyncMock(return_value=False)
+        assert await tentacles_installer.fetch_archives([url, local], str(tmp_path)) == [None, local]
+        with mock.patch.object(tentacles_manager_api, "install_all_tentacles",
+                               mock.AsyncMock(return_value=0)) as install_all_tentacles_mock:
+            # failed downloads are counted as errors, other archives are still installed
+            assert await tentacles_installer.install_archives([url, local], "tentacles", "install") == 1
+            install_all_tentacles_mock.assert_awaited_once()
+            install_all_tentacles_mock.reset_mock()
+            # nothing to install
+            assert await tentacles_installer.install_archives([url], "tentacles", "install") == 1
+            install_all_tentacles_mock.assert_not_awaited()
+
+
+async def test_fetch_archives_from_cache(tmp_path):
+    cache_path = str(tmp_path / "cache")
+    url = "https://tentacles.test/tentacles.zip"
+    session = FakeSession({url: _create_archive(tmp_path / "source.zip", {"reference_tentacles/Trading/a.py": "a"})})
+    # not using cache: always download
+    archive = (await tentacles_installer.fetch_archives(
+        [url], str(tmp_path), aiohttp_session=session, cache_path=cache_path
+    ))[0]
+    assert session.max_running_downloads == 1
+    assert os.path.dirname(archive) == cache_path
+    assert os.path.basename(archive) == f"{tentacles_installer.get_archive_hash(archive)}.zip"
+    assert tentacles_installer.get_cached_archive(cache_path, url) == archive
+
+    # using cache: no network
+    with mock.patch.object(tentacles_installer.aiohttp, "ClientSession", mock.Mock()) as client_session_mock:
+        assert await tentacles_installer.fetch_archives([url], str(tmp_path), cache_path=cache_path,
+                                                        from_cache=True) == [archive]
+        client_session_mock.assert_not_called()
+
+    # altered cached archive: download it again
+    with open(archive, "ab") as archive_file:
+        archive_file.write(b"0")
+    assert tentacles_installer.get_cached_archive(cache_path, url) is None
+    session.max_running_downloads = 0
+    assert await tentacles_installer.fetch_archives(
+        [url], str(tmp_path), aiohttp_session=session, cache_path=cache_path, from_cache=True
+    ) == [archive]
+    assert session.max_running_downloads == 1
+    assert tentacles_installer.get_cached_archive(cache_path, url) == archive
+    assert _read_archive(archive) == {"reference_tentacles/Trading/a.py": "a"}
+
+
+async def test_prune_cache(tmp_path):
+    cache_path = str(tmp_path / "cache")
+    archives = {
+        f"https://tentacles.test/{index}.zip": tentacles_installer.cache_archive(
+            cache_path, f"https://tentacles.test/{index}.zip",
+            _create_archive(tmp_path / f"{index}.zip", {f"reference_tentacles/Trading/{index}.py": str(index)})
+        )
+        for index in range(3)
+    }
+    for index, archive in enumerate(archives.values()):
+        os.utime(archive, ns=(index * 1_000_000_000, index * 1_000_000_000))
+    # not indexed anymore
+    unused_archive = _create_archive(pathlib.Path(cache_path) / "unused.zip", {"reference_tentacles/a.py": "a"})
+    archive_size = os.path.getsize(archives["https://tentacles.test/0.zip"])
+
+    tentacles_installer.prune_cache(cache_path, archive_size * 3)
+    assert not os.path.exists(unused_archive)
+    assert all(os.path.isfile(archive) for archive in archives.values())
+
+    # least recently used archives are removed first
+    tentacles_installer.get_cached_archive(cache_path, "https://tentacles.test/0.zip")
+    tentacles_installer.prune_cache(cache_path, archive_size * 2)
+    assert not os.path.exists(archives["https://tentacles.test/1.zip"])
+    assert tentacles_installer.get_cached_archive(cache_path, "https://tentacles.test/1.zip") is None
+    assert tentacles_installer.get_cached_archive(cache_path, "https://tentacles.test/0.zip") \
+        == archives["https://tentacles.test/0.zip"]
+
+    # kept archives are not removed
+    tentacles_installer.prune_cache(cache_path, 0, [archives["https://tentacles.test/2.zip"]])
+    assert sorted(os.listdir(cache_path)) == sorted(
+        ["index.json", os.path.basename(archives["https://tentacles.test/2.zip"])]
+    )
@@ -0,0 +1,228 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import mock
+import pytest
+
+import octobot_script.resources as resources
+import octobot_script.internal.report_files as report_files
+import octobot_script.internal.chart_series as chart_series
+import octobot_script.internal.chart_lod as chart_lod
+import octobot_script.model.backtest_plot as backtest_plot
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def _fill(report_file, template_file, data, meta):
+    plot = backtest_plot.BacktestPlot(mock.Mock(), mock.Mock(), report_file=report_file)
+    with mock.patch.object(plot, "_get_template_data",
+                           mock.AsyncMock(return_value={"full_data": data, "meta": meta})), \
+         mock.patch.object(resources, "get_report_resource_path", mock.Mock(return_value=template_file)):
+        await plot.fill()
+
+
+def _load_json(file_path):
+    return json.loads(report_files.read_file(file_path))
+
+
+async def test_fill(tmp_path):
+    template_file = str(tmp_path / "index.html")
+    with open(template_file, "w") as template:
+        template.write("<html></html>")
+    report_dir = tmp_path / "backtesting_1"
+    report_dir.mkdir()
+    report_file = str(report_dir / backtest_plot.BacktestPlot.DEFAULT_REPORT_NAME)
+    # outdated data file
+    with open(report_dir / backtest_plot.BacktestPlot.REPORT_DATA_FILENAME, "w") as data_file:
+        data_file.write("{}")
+    with mock.patch.object(backtest_plot.time, "strftime", mock.Mock(return_value="20240101_000000")):
+        await _fill(report_file, template_file, {"data": {"sub_elements": [1]}}, {"title": "first"})
+    history_dir = report_dir / backtest_plot.BacktestPlot.HISTORY_DIR / "20240101_000000"
+    bundle_file = report_dir / backtest_plot.BacktestPlot.REPORT_BUNDLE_FILENAME
+    meta_file = report_dir / backtest_plot.BacktestPlot.REPORT_META_FILENAME
+    assert _load_json(bundle_file) == {"meta": {"title": "first"}, "data": {"data": {"sub_elements": [1]}}}
+    assert _load_json(meta_file) == {"title": "first"}
+    assert not os.path.exists(report_dir / backtest_plot.BacktestPlot.REPORT_DATA_FILENAME)
+    # the bundle is compressed
+    assert not os.path.exists(bundle_file)
+    assert report_files.find_file(str(bundle_file)) == (f"{bundle_file}.gz", report_files.GZIP)
+    # history entries are not copies
+    assert os.path.samefile(f"{bundle_file}.gz",
+                            history_dir / f"{backtest_plot.BacktestPlot.REPORT_BUNDLE_FILENAME}.gz")
+    assert os.path.samefile(meta_file, history_dir / backtest_plot.BacktestPlot.REPORT_META_FILENAME)
+
+    with mock.patch.object(backtest_plot.time, "strftime", mock.Mock(return_value="20240101_000001")):
+        await _fill(report_file, template_file, {"data": {"sub_elements": [2]}}, {"title": "second"})
+    assert _load_json(bundle_file)["meta"] == {"title": "second"}
+    # previous history entry is unchanged
+    assert _load_json(history_dir / backtest_plot.BacktestPlot.REPORT_BUNDLE_FILENAME) == \
+        {"meta": {"title": "first"}, "data": {"data": {"sub_elements": [1]}}}
+
+
+async def test_fill_without_compression(tmp_path):
+    template_file = str(tmp_path / "index.html")
+    with open(template_file, "w") as template:
+        template.write("<html></html>")
+    report_file = str(tmp_path / backtest_plot.BacktestPlot.DEFAULT_REPORT_NAME)
+    await _fill(report_file, template_file, {"data": {}}, {"title": "compressed"})
+    bundle_file = tmp_path / backtest_plot.BacktestPlot.REPORT_BUNDLE_FILENAME
+    with mock.patch.object(backtest_plot.BacktestPlot, "REPORT_COMPRESSION", None):
+        await _fill(report_file, template_file, {"data": {}}, {"title": "plain"})
+    # outdated compressed bundle is removed
+    assert report_files.find_file(str(bundle_file)) == (str(bundle_file), None)
+    assert _load_json(bundle_file)["meta"] == {"title": "plain"}
+
+
+async def test_fill_chart_series_encoding(tmp_path):
+    template_file = str(tmp_path / "index.html")
+    with open(template_file, "w") as template:
+        template.write("<html></html>")
+    report_file = str(tmp_path / backtest_plot.BacktestPlot.DEFAULT_REPORT_NAME)
+    bundle_file = tmp_path / backtest_plot.BacktestPlot.REPORT_BUNDLE_FILENAME
+
+    def _get_data():
+        return {"type": "chart", "data": {"sub_elements": [], "elements": [{"x": [1, 2], "close": [3.5, None]}]}}
+
+    await _fill(report_file, template_file, _get_data(), {"title": "encoded"})
+    element = _load_json(bundle_file)["data"]["data"]["elements"][0]
+    assert element["x"]["encoding"] == chart_series.BASE64
+    assert chart_series.decode_series(element["x"]).tolist() == [1, 2]
+    assert chart_series.decode_chart_series(_load_json(bundle_file)["data"]) == \
+        {"type": "chart", "data": {"sub_elements": [], "elements": [{"x": [1, 2], "close": [3.5, None]}]}}
+    with mock.patch.object(backtest_plot.BacktestPlot, "REPORT_SERIES_ENCODING", None):
+        await _fill(report_file, template_file, _get_data(), {"title": "plain"})
+    assert _load_json(bundle_file)["data"] == _get_data()
+
+
+async def test_fill_levels_of_detail(tmp_path):
+    template_file = str(tmp_path / "index.html")
+    with open(template_file, "w") as template:
+        template.write("<html></html>")
+    report_file = str(tmp_path / backtest_plot.BacktestPlot.DEFAULT_REPORT_NAME)
+    bundle_file = tmp_path / backtest_plot.BacktestPlot.REPORT_BUNDLE_FILENAME
+    series_file = str(tmp_path / backtest_plot.BacktestPlot.REPORT_SERIES_FILENAME)
+    elements = [{"x": list(range(100)), "y": list(range(100))}, {"x": [1, 2], "y": [1, 2]}]
+    with mock.patch.object(backtest_plot.BacktestPlot, "REPORT_SERIES_MAX_POINTS", 50), \
+         mock.patch.object(backtest_plot.time, "strftime", mock.Mock(return_value="20240101_000000")):
+        await _fill(report_file, template_file, {"type": "chart", "data": {"elements": elements}}, {})
+    line, small_line = _load_json(bundle_file)["data"]["data"]["elements"]
+    assert line["lod"] == {"id": "0", "levels": [1, 8], "length": 100, "max_points": 50}
+    assert len(chart_series.decode_series(line["y"])) == 13
+    assert "lod" not in small_line
+    assert os.path.samefile(series_file, tmp_path / backtest_plot.BacktestPlot.HISTORY_DIR / "20240101_000000" /
+                            backtest_plot.BacktestPlot.REPORT_SERIES_FILENAME)
+    factor, series = chart_lod.get_visible_range(series_file, "0", 10, 20, max_points=50)
+    assert factor == 1
+    assert series["y"].tolist() == list(range(9, 22))
+    # outdated levels are removed
+    with mock.patch.object(backtest_plot.BacktestPlot, "REPORT_SERIES_MAX_POINTS", None):
+        await _fill(report_file, template_file, {"type": "chart", "data": {"elements": elements}}, {})
+    assert not os.path.exists(series_file)
+
+
+async def test_extract_summary_metrics():
+    full_data = {"data": {"sub_elements": [{
+        "name": "backtesting-details",
+        "type": "value",
+        "data": {"elements": [{"title": "USDT gains", "value": "12%"}, {"title": "End portfolio", "value": 1200}]},
+    }]}}
+    assert backtest_plot.BacktestPlot._extract_summary_metrics(full_data) == {
+        "profitability": "12%",
+        "portfolio": "1200",
+        "metrics": {"USDT gains": "12%", "End portfolio": "1200"},
+    }
+
+
+class _DisplayedElements:
+    running = 0
+    max_running = 0
+
+    def __init__(self):
+        self.elements = []
+        self.nested_elements = {}
+
+    async def fill_from_database(self, trading_mode, run_db_identifier, exchange, symbol, time_frame, exchange_id,
+                                 with_inputs=True):
+        _DisplayedElements.running += 1
+        _DisplayedElements.max_running = max(_DisplayedElements.running, _DisplayedElements.max_running)
+        # later combinations finish first
+        await asyncio.sleep(0.01 if symbol == "BTC/USDT" else 0)
+        _DisplayedElements.running -= 1
+        with self.part("main-chart") as main_chart:
+            main_chart.elements.append(f"{exchange} {symbol} {time_frame}")
+        with self.part(f"{exchange} {symbol} {time_frame}") as combination_part:
+            combination_part.elements.append(time_frame)
+
+    @contextlib.contextmanager
+    def part(self, name):
+        # same as DisplayTranslator.part: replaces any existing part of the same name
+        element = _DisplayedElements()
+        self.nested_elements[name] = element
+        yield element
+
+    def add_parts_from_other(self, other):
+        self.nested_elements.update(other.nested_elements)
+
+    def to_json(self):
+        return {
+            "elements": self.elements,
+            "sub_elements": {key: element.to_json() for key, element in self.nested_elements.items()},
+        }
+
+
+async def test_get_full_data():
+    scripting_library = mock.Mock(default_backtesting_analysis_script=mock.AsyncMock(return_value=None))
+    tentacles = mock.Mock()
+    tentacles.Meta.Keywords.scripting_library = scripting_library
+    modules = {
+        "tentacles": tentacles,
+        "tentacles.Meta": tentacles.Meta,
+        "tentacles.Meta.Keywords": tentacles.Meta.Keywords,
+        "tentacles.Meta.Keywords.scripting_library": scripting_library,
+    }
+    symbols_by_exchanges = {"binance": ["BTC/USDT", "ETH/USDT", "SOL/USDT"], "kucoin": ["BTC/USDT"]}
+    config = {backtest_plot.commons_constants.CONFIG_TIME_FRAME: [mock.Mock(value="1h"), mock.Mock(value="4h")]}
+    plot = backtest_plot.BacktestPlot(mock.Mock(), mock.Mock())
+    with mock.patch.dict(sys.modules, modules), \
+         mock.patch.object(backtest_plot.display, "display_translator_factory", _DisplayedElements), \
+         mock.patch.object(backtest_plot.octobot_api, "get_independent_backtesting_symbols_by_exchanges",
+                           mock.Mock(return_value=symbols_by_exchanges)), \
+         mock.patch.object(backtest_plot.octobot_api, "get_independent_backtesting_config",
+                           mock.Mock(return_value=config)), \
+         mock.patch.object(plot, "ANALYSIS_CONCURRENCY", 3):
+        full_data, symbols, time_frames, exchanges = await plot._get_full_data()
+    assert exchanges == ["binance", "kucoin"]
+    assert symbols == ["BTC/USDT", "ETH/USDT", "SOL/USDT", "BTC/USDT"]
+    assert time_frames == ["1h", "4h"] * 4
+    # merged in backtesting order: same name parts are the ones of the last combination, as when filling
+    # a single display translator one combination after the other
+    assert full_data["elements"] == []
+    assert full_data["sub_elements"]["main-chart"] == {"elements": ["kucoin BTC/USDT 4h"], "sub_elements": {}}
+    assert list(full_data["sub_elements"]) == [
+        "main-chart",
+        "binance BTC/USDT 1h", "binance BTC/USDT 4h", "binance ETH/USDT 1h", "binance ETH/USDT 4h",
+        "binance SOL/USDT 1h", "binance SOL/USDT 4h", "kucoin BTC/USDT 1h", "kucoin BTC/USDT 4h",
+    ]
+    assert full_data["sub_elements"]["binance ETH/USDT 4h"] == {"elements": ["4h"], "sub_elements": {}}
+    assert _DisplayedElements.max_running == 3
+    assert scripting_library.default_backtesting_analysis_script.await_count == 8
@@ -0,0 +1,112 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import base64
+import gzip
+import http.client
+import json
+import socketserver
+import threading
+import pytest
+
+import octobot_script.internal.report_files as report_files
+import octobot_script.internal.chart_lod as chart_lod
+import octobot_script.internal.chart_series as chart_series
+import octobot_script.model.backtest_report_server as backtest_report_server
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def report_server(tmp_path):
+    report_dir = tmp_path / "backtesting_1"
+    history_dir = report_dir / "backtesting" / "20240101_000000"
+    history_dir.mkdir(parents=True)
+    for directory, title in ((report_dir, "current"), (history_dir, "history")):
+        report_files.write_json_parts(str(directory / "report_meta.json"), json.dumps({"title": title}).encode())
+        report_files.write_bundle(
+            str(directory / "report.json"), json.dumps({"title": title}).encode(), b"[1,2,3]",
+            compression=report_files.GZIP
+        )
+        chart_lod.write_levels(str(directory / "report_series.npz"), {
+            "0": chart_lod.get_levels({"x": list(range(100)), "y": list(range(100))}, max_points=10, level_factor=4)
+        })
+    server = backtest_report_server.BacktestReportServer(
+        report_file=str(report_dir / "report.html"), report_dir=str(report_dir), report_name="report.html",
+        runs_root_dir=str(tmp_path), server_host="localhost", server_port=0, serve_timeout=1,
+        history_dir="backtesting", data_filename="report_data.json", meta_filename="report_meta.json",
+        bundle_filename="report.json", series_filename="report_series.npz",
+    )
+    with socketserver.TCPServer(("localhost", 0), server._create_handler()) as httpd:
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield httpd.server_address[1], base64.urlsafe_b64encode(str(history_dir).encode()).decode().rstrip("=")
+        httpd.shutdown()
+
+
+def _get(port, path, headers=None):
+    connection = http.client.HTTPConnection("localhost", port)
+    connection.request("GET", path, headers=headers or {})
+    response = connection.getresponse()
+    return response.status, response.getheader("Content-Encoding"), response.read()
+
+
+async def test_serve_compressed_bundle(report_server):
+    port, run_id = report_server
+    status, encoding, body = _get(port, f"/history/{run_id}/report.json", {"Accept-Encoding": "gzip, deflate"})
+    assert (status, encoding) == (200, "gzip")
+    assert json.loads(gzip.decompress(body)) == {"meta": {"title": "history"}, "data": [1, 2, 3]}
+    status, encoding, body = _get(port, "/report.json", {"Accept-Encoding": "gzip"})
+    assert (status, encoding) == (200, "gzip")
+    assert json.loads(gzip.decompress(body))["meta"] == {"title": "current"}
+
+
+async def test_serve_decompressed_bundle(report_server):
+    port, run_id = report_server
+    for headers in ({}, {"Accept-Encoding": "br"}, {"Accept-Encoding": "gzip;q=0"}):
+        status, encoding, body = _get(port, f"/history/{run_id}/report.json", headers)
+        assert (status, encoding) == (200, None)
+        assert json.loads(body) == {"meta": {"title": "history"}, "data": [1, 2, 3]}
+    status, _, _ = _get(port, f"/history/{run_id}/report_data.json")
+    assert status == 404
+
+
+async def test_history(report_server):
+    port, run_id = report_server
+    status, _, body = _get(port, "/history.json")
+    assert status == 200
+    assert json.loads(body) == [{"id": run_id, "run_name": "backtesting_1", "title": "history"}]
+
+
+async def test_series(report_server):
+    port, run_id = report_server
+    for base in ("", f"/history/{run_id}"):
+        status, _, body = _get(port, f"{base}/series.json?element=0&start=0&end=99&points=10")
+        assert status == 200
+        series = json.loads(body)
+        assert (series["element"], series["factor"]) == ("0", 16)
+        x_values = chart_series.decode_series(series["x"]).tolist()
+        assert len(x_values) <= 10
+        assert (x_values[0], x_values[-1]) == (0, 99)
+        status, _, body = _get(port, f"{base}/series.json?element=0&start=40&end=45&points=10")
+        series = json.loads(body)
+        assert series["factor"] == 1
+        assert chart_series.decode_series(series["y"]).tolist() == list(range(39, 47))
+    assert _get(port, "/series.json?element=1&start=0&end=99")[0] == 404
+    assert _get(port, "/series.json?element=0&start=a&end=99")[0] == 400
+    assert _get(port, "/series.json?element=0")[0] == 400
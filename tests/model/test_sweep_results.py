@@ -0,0 +1,108 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import csv
+import numpy as np
+import pytest
+
+import octobot_script.model as models
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _metrics(profitability, max_drawdown, strategy_config):
+    return models.BacktestMetrics(
+        strategy_config, duration=1, candles_count=100, profitability=profitability,
+        market_average_profitability=2, end_portfolio_value=1000 + profitability * 10,
+        trades_count=3, max_drawdown=max_drawdown,
+    )
+
+
+def _sweep_results():
+    results = models.SweepResults()
+    results.extend([
+        _metrics(10, 5, {"period": 7, "thresholds": {"buy": 20, "sell": 80}}),
+        _metrics(-5, 12, {"period": 10, "thresholds": {"buy": 25, "sell": 75}}),
+        _metrics(30, 8, {"period": 14, "thresholds": {"buy": 30, "sell": 70}, "mode": "fast"}),
+        _metrics(20, 3, {"period": 21, "thresholds": {"buy": 35, "sell": 65}}),
+    ])
+    return results
+
+
+async def test_add():
+    results = _sweep_results()
+    assert len(results) == 4
+    assert results.columns == [
+        "duration", "candles_count", "profitability", "market_average_profitability", "end_portfolio_value",
+        "trades_count", "max_drawdown", "pruned", "config.period", "config.thresholds.buy", "config.thresholds.sell",
+        "config.mode",
+    ]
+    assert results["profitability"].dtype == np.float64
+    assert results["pruned"].tolist() == [False, False, False, False]
+    np.testing.assert_array_equal(results["config.period"], [7, 10, 14, 21])
+    # missing values
+    assert results["config.mode"].tolist() == [None, None, "fast", None]
+    results.add(_metrics(1, 1, {"period": "auto"}))
+    assert results["config.period"].tolist() == [7, 10, 14, 21, "auto"]
+    assert np.isnan(results["config.thresholds.buy"][-1])
+
+
+async def test_add_grows_columns():
+    results = models.SweepResults()
+    for index in range(models.sweep_results.INITIAL_CAPACITY * 2 + 1):
+        results.add(_metrics(index, 1, {"period": index}))
+    assert len(results) == models.sweep_results.INITIAL_CAPACITY * 2 + 1
+    np.testing.assert_array_equal(results["config.period"], np.arange(len(results)))
+
+
+async def test_filter_sort_and_top():
+    results = _sweep_results()
+    filtered = results.filter(results["max_drawdown"] < 10)
+    assert filtered["config.period"].tolist() == [7, 14, 21]
+    assert results.sort("max_drawdown")["config.period"].tolist() == [21, 7, 14, 10]
+    assert results.sort("profitability", ascending=False)["config.period"].tolist() == [14, 21, 7, 10]
+    assert results.top(2, "profitability")["config.period"].tolist() == [14, 21]
+    assert results.top(2, "max_drawdown", ascending=True)["profitability"].tolist() == [20, 10]
+    assert results.top(10, "profitability")["config.period"].tolist() == [14, 21, 7, 10]
+    # filtered results can still be extended
+    filtered.add(_metrics(50, 1, {"period": 50}))
+    assert filtered.top(1, "profitability")["config.period"].tolist() == [50]
+
+
+async def test_to_csv(tmp_path):
+    file_path = tmp_path / "results.csv"
+    _sweep_results().top(2, "profitability").to_csv(file_path)
+    with open(file_path, newline="") as csv_file:
+        rows = list(csv.DictReader(csv_file))
+    assert [row["config.period"] for row in rows] == ["14.0", "21.0"]
+    assert [row["config.mode"] for row in rows] == ["fast", ""]
+
+
+async def test_to_parquet(tmp_path):
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+    file_path = tmp_path / "results.parquet"
+    _sweep_results().to_parquet(file_path)
+    table = pyarrow_parquet.read_table(file_path)
+    assert table.column("config.period").to_pylist() == [7, 10, 14, 21]
+    assert table.column("config.mode").to_pylist() == [None, None, "fast", None]
+
+    # mixed value types
+    results = models.SweepResults()
+    results.extend([_metrics(10, 5, {"name": 1}), _metrics(10, 5, {"name": "a"}), _metrics(10, 5, {})])
+    results.to_parquet(file_path)
+    assert pyarrow_parquet.read_table(file_path).column("config.name").to_pylist() == ["1.0", "a", None]
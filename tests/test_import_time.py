@@ -0,0 +1,71 @@
+#  This file is part of OctoBot-Script (https://github.com/Drakkar-Software/OctoBot-Script)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot-Script. If not, see <https://www.gnu.org/licenses/>.
+
+import subprocess
+import sys
+
+
+# budgets are relative to reference imports measured in the same test run, not to wall-clock durations
+# which depend on the test machine:
+# "import octobot_script" should be faster than "import asyncio"
+IMPORT_TIME_REFERENCE_MODULE = "asyncio"
+HEAVY_MODULES = ("tentacles", "octobot", "octobot_trading", "octobot_backtesting", "octobot_services")
+LOADED_MODULES_PREFIX = "loaded heavy modules: "
+
+
+def _run_python(*args):
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True)
+
+
+def _get_cumulative_import_time(module):
+    result = _run_python("-X", "importtime", "-c", f"import {module}")
+    # import time: self [us] | cumulative | imported package
+    return next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.split("|")[-1].strip() == module
+    )
+
+
+def _get_loaded_heavy_modules(code):
+    result = _run_python(
+        "-c",
+        "import sys\n"
+        f"{code}\n"
+        f"print('{LOADED_MODULES_PREFIX}' + ','.join(module for module in {HEAVY_MODULES!r} if module in sys.modules))"
+    )
+    # code output (ex: the CLI version) is printed before loaded modules
+    return result.stdout.splitlines()[-1].removeprefix(LOADED_MODULES_PREFIX)
+
+
+def test_import_does_not_load_heavy_modules():
+    assert _get_loaded_heavy_modules("import octobot_script") == ""
+
+
+def test_import_time_budget():
+    assert _get_cumulative_import_time("octobot_script") \
+        < _get_cumulative_import_time(IMPORT_TIME_REFERENCE_MODULE)
+
+
+def test_cli_startup_does_not_load_heavy_modules():
+    # checks what "octobot_script --version" loads instead of timing it: durations depend on the test machine
+    assert _get_loaded_heavy_modules(
+        "import octobot_script.cli\n"
+        "try:\n"
+        "    octobot_script.cli.main(['--version'])\n"
+        "except SystemExit:\n"
+        "    pass"
+    ) == ""